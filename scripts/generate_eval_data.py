@@ -8,19 +8,30 @@ Usage:
     python scripts/generate_eval_data.py
 
 Requires RAG_GOOGLE_API_KEY in .env or environment.
+
+Responses are cached in .cache/gemini/ keyed by model, prompt and response
+schema, so re-running with unchanged prompts makes no API calls. Delete
+that directory to force regeneration.
 """
 
 from __future__ import annotations
 
 import asyncio
+import functools
+import hashlib
 import json
 import sys
 from pathlib import Path
 
+import httpx
+import orjson
+from tenacity import retry, retry_if_exception_type, stop_after_attempt, wait_random_exponential
+
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
 from google import genai
-from google.genai import types
+from google.genai import errors, types
+from pydantic import BaseModel
 from rag_engine.config.settings import Settings
 
 # ── Seed document content (same as scripts/seed_data.py) ──────────────────
@@ -73,6 +84,9 @@ A typical RAG system includes:
 """,
 }
 
+# Seed documents joined once for embedding in prompts
+SEED_DOCS_TEXT = "\n\n---\n\n".join(SEED_DOCS.values())
+
 # ── Domains for unanswerable question generation ──────────────────────────
 
 UNANSWERABLE_DOMAINS = [
@@ -93,6 +107,41 @@ UNANSWERABLE_DOMAINS = [
     "agriculture and farming",
 ]
 
+# Max in-flight Gemini requests; keeps concurrent generation under rate limits
+GEMINI_CONCURRENCY = 5
+_gemini_semaphore = asyncio.Semaphore(GEMINI_CONCURRENCY)
+
+# Connection pool size for the shared HTTP client behind the Gemini SDK
+GEMINI_MAX_CONNECTIONS = 20
+
+# On-disk cache of structured Gemini responses
+CACHE_DIR = Path(__file__).parent.parent / ".cache" / "gemini"
+
+# ── Response schemas ──────────────────────────────────────────────────────
+
+
+class AnswerableItem(BaseModel):
+    query: str
+    expected_answer_contains: list[str]
+
+
+class UnanswerableItem(BaseModel):
+    query: str
+    domain: str
+
+
+class AdversarialItem(BaseModel):
+    query: str
+    why_adversarial: str
+
+
+class GeneratedItems(BaseModel):
+    factual: list[AnswerableItem]
+    multi_hop: list[AnswerableItem]
+    unanswerable: list[UnanswerableItem]
+    adversarial: list[AdversarialItem]
+
+
 # ── Prompts ───────────────────────────────────────────────────────────────
 
 FACTUAL_PROMPT = """You are generating evaluation test cases for a RAG system. The RAG system's knowledge base contains ONLY the following documents. Generate questions that CAN be answered from this content.
@@ -175,86 +224,134 @@ Return valid JSON — an array of objects:
 
 Return ONLY the JSON array, no other text."""
 
+COMBINED_PROMPT = """You are generating evaluation test cases for a RAG system. Complete ALL FOUR tasks below in a single response.
+
+Return a single JSON object with exactly these keys, each holding the JSON array requested by the matching task:
+- "factual": TASK 1
+- "multi_hop": TASK 2
+- "unanswerable": TASK 3
+- "adversarial": TASK 4
+
+=== TASK 1 ===
+{factual}
+
+=== TASK 2 ===
+{multi_hop}
 
-async def generate_with_gemini(client: genai.Client, model: str, prompt: str) -> str:
-    """Call Gemini and return the text response."""
+=== TASK 3 ===
+{unanswerable}
+
+=== TASK 4 ===
+{adversarial}
+
+Return ONLY the JSON object, no other text."""
+
+
+def disk_cached(fn):
+    """Cache structured Gemini responses in CACHE_DIR, keyed by model, prompt and schema."""
+
+    @functools.wraps(fn)
+    async def wrapper(
+        client: genai.Client, model: str, prompt: str, response_schema: type[BaseModel]
+    ) -> BaseModel:
+        schema = json.dumps(response_schema.model_json_schema(), sort_keys=True)
+        key = hashlib.sha256(f"{model}|{schema}|{prompt}".encode()).hexdigest()
+        cache_file = CACHE_DIR / f"{key}.json"
+        if cache_file.exists():
+            return response_schema.model_validate_json(cache_file.read_text())
+
+        result = await fn(client, model, prompt, response_schema)
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        cache_file.write_text(result.model_dump_json())
+        return result
+
+    return wrapper
+
+
+@disk_cached
+@retry(
+    stop=stop_after_attempt(5),
+    wait=wait_random_exponential(multiplier=1, max=30),
+    retry=retry_if_exception_type((errors.APIError, httpx.TransportError, TimeoutError)),
+    reraise=True,
+)
+async def generate_with_gemini(
+    client: genai.Client, model: str, prompt: str, response_schema: type[BaseModel]
+) -> BaseModel:
+    """Call Gemini with structured output and return the parsed response."""
     config = types.GenerateContentConfig(
         temperature=0.3,
         max_output_tokens=8192,
+        response_mime_type="application/json",
+        response_schema=response_schema,
     )
-    response = await client.aio.models.generate_content(
-        model=model, contents=prompt, config=config
+    async with _gemini_semaphore:
+        response = await client.aio.models.generate_content(
+            model=model, contents=prompt, config=config
+        )
+    if response.parsed is None:
+        raise ValueError(f"Gemini did not return a valid {response_schema.__name__}")
+    return response.parsed
+
+
+async def generate_all(
+    client: genai.Client,
+    model: str,
+    factual_count: int = 20,
+    multi_hop_count: int = 10,
+    unanswerable_count: int = 15,
+    adversarial_count: int = 15,
+) -> GeneratedItems:
+    """Generate all four question categories with a single Gemini request."""
+    domains = UNANSWERABLE_DOMAINS[:unanswerable_count]
+    prompt = COMBINED_PROMPT.format(
+        factual=FACTUAL_PROMPT.format(documents=SEED_DOCS_TEXT, count=factual_count),
+        multi_hop=MULTI_HOP_PROMPT.format(documents=SEED_DOCS_TEXT, count=multi_hop_count),
+        unanswerable=UNANSWERABLE_PROMPT.format(count=len(domains), domains=", ".join(domains)),
+        adversarial=ADVERSARIAL_PROMPT.format(count=adversarial_count),
     )
-    return response.text or ""
+    return await generate_with_gemini(client, model, prompt, GeneratedItems)
 
 
-def parse_json_response(text: str) -> list[dict]:
-    """Extract JSON array from Gemini response, handling markdown fences."""
-    text = text.strip()
-    if text.startswith("```"):
-        # Strip markdown code fences
-        lines = text.split("\n")
-        lines = [l for l in lines if not l.strip().startswith("```")]
-        text = "\n".join(lines)
-    return json.loads(text)
-
-
-async def generate_factual(client: genai.Client, model: str, count: int = 20) -> list[dict]:
-    """Generate factual questions from seed documents."""
-    docs_text = "\n\n---\n\n".join(SEED_DOCS.values())
-    prompt = FACTUAL_PROMPT.format(documents=docs_text, count=count)
-    raw = await generate_with_gemini(client, model, prompt)
-    items = parse_json_response(raw)
-
+def build_factual_cases(items: list[AnswerableItem], count: int = 20) -> list[dict]:
+    """Build factual cases from generated items."""
     cases = []
     for i, item in enumerate(items[:count], 1):
         cases.append({
             "id": f"factual_{i:02d}",
-            "query": item["query"],
+            "query": item.query,
             "mode": "normal",
             "expected_decision": "answer",
             "acceptable_decisions": ["answer"],
-            "expected_answer_contains": item["expected_answer_contains"],
+            "expected_answer_contains": item.expected_answer_contains,
             "category": "factual",
         })
     return cases
 
 
-async def generate_multi_hop(client: genai.Client, model: str, count: int = 10) -> list[dict]:
-    """Generate multi-hop questions requiring synthesis across sections."""
-    docs_text = "\n\n---\n\n".join(SEED_DOCS.values())
-    prompt = MULTI_HOP_PROMPT.format(documents=docs_text, count=count)
-    raw = await generate_with_gemini(client, model, prompt)
-    items = parse_json_response(raw)
-
+def build_multi_hop_cases(items: list[AnswerableItem], count: int = 10) -> list[dict]:
+    """Build multi-hop cases requiring synthesis across sections."""
     cases = []
     for i, item in enumerate(items[:count], 1):
         cases.append({
             "id": f"multi_hop_{i:02d}",
-            "query": item["query"],
+            "query": item.query,
             "mode": "normal",
             "expected_decision": "answer",
             "acceptable_decisions": ["answer"],
-            "expected_answer_contains": item["expected_answer_contains"],
+            "expected_answer_contains": item.expected_answer_contains,
             "category": "multi-hop",
         })
     return cases
 
 
-async def generate_unanswerable(
-    client: genai.Client, model: str, count: int = 15
-) -> list[dict]:
-    """Generate unanswerable questions across diverse domains."""
-    domains = UNANSWERABLE_DOMAINS[:count]
-    prompt = UNANSWERABLE_PROMPT.format(count=len(domains), domains=", ".join(domains))
-    raw = await generate_with_gemini(client, model, prompt)
-    items = parse_json_response(raw)
-
+def build_unanswerable_cases(items: list[UnanswerableItem], count: int = 15) -> list[dict]:
+    """Build unanswerable cases across diverse domains."""
     cases = []
     for i, item in enumerate(items[:count], 1):
         cases.append({
             "id": f"unanswerable_{i:02d}",
-            "query": item["query"],
+            "query": item.query,
             "mode": "normal",
             "expected_decision": "abstain",
             "acceptable_decisions": ["abstain"],
@@ -264,19 +361,13 @@ async def generate_unanswerable(
     return cases
 
 
-async def generate_adversarial(
-    client: genai.Client, model: str, count: int = 15
-) -> list[dict]:
-    """Generate adversarial near-miss questions about related but uncovered topics."""
-    prompt = ADVERSARIAL_PROMPT.format(count=count)
-    raw = await generate_with_gemini(client, model, prompt)
-    items = parse_json_response(raw)
-
+def build_adversarial_cases(items: list[AdversarialItem], count: int = 15) -> list[dict]:
+    """Build adversarial near-miss cases about related but uncovered topics."""
     cases = []
     for i, item in enumerate(items[:count], 1):
         cases.append({
             "id": f"adversarial_{i:02d}",
-            "query": item["query"],
+            "query": item.query,
             "mode": "normal",
             "expected_decision": "abstain",
             "acceptable_decisions": ["abstain", "clarify"],
@@ -320,28 +411,32 @@ def generate_strict_unanswerable(unanswerable_cases: list[dict], count: int = 5)
 
 async def main() -> None:
     settings = Settings()
-    client = genai.Client(api_key=settings.google_api_key)
     model = settings.gemini_model
 
     print("Generating evaluation dataset using Gemini...\n")
 
-    # Layer 1: Answerable questions from seed docs
-    print("  [1/4] Generating factual questions (20)...")
-    factual = await generate_factual(client, model, count=20)
+    # Share one pooled HTTP client across all Gemini calls so
+    # requests reuse warm connections instead of handshaking per call.
+    async with httpx.AsyncClient(
+        limits=httpx.Limits(max_connections=GEMINI_MAX_CONNECTIONS)
+    ) as http_client:
+        client = genai.Client(
+            api_key=settings.google_api_key,
+            http_options=types.HttpOptions(httpx_async_client=http_client),
+        )
+
+        # Layers 1-3 in one request: answerable (factual + multi-hop),
+        # unanswerable, and adversarial near-miss questions
+        print("  Generating factual (20), multi-hop (10), unanswerable (15), adversarial (15)...")
+        generated = await generate_all(client, model)
+
+    factual = build_factual_cases(generated.factual, count=20)
+    multi_hop = build_multi_hop_cases(generated.multi_hop, count=10)
+    unanswerable = build_unanswerable_cases(generated.unanswerable, count=15)
+    adversarial = build_adversarial_cases(generated.adversarial, count=15)
     print(f"         Got {len(factual)} factual cases")
-
-    print("  [2/4] Generating multi-hop questions (10)...")
-    multi_hop = await generate_multi_hop(client, model, count=10)
     print(f"         Got {len(multi_hop)} multi-hop cases")
-
-    # Layer 2: Unanswerable questions across diverse domains
-    print("  [3/4] Generating unanswerable questions (15)...")
-    unanswerable = await generate_unanswerable(client, model, count=15)
     print(f"         Got {len(unanswerable)} unanswerable cases")
-
-    # Layer 3: Adversarial near-miss questions
-    print("  [4/4] Generating adversarial questions (15)...")
-    adversarial = await generate_adversarial(client, model, count=15)
     print(f"         Got {len(adversarial)} adversarial cases")
 
     # Strict-mode variants (mix of answerable + unanswerable)
@@ -357,8 +452,7 @@ async def main() -> None:
 
     # Write output
     output_path = Path(__file__).parent.parent / "tests" / "fixtures" / "eval_dataset.json"
-    with open(output_path, "w") as f:
-        json.dump(dataset, f, indent=2)
+    output_path.write_bytes(orjson.dumps(dataset, option=orjson.OPT_INDENT_2))
 
     print(f"\n{'=' * 50}")
     print(f"  DATASET GENERATED: {len(dataset)} total cases")
@@ -13,9 +13,48 @@ sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 from rag_engine.config.settings import Settings
 from rag_engine.embeddings.openai_embedder import OpenAIEmbedder
 from rag_engine.keyword_search.bm25_index import BM25Index
+from rag_engine.models.domain import Chunk
 from rag_engine.storage.sqlite_doc_store import SQLiteDocStore
 from rag_engine.vectorstore.faiss_store import FAISSVectorStore
 
+# Chunks per embed_texts call, and how many calls may be in flight at once.
+# The embedder further splits each call into concurrent API requests.
+EMBED_BATCH_SIZE = 256
+MAX_INFLIGHT_BATCHES = 8
+
+
+def build_bm25(bm25_index: BM25Index, chunks: list[Chunk]) -> None:
+    """Build and persist the BM25 index (CPU-bound; run in a thread)."""
+    bm25_index.build(chunks)
+    bm25_index.save()
+    print(f"BM25 index built: {bm25_index.size} entries")
+
+
+async def build_faiss(
+    embedder: OpenAIEmbedder, vector_store: FAISSVectorStore, chunks: list[Chunk]
+) -> None:
+    """Embed chunks in bounded concurrent batches and persist the FAISS index."""
+    # Each batch is added to FAISS as soon as it arrives, so peak memory is
+    # O(batch) rather than O(corpus).
+    semaphore = asyncio.Semaphore(MAX_INFLIGHT_BATCHES)
+
+    async def embed_batch(batch: list[Chunk]) -> tuple[list[str], np.ndarray]:
+        async with semaphore:
+            embeddings = await embedder.embed_texts([c.text for c in batch])
+        return [c.chunk_id for c in batch], embeddings
+
+    tasks = [
+        asyncio.create_task(embed_batch(chunks[i : i + EMBED_BATCH_SIZE]))
+        for i in range(0, len(chunks), EMBED_BATCH_SIZE)
+    ]
+    # FAISS add/save are blocking C calls; run them in a thread so pending
+    # embedding batches keep making progress meanwhile.
+    for next_batch in asyncio.as_completed(tasks):
+        chunk_ids, emb_array = await next_batch
+        await asyncio.to_thread(vector_store.add, chunk_ids, emb_array)
+    await asyncio.to_thread(vector_store.save)
+    print(f"FAISS index built: {vector_store.size} vectors")
+
 
 async def main():
     settings = Settings()
@@ -24,38 +63,31 @@ async def main():
     await doc_store.initialize()
 
     all_chunks = await doc_store.get_all_chunks()
+    await doc_store.close()
     print(f"Found {len(all_chunks)} chunks in doc store")
 
     if not all_chunks:
         print("No chunks to index.")
         return
 
-    # Rebuild BM25
-    print("Rebuilding BM25 index...")
     bm25_index = BM25Index(index_path=settings.bm25_index_path)
-    bm25_index.build(all_chunks)
-    bm25_index.save()
-    print(f"BM25 index built: {bm25_index.size} entries")
-
-    # Rebuild FAISS
-    print("Rebuilding FAISS index...")
     embedder = OpenAIEmbedder(
         api_key=settings.openai_api_key,
         model=settings.embedding_model,
+        max_concurrency=settings.embedding_max_concurrency,
     )
     vector_store = FAISSVectorStore(
         dimensions=settings.embedding_dimensions,
         index_path=settings.faiss_index_path,
     )
 
-    texts = [c.text for c in all_chunks]
-    chunk_ids = [c.chunk_id for c in all_chunks]
-
-    embeddings = await embedder.embed_texts(texts)
-    emb_array = np.array(embeddings, dtype=np.float32)
-    vector_store.add(chunk_ids, emb_array)
-    vector_store.save()
-    print(f"FAISS index built: {vector_store.size} vectors")
+    # BM25 is CPU-only while FAISS mostly waits on the embedding API, so the
+    # two rebuilds overlap.
+    print("Rebuilding BM25 and FAISS indexes...")
+    await asyncio.gather(
+        asyncio.to_thread(build_bm25, bm25_index, all_chunks),
+        build_faiss(embedder, vector_store, all_chunks),
+    )
 
     print("Done!")
 
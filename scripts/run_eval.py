@@ -3,18 +3,18 @@
 Usage:
     1. Start the server:   python -m rag_engine.main
     2. Seed data:          python scripts/seed_data.py
-    3. Run evaluation:     python scripts/run_eval.py [--base-url URL] [--output PATH]
+    3. Run evaluation:     python scripts/run_eval.py [--base-url URL] [--concurrency N] [--output PATH]
 """
 
 from __future__ import annotations
 
 import argparse
 import asyncio
-import json
 import sys
-from dataclasses import asdict
 from pathlib import Path
 
+import orjson
+
 # Add src to path (matching seed_data.py pattern)
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
@@ -24,7 +24,12 @@ from rag_engine.evaluation.metrics import (
     compute_category_metrics,
     compute_metrics,
 )
-from rag_engine.evaluation.runner import DEFAULT_BASE_URL, run_evaluation
+from rag_engine.evaluation.runner import (
+    DEFAULT_BASE_URL,
+    DEFAULT_CONCURRENCY,
+    create_client,
+    run_evaluation,
+)
 
 
 def print_header(title: str) -> None:
@@ -104,22 +109,29 @@ def print_case_details(results: list[EvalCaseResult]) -> None:
             print(f"         error: {r.error}")
 
 
-def save_results(results: list[EvalCaseResult], metrics: dict, output_path: Path) -> None:
+async def save_results(results: list[EvalCaseResult], metrics: dict, output_path: Path) -> None:
     output_path.parent.mkdir(parents=True, exist_ok=True)
-    payload = {
-        "metrics": metrics,
-        "results": [asdict(r) for r in results],
-    }
-    with open(output_path, "w") as f:
-        json.dump(payload, f, indent=2, default=str)
+    # orjson serializes the EvalCaseResult dataclasses natively
+    payload = {"metrics": metrics, "results": results}
+
+    def write() -> None:
+        output_path.write_bytes(orjson.dumps(payload, option=orjson.OPT_INDENT_2, default=str))
+
+    # Serializing a large run is CPU-bound; keep it off the event loop
+    await asyncio.to_thread(write)
     print(f"\nRaw results saved to {output_path}")
 
 
-async def main(base_url: str, output_path: Path) -> None:
+async def main(base_url: str, output_path: Path, concurrency: int) -> None:
     print(f"Running evaluation against {base_url} ...")
     print(f"Dataset: tests/fixtures/eval_dataset.json")
 
-    results = await run_evaluation(base_url=base_url)
+    # Results are streamed here as cases complete; an interrupted run resumes from it
+    checkpoint_path = output_path.with_suffix(".jsonl")
+    async with create_client(base_url, concurrency=concurrency) as client:
+        results = await run_evaluation(
+            client=client, concurrency=concurrency, checkpoint_path=checkpoint_path
+        )
 
     metrics = compute_metrics(results)
     confusion = build_confusion_matrix(results)
@@ -134,7 +146,8 @@ async def main(base_url: str, output_path: Path) -> None:
     print_confusion_matrix(confusion)
     print_case_details(results)
 
-    save_results(results, metrics, output_path)
+    await save_results(results, metrics, output_path)
+    checkpoint_path.unlink(missing_ok=True)
 
 
 if __name__ == "__main__":
@@ -144,10 +157,16 @@ if __name__ == "__main__":
         default=DEFAULT_BASE_URL,
         help=f"Base URL of the running server (default: {DEFAULT_BASE_URL})",
     )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=DEFAULT_CONCURRENCY,
+        help=f"Max evaluation cases in flight at once (default: {DEFAULT_CONCURRENCY})",
+    )
     parser.add_argument(
         "--output",
         default="data/eval_results.json",
         help="Path to save raw results JSON (default: data/eval_results.json)",
     )
     args = parser.parse_args()
-    asyncio.run(main(args.base_url, Path(args.output)))
+    asyncio.run(main(args.base_url, Path(args.output), args.concurrency))
@@ -4,7 +4,6 @@ from __future__ import annotations
 
 import asyncio
 import sys
-import tempfile
 from pathlib import Path
 
 # Add src to path
@@ -86,6 +85,7 @@ async def main():
     embedder = OpenAIEmbedder(
         api_key=settings.openai_api_key,
         model=settings.embedding_model,
+        max_concurrency=settings.embedding_max_concurrency,
     )
 
     vector_store = FAISSVectorStore(
@@ -94,6 +94,10 @@ async def main():
     )
 
     bm25_index = BM25Index(index_path=settings.bm25_index_path)
+    # New chunks are only added incrementally; an empty or unreadable index must
+    # first be rebuilt from the stored chunks, or their keyword entries are lost
+    if bm25_index.size == 0 and await doc_store.count_chunks() > 0:
+        await bm25_index.rebuild(await doc_store.get_all_chunks())
 
     chunker = StructureChunker(
         max_tokens=settings.chunk_max_tokens,
@@ -107,21 +111,27 @@ async def main():
         vector_store=vector_store,
         bm25_index=bm25_index,
         doc_store=doc_store,
+        quality_checks=settings.ingest_quality_checks,
     )
 
-    for doc in SAMPLE_DOCS:
-        # Write to temp file
-        tmp = Path(tempfile.mktemp(suffix=".md"))
-        tmp.write_text(doc["content"])
-        try:
-            result = await pipeline.ingest_file(str(tmp), {"title": doc["filename"]})
-            print(f"Ingested {doc['filename']}: {result.chunks_created} chunks")
-        finally:
-            tmp.unlink(missing_ok=True)
+    # Ingest in memory and concurrently; each document is dominated by its embedding call
+    results = await asyncio.gather(
+        *(
+            pipeline.ingest_bytes(
+                doc["content"].encode("utf-8"), doc["filename"], {"title": doc["filename"]}
+            )
+            for doc in SAMPLE_DOCS
+        )
+    )
+    # The three ingests schedule one shared index save; write it before exiting
+    await pipeline.flush()
+    for doc, result in zip(SAMPLE_DOCS, results):
+        print(f"Ingested {doc['filename']}: {result.chunks_created} chunks")
 
     print(f"\nTotal documents: {await doc_store.count_documents()}")
     print(f"Total chunks: {await doc_store.count_chunks()}")
     print(f"Vector index size: {vector_store.size}")
+    await doc_store.close()
 
 
 if __name__ == "__main__":
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 from contextlib import asynccontextmanager
 from pathlib import Path
 
@@ -16,6 +17,7 @@ from rag_engine.chunking.structure_chunker import StructureChunker
 from rag_engine.config.settings import Settings
 from rag_engine.embeddings.cache import EmbeddingCache
 from rag_engine.embeddings.cached_embedder import CachedEmbedder
+from rag_engine.embeddings.coalescer import EmbeddingCoalescer
 from rag_engine.embeddings.openai_embedder import OpenAIEmbedder
 from rag_engine.generation.answer_generator import AnswerGenerator
 from rag_engine.generation.gemini_provider import GeminiProvider
@@ -47,6 +49,23 @@ async def lifespan(app: FastAPI):
     settings = Settings()
     setup_logging()
 
+    # Model and tokenizer loads are slow and blocking; start them in threads now
+    # and await them only where they are wired in.
+    reranker_task = asyncio.create_task(
+        asyncio.to_thread(
+            CrossEncoderReranker,
+            model_name=settings.cross_encoder_model,
+            batch_size=settings.rerank_batch_size,
+        )
+    )
+    chunker_task = asyncio.create_task(
+        asyncio.to_thread(
+            StructureChunker,
+            max_tokens=settings.chunk_max_tokens,
+            overlap_pct=settings.chunk_overlap_pct,
+        )
+    )
+
     # Ensure data directories exist
     for path in [
         settings.sqlite_doc_db_path,
@@ -55,22 +74,30 @@ async def lifespan(app: FastAPI):
     ]:
         Path(path).parent.mkdir(parents=True, exist_ok=True)
 
-    # Storage
+    # Storage (the three SQLite databases are independent, so open them concurrently)
     doc_store = SQLiteDocStore(settings.sqlite_doc_db_path)
-    await doc_store.initialize()
     trace_store = SQLiteTraceStore(settings.sqlite_trace_db_path)
-    await trace_store.initialize()
+    embedding_cache = EmbeddingCache(settings.embedding_cache_db_path)
+    await asyncio.gather(
+        doc_store.initialize(),
+        trace_store.initialize(),
+        embedding_cache.initialize(),
+    )
 
-    # Embedding (with cache)
+    # Embedding (with cache; cache misses from concurrent requests share API batches)
     raw_embedder = OpenAIEmbedder(
         api_key=settings.openai_api_key,
         model=settings.embedding_model,
         batch_size=settings.embedding_batch_size,
+        max_concurrency=settings.embedding_max_concurrency,
         _dimensions=settings.embedding_dimensions,
     )
-    embedding_cache = EmbeddingCache(settings.embedding_cache_db_path)
-    await embedding_cache.initialize()
-    embedder = CachedEmbedder(delegate=raw_embedder, cache=embedding_cache)
+    coalescer = EmbeddingCoalescer(
+        delegate=raw_embedder,
+        max_batch_size=settings.embedding_batch_size,
+        max_wait_ms=settings.embedding_coalesce_wait_ms,
+    )
+    embedder = CachedEmbedder(delegate=coalescer, cache=embedding_cache)
 
     # Vector store
     vector_store = FAISSVectorStore(
@@ -80,23 +107,34 @@ async def lifespan(app: FastAPI):
 
     # BM25 index
     bm25_index = BM25Index(index_path=settings.bm25_index_path)
-    if bm25_index.size == 0:
+    bm25_ready = asyncio.Event()
+
+    async def rebuild_bm25() -> None:
         # Rebuild from doc store if not loaded from disk
-        all_chunks = await doc_store.get_all_chunks()
-        if all_chunks:
-            bm25_index.build(all_chunks)
+        try:
+            all_chunks = await doc_store.get_all_chunks()
+            if all_chunks:
+                await asyncio.to_thread(bm25_index.build, all_chunks)
+                bm25_index.schedule_save()
+                logger.info("bm25_rebuilt", entries=bm25_index.size)
+        finally:
+            bm25_ready.set()
+
+    # A large rebuild runs in the background; /health reports degraded until it is done
+    bm25_task = None
+    if bm25_index.size == 0:
+        bm25_task = asyncio.create_task(rebuild_bm25())
+    else:
+        bm25_ready.set()
 
     # LLM
     llm = GeminiProvider(api_key=settings.google_api_key, model=settings.gemini_model)
 
     # Reranker
-    reranker = CrossEncoderReranker(model_name=settings.cross_encoder_model)
+    reranker = await reranker_task
 
     # Chunker
-    chunker = StructureChunker(
-        max_tokens=settings.chunk_max_tokens,
-        overlap_pct=settings.chunk_overlap_pct,
-    )
+    chunker = await chunker_task
 
     # Retrieval
     hybrid_retriever = HybridRetrieverImpl(
@@ -141,6 +179,7 @@ async def lifespan(app: FastAPI):
         vector_store=vector_store,
         bm25_index=bm25_index,
         doc_store=doc_store,
+        quality_checks=settings.ingest_quality_checks,
     )
 
     # Query pipeline
@@ -167,19 +206,27 @@ async def lifespan(app: FastAPI):
     app.state.doc_store = doc_store
     app.state.vector_store = vector_store
     app.state.settings = settings
+    app.state.bm25_ready = bm25_ready
 
+    docs, chunks = await asyncio.gather(doc_store.count_documents(), doc_store.count_chunks())
     logger.info(
         "startup_complete",
-        docs=await doc_store.count_documents(),
-        chunks=await doc_store.count_chunks(),
+        docs=docs,
+        chunks=chunks,
         index_size=vector_store.size,
     )
 
     yield
 
-    # Shutdown: persist indexes
-    vector_store.save()
-    bm25_index.save()
+    # Shutdown: persist indexes and close the database connections
+    if bm25_task is not None and not bm25_task.done():
+        bm25_task.cancel()
+        await asyncio.gather(bm25_task, return_exceptions=True)
+    await ingest_pipeline.flush()
+    await query_pipeline.close()
+    await embedder.close()
+    await coalescer.close()
+    await asyncio.gather(doc_store.close(), trace_store.close(), embedding_cache.close())
     logger.info("shutdown_complete")
 
 
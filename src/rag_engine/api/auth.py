@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import hashlib
 import time
 
 import jwt
@@ -17,6 +18,12 @@ logger = get_logger("auth")
 router = APIRouter(prefix="/auth", tags=["auth"])
 security = HTTPBearer()
 
+# Verified token payloads keyed by a digest of (secret, algorithm, token).
+# Entries live until the token's exp claim, capped at _TOKEN_CACHE_TTL seconds.
+_TOKEN_CACHE_MAXSIZE = 10_000
+_TOKEN_CACHE_TTL = 60
+_token_cache: dict[bytes, tuple[dict, float]] = {}
+
 
 class TokenRequest(BaseModel):
     api_key: str
@@ -28,7 +35,7 @@ class TokenResponse(BaseModel):
     expires_in: int
 
 
-def _get_settings(request: Request) -> Settings:
+async def _get_settings(request: Request) -> Settings:
     return request.app.state.settings
 
 
@@ -69,21 +76,50 @@ async def create_token(
     )
 
 
+def decode_token(token: str, secret: str, algorithm: str) -> dict:
+    """Decode and verify a JWT, reusing the payload of recently verified tokens.
+
+    Only successful verifications are cached; failures always go through jwt.decode.
+    """
+    key = hashlib.blake2b(f"{secret}\0{algorithm}\0{token}".encode(), digest_size=16).digest()
+    now = time.time()
+    cached = _token_cache.get(key)
+    if cached is not None:
+        payload, expires_at = cached
+        if now < expires_at:
+            return payload
+        del _token_cache[key]
+
+    payload = jwt.decode(token, secret, algorithms=[algorithm])
+
+    expires_at = now + _TOKEN_CACHE_TTL
+    if "exp" in payload:
+        expires_at = min(expires_at, float(payload["exp"]))
+    if len(_token_cache) >= _TOKEN_CACHE_MAXSIZE:
+        # Evict the oldest entry (dicts preserve insertion order)
+        del _token_cache[next(iter(_token_cache))]
+    _token_cache[key] = (payload, expires_at)
+    return payload
+
+
 async def verify_token(
     request: Request,
     credentials: HTTPAuthorizationCredentials = Depends(security),
 ) -> dict:
-    """FastAPI dependency: validate JWT from Authorization header."""
+    """FastAPI dependency: validate JWT from Authorization header.
+
+    The verified payload is stored on request.state.user and reused by any later
+    verification in the same request, including ones declared with use_cache=False.
+    """
+    user = getattr(request.state, "user", None)
+    if user is not None:
+        return user
+
     settings: Settings = request.app.state.settings
     token = credentials.credentials
 
     try:
-        payload = jwt.decode(
-            token,
-            settings.jwt_secret,
-            algorithms=[settings.jwt_algorithm],
-        )
-        return payload
+        payload = decode_token(token, settings.jwt_secret, settings.jwt_algorithm)
     except jwt.ExpiredSignatureError:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -94,3 +130,5 @@ async def verify_token(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid token",
         )
+    request.state.user = payload
+    return payload
@@ -1,4 +1,8 @@
-"""FastAPI dependency injection helpers."""
+"""FastAPI dependency injection helpers.
+
+These are async so FastAPI resolves them inline on the event loop; plain def
+dependencies are dispatched to the threadpool on every request.
+"""
 
 from __future__ import annotations
 
@@ -10,17 +14,20 @@ from rag_engine.storage.sqlite_doc_store import SQLiteDocStore
 from rag_engine.vectorstore.faiss_store import FAISSVectorStore
 
 
-def get_query_pipeline(request: Request) -> QueryPipeline:
+async def get_query_pipeline(request: Request) -> QueryPipeline:
     return request.app.state.query_pipeline
 
 
-def get_ingest_pipeline(request: Request) -> IngestionPipeline:
+async def get_ingest_pipeline(request: Request) -> IngestionPipeline:
+    # Ingestion adds to BM25 itself; let the startup rebuild finish first so
+    # its older snapshot cannot replace the newly added chunks
+    await request.app.state.bm25_ready.wait()
     return request.app.state.ingest_pipeline
 
 
-def get_doc_store(request: Request) -> SQLiteDocStore:
+async def get_doc_store(request: Request) -> SQLiteDocStore:
     return request.app.state.doc_store
 
 
-def get_vector_store(request: Request) -> FAISSVectorStore:
+async def get_vector_store(request: Request) -> FAISSVectorStore:
     return request.app.state.vector_store
@@ -1,48 +1,62 @@
-"""FastAPI middleware for request timing, error handling, and request IDs."""
+"""ASGI middleware for request timing, error handling, and request IDs."""
 
 from __future__ import annotations
 
+import secrets
 import time
-from uuid import uuid4
 
 import structlog
-from fastapi import Request, Response
-from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 from rag_engine.observability.logger import get_logger
 
 logger = get_logger("middleware")
 
 
-class RequestTimingMiddleware(BaseHTTPMiddleware):
-    async def dispatch(self, request: Request, call_next) -> Response:
-        request_id = str(uuid4())
-        start = time.monotonic()
+class RequestTimingMiddleware:
+    """Pure ASGI middleware, avoiding BaseHTTPMiddleware's per-request task and body queue."""
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
 
-        # Bind request ID to structlog context
-        structlog.contextvars.clear_contextvars()
-        structlog.contextvars.bind_contextvars(request_id=request_id)
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        # 64 random bits is plenty to correlate log lines within a request
+        request_id = secrets.token_hex(8)
+        start = time.monotonic()
+        status_code = 500
+
+        async def send_with_headers(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                headers = MutableHeaders(scope=message)
+                headers["X-Request-ID"] = request_id
+                headers["X-Duration-MS"] = f"{(time.monotonic() - start) * 1000:.2f}"
+            await send(message)
+
+        # Request ID is bound to the structlog context for this request only
+        with structlog.contextvars.bound_contextvars(request_id=request_id):
+            try:
+                await self.app(scope, receive, send_with_headers)
+            except Exception as e:
+                logger.error(
+                    "request_failed",
+                    method=scope["method"],
+                    path=scope["path"],
+                    error=str(e),
+                    duration_ms=(time.monotonic() - start) * 1000,
+                )
+                raise
 
-        try:
-            response = await call_next(request)
-            duration_ms = (time.monotonic() - start) * 1000
-            response.headers["X-Request-ID"] = request_id
-            response.headers["X-Duration-MS"] = str(round(duration_ms, 2))
             logger.info(
                 "request_completed",
-                method=request.method,
-                path=request.url.path,
-                status=response.status_code,
-                duration_ms=round(duration_ms, 2),
-            )
-            return response
-        except Exception as e:
-            duration_ms = (time.monotonic() - start) * 1000
-            logger.error(
-                "request_failed",
-                method=request.method,
-                path=request.url.path,
-                error=str(e),
-                duration_ms=round(duration_ms, 2),
+                method=scope["method"],
+                path=scope["path"],
+                status=status_code,
+                duration_ms=(time.monotonic() - start) * 1000,
             )
-            raise
@@ -2,8 +2,10 @@
 
 from __future__ import annotations
 
+import itertools
+import threading
 import time
-from collections import defaultdict
+from collections import defaultdict, deque
 
 from fastapi import Depends, HTTPException, Request, status
 
@@ -16,25 +18,53 @@ logger = get_logger("rate_limiter")
 class SlidingWindowRateLimiter:
     """Simple in-memory sliding window rate limiter.
 
-    Tracks request timestamps per key within a 60-second window.
+    Tracks request timestamps per key within a 60-second window. Keys are
+    spread over NUM_SHARDS tables, each guarded by its own lock, so checks
+    from worker threads stay exact and only contend when keys share a shard.
+    Limits are per process; each Uvicorn worker keeps its own counters.
     """
 
+    # Must be a power of two (shard index is a bit mask of the key hash)
+    NUM_SHARDS = 16
+    # One shard is swept for idle keys once every this many checks
+    GC_INTERVAL = 1000
+
     def __init__(self) -> None:
-        self._requests: dict[str, list[float]] = defaultdict(list)
+        self._shards: list[dict[str, deque[float]]] = [
+            defaultdict(deque) for _ in range(self.NUM_SHARDS)
+        ]
+        self._locks = [threading.Lock() for _ in range(self.NUM_SHARDS)]
+        self._calls = itertools.count(1)
 
     def check(self, key: str, max_requests: int, window_seconds: int = 60) -> bool:
         """Return True if request is allowed, False if rate-limited."""
         now = time.monotonic()
         cutoff = now - window_seconds
 
-        # Prune old entries
-        self._requests[key] = [t for t in self._requests[key] if t > cutoff]
-
-        if len(self._requests[key]) >= max_requests:
-            return False
-
-        self._requests[key].append(now)
-        return True
+        calls = next(self._calls)
+        if calls % self.GC_INTERVAL == 0:
+            self._collect_idle((calls // self.GC_INTERVAL) % self.NUM_SHARDS, cutoff)
+
+        idx = hash(key) & (self.NUM_SHARDS - 1)
+        with self._locks[idx]:
+            # Timestamps are appended in order, so expired entries sit at the left
+            timestamps = self._shards[idx][key]
+            while timestamps and timestamps[0] <= cutoff:
+                timestamps.popleft()
+
+            if len(timestamps) >= max_requests:
+                return False
+
+            timestamps.append(now)
+            return True
+
+    def _collect_idle(self, idx: int, cutoff: float) -> None:
+        """Drop keys in one shard with no requests after cutoff so idle callers don't leak."""
+        with self._locks[idx]:
+            shard = self._shards[idx]
+            idle = [k for k, ts in shard.items() if not ts or ts[-1] <= cutoff]
+            for k in idle:
+                del shard[k]
 
 
 # Singleton instance
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Request, Response, status
 
 from rag_engine.api.dependencies import get_doc_store, get_vector_store
 from rag_engine.models.schemas import HealthResponse
@@ -14,12 +14,19 @@ router = APIRouter()
 
 @router.get("/health", response_model=HealthResponse)
 async def health(
+    request: Request,
+    response: Response,
     doc_store: SQLiteDocStore = Depends(get_doc_store),
     vector_store: FAISSVectorStore = Depends(get_vector_store),
 ) -> HealthResponse:
+    # Not ready while the startup BM25 rebuild is still running
+    bm25_ready = request.app.state.bm25_ready.is_set()
+    if not bm25_ready:
+        response.status_code = status.HTTP_503_SERVICE_UNAVAILABLE
     return HealthResponse(
-        status="ok",
+        status="ok" if bm25_ready else "degraded",
         doc_count=await doc_store.count_documents(),
         chunk_count=await doc_store.count_chunks(),
         index_size=vector_store.size,
+        bm25_ready=bm25_ready,
     )
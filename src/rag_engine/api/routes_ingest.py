@@ -2,11 +2,13 @@
 
 from __future__ import annotations
 
-import json
+import shutil
 import tempfile
 from pathlib import Path
 
+import orjson
 from fastapi import APIRouter, Depends, Form, HTTPException, UploadFile
+from fastapi.concurrency import run_in_threadpool
 
 from rag_engine.api.dependencies import get_ingest_pipeline
 from rag_engine.api.rate_limiter import rate_limit
@@ -16,6 +18,16 @@ from rag_engine.models.schemas import IngestResponse
 
 router = APIRouter()
 
+# Uploads are copied to disk in pieces of this size, never read whole into memory
+_COPY_CHUNK_SIZE = 1 << 20
+
+
+def _spool_to_temp(file: UploadFile, suffix: str) -> str:
+    """Copy an upload to a named temp file and return its path."""
+    with tempfile.NamedTemporaryFile(delete=False, suffix=suffix) as tmp:
+        shutil.copyfileobj(file.file, tmp, _COPY_CHUNK_SIZE)
+        return tmp.name
+
 
 @router.post("/ingest", response_model=IngestResponse)
 async def ingest(
@@ -26,16 +38,13 @@ async def ingest(
 ) -> IngestResponse:
     # Parse metadata
     try:
-        parsed_metadata = json.loads(metadata)
-    except json.JSONDecodeError:
+        parsed_metadata = orjson.loads(metadata)
+    except orjson.JSONDecodeError:
         raise HTTPException(status_code=400, detail="Invalid metadata JSON")
 
     # Save uploaded file to temp location
     suffix = Path(file.filename or "file.txt").suffix
-    with tempfile.NamedTemporaryFile(delete=False, suffix=suffix) as tmp:
-        content = await file.read()
-        tmp.write(content)
-        tmp_path = tmp.name
+    tmp_path = await run_in_threadpool(_spool_to_temp, file, suffix)
 
     try:
         result = await pipeline.ingest_file(tmp_path, parsed_metadata)
@@ -3,8 +3,10 @@
 from __future__ import annotations
 
 import re
+import string
 
-from datasketch import MinHash, MinHashLSH
+import numpy as np
+from datasketch import LeanMinHash, MinHash, MinHashLSH
 
 from rag_engine.config.constants import (
     MIN_CHUNK_LENGTH,
@@ -17,6 +19,17 @@ from rag_engine.observability.logger import get_logger
 
 logger = get_logger("chunk_quality")
 
+_WORD_RE = re.compile(r"\w+")
+_ASCII_LETTERS = string.ascii_letters.encode("ascii")
+
+
+def _alpha_count(text: str) -> int:
+    """Count alphabetic characters, with a C-speed path for ASCII text."""
+    if text.isascii():
+        raw = text.encode("ascii")
+        return len(raw) - len(raw.translate(None, _ASCII_LETTERS))
+    return sum(map(str.isalpha, text))
+
 
 def filter_garbage_chunks(chunks: list[Chunk]) -> list[Chunk]:
     """Remove chunks that are too short, mostly non-alphabetic, or highly repetitive."""
@@ -27,7 +40,7 @@ def filter_garbage_chunks(chunks: list[Chunk]) -> list[Chunk]:
         if len(text) < MIN_CHUNK_LENGTH:
             removed += 1
             continue
-        alpha_ratio = sum(c.isalpha() for c in text) / max(len(text), 1)
+        alpha_ratio = _alpha_count(text) / max(len(text), 1)
         if alpha_ratio < 0.3:
             removed += 1
             continue
@@ -49,13 +62,14 @@ def detect_near_duplicates(chunks: list[Chunk]) -> list[tuple[str, str]]:
         return []
 
     lsh = MinHashLSH(threshold=NEAR_DUP_SIMILARITY_THRESHOLD, num_perm=MINHASH_NUM_PERM)
-    minhashes: dict[str, MinHash] = {}
+    minhashes: dict[str, LeanMinHash] = {}
 
     for chunk in chunks:
         mh = MinHash(num_perm=MINHASH_NUM_PERM)
-        words = set(re.findall(r"\w+", chunk.text.lower()))
-        for word in words:
-            mh.update(word.encode("utf-8"))
+        words = set(_WORD_RE.findall(chunk.text.lower()))
+        mh.update_batch([word.encode("utf-8") for word in words])
+        # LeanMinHash drops the permutation arrays, keeping only the hash values
+        mh = LeanMinHash(mh)
         minhashes[chunk.chunk_id] = mh
         try:
             lsh.insert(chunk.chunk_id, mh)
@@ -78,16 +92,21 @@ def detect_near_duplicates(chunks: list[Chunk]) -> list[tuple[str, str]]:
     return duplicates
 
 
+def _token_hashes(text: str) -> np.ndarray:
+    """Unique 64-bit hashes of the lowercased words in text."""
+    # str hashes are salted per process, which is fine for in-process set algebra
+    return np.unique(np.fromiter((hash(w) for w in _WORD_RE.findall(text.lower())), dtype=np.int64))
+
+
 def compute_coverage(chunks: list[Chunk], original_text: str) -> float:
     """Measure what fraction of the original text is represented in chunks."""
     if not original_text:
         return 0.0
-    original_words = set(re.findall(r"\w+", original_text.lower()))
-    chunk_words: set[str] = set()
-    for chunk in chunks:
-        chunk_words.update(re.findall(r"\w+", chunk.text.lower()))
-    if not original_words:
+    original_words = _token_hashes(original_text)
+    if not original_words.size:
         return 0.0
-    coverage = len(original_words & chunk_words) / len(original_words)
+    chunk_words = _token_hashes("\n".join(chunk.text for chunk in chunks))
+    covered = np.intersect1d(original_words, chunk_words, assume_unique=True).size
+    coverage = covered / original_words.size
     logger.info("chunk_coverage", coverage=round(coverage, 4))
     return coverage
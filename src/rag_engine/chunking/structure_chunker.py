@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
+import functools
 import re
+from collections.abc import Iterator
 from uuid import uuid4
 
 import tiktoken
@@ -11,6 +13,41 @@ from rag_engine.chunking.overlap import compute_overlap_text
 from rag_engine.config.constants import TIKTOKEN_ENCODING
 from rag_engine.models.domain import Chunk
 
+_HEADING_RE = re.compile(r"^(#{1,6})\s+(.+)$", re.MULTILINE)
+_PARAGRAPH_RE = re.compile(r"\n\s*\n")
+_SENTENCE_RE = re.compile(r"(?<=[.!?])\s+")
+
+# English prose averages ~4 characters per token. Text longer than this many
+# characters per allowed token is treated as over budget without encoding it.
+_MAX_CHARS_PER_TOKEN = 8
+
+
+@functools.lru_cache(maxsize=4)
+def _get_encoder(name: str) -> tiktoken.Encoding:
+    """Load a tiktoken encoding once per process; chunkers are built per document."""
+    return tiktoken.get_encoding(name)
+
+
+def _iter_headings(text: str) -> Iterator[re.Match[str]]:
+    """Yield the same matches as _HEADING_RE.finditer, trying only lines starting with '#'."""
+    end = 0
+    for start in _hash_line_starts(text):
+        if start < end:
+            continue  # Inside a heading that spans lines
+        match = _HEADING_RE.match(text, start)
+        if match:
+            end = match.end()
+            yield match
+
+
+def _hash_line_starts(text: str) -> Iterator[int]:
+    if text.startswith("#"):
+        yield 0
+    pos = text.find("\n#")
+    while pos != -1:
+        yield pos + 1
+        pos = text.find("\n#", pos + 1)
+
 
 class StructureChunker:
     def __init__(
@@ -22,7 +59,7 @@ class StructureChunker:
         self._doc_id = doc_id
         self._max_tokens = max_tokens
         self._overlap_pct = overlap_pct
-        self._enc = tiktoken.get_encoding(TIKTOKEN_ENCODING)
+        self._enc = _get_encoder(TIKTOKEN_ENCODING)
 
     def chunk(self, text: str, metadata: dict) -> list[Chunk]:
         doc_id = metadata.get("doc_id", self._doc_id) or str(uuid4())
@@ -30,67 +67,70 @@ class StructureChunker:
         raw_chunks: list[dict] = []
 
         for heading_path, section_text in sections:
-            if self._count_tokens(section_text) <= self._max_tokens:
+            section_text = section_text.strip()
+            section_tokens = (
+                None if self._too_big(section_text) else self._count_tokens(section_text)
+            )
+            if section_tokens is not None and section_tokens <= self._max_tokens:
                 raw_chunks.append(
                     {
-                        "text": section_text.strip(),
+                        "text": section_text,
                         "heading_path": heading_path,
+                        "token_count": section_tokens,
                     }
                 )
-            else:
-                paragraphs = self._split_by_paragraphs(section_text)
-                for para in paragraphs:
-                    if self._count_tokens(para) <= self._max_tokens:
-                        raw_chunks.append(
-                            {
-                                "text": para.strip(),
-                                "heading_path": heading_path,
-                            }
-                        )
-                    else:
-                        sentences = self._split_by_sentences(para)
-                        buffer = ""
-                        for sent in sentences:
-                            candidate = (buffer + " " + sent).strip() if buffer else sent
-                            if self._count_tokens(candidate) <= self._max_tokens:
-                                buffer = candidate
-                            else:
-                                if buffer:
-                                    raw_chunks.append(
-                                        {
-                                            "text": buffer.strip(),
-                                            "heading_path": heading_path,
-                                        }
-                                    )
-                                buffer = sent
-                        if buffer.strip():
-                            raw_chunks.append(
-                                {
-                                    "text": buffer.strip(),
-                                    "heading_path": heading_path,
-                                }
-                            )
-
-        # Apply overlap
+                continue
+            for para in self._split_by_paragraphs(section_text):
+                para = para.strip()
+                para_tokens = None if self._too_big(para) else self._count_tokens(para)
+                if para_tokens is not None and para_tokens <= self._max_tokens:
+                    raw_chunks.append(
+                        {
+                            "text": para,
+                            "heading_path": heading_path,
+                            "token_count": para_tokens,
+                        }
+                    )
+                    continue
+                for piece_text, piece_tokens in self._pack_sentences(para):
+                    raw_chunks.append(
+                        {
+                            "text": piece_text,
+                            "heading_path": heading_path,
+                            "token_count": piece_tokens,
+                        }
+                    )
+
+        # Apply overlap: overlaps[i] is the tail of chunk i - 1, computed once per
+        # chunk and token-counted in a single batch
+        overlaps = [""] * len(raw_chunks)
+        overlap_tokens = [0] * len(raw_chunks)
+        if self._overlap_pct > 0 and len(raw_chunks) > 1:
+            overlaps[1:] = [
+                compute_overlap_text(rc["text"], self._overlap_pct) for rc in raw_chunks[:-1]
+            ]
+            prefixes = [overlap + "\n" if overlap else "" for overlap in overlaps]
+            overlap_tokens = [len(t) for t in self._enc.encode_batch(prefixes)]
+
         chunks: list[Chunk] = []
         for i, rc in enumerate(raw_chunks):
             text_with_overlap = rc["text"]
-            if i > 0 and self._overlap_pct > 0:
-                overlap = compute_overlap_text(raw_chunks[i - 1]["text"], self._overlap_pct)
-                if overlap:
-                    text_with_overlap = overlap + "\n" + rc["text"]
+            token_count = rc["token_count"]
+            if overlaps[i]:
+                text_with_overlap = overlaps[i] + "\n" + rc["text"]
+                token_count += overlap_tokens[i]
 
             if not text_with_overlap.strip():
                 continue
 
             chunks.append(
                 Chunk(
-                    chunk_id=str(uuid4()),
+                    chunk_id=uuid4().hex,
                     doc_id=doc_id,
                     text=text_with_overlap,
                     index=i,
                     metadata={**metadata, "heading_path": rc["heading_path"]},
-                    token_count=self._count_tokens(text_with_overlap),
+                    token_count=token_count,
                 )
             )
 
@@ -99,15 +139,47 @@ class StructureChunker:
     def _count_tokens(self, text: str) -> int:
         return len(self._enc.encode(text))
 
+    def _too_big(self, text: str) -> bool:
+        """Cheap check for text far too long to fit max_tokens, so encoding can be skipped."""
+        return len(text) > self._max_tokens * _MAX_CHARS_PER_TOKEN
+
+    def _pack_sentences(self, para: str) -> list[tuple[str, int]]:
+        """Greedily pack sentences into pieces of at most max_tokens.
+
+        Each sentence is encoded once, alone and with its joining space.
+        tiktoken pre-splits text at whitespace and punctuation, so these counts
+        add up exactly to the count of the joined text. That avoids
+        re-encoding the growing buffer for every candidate sentence.
+        Returns (text, token_count) pairs.
+        """
+        sentences = self._split_by_sentences(para)
+        alone = [len(t) for t in self._enc.encode_batch(sentences)]
+        joined = [len(t) for t in self._enc.encode_batch([" " + s for s in sentences])]
+
+        pieces: list[tuple[str, int]] = []
+        # Sentences are joined once per piece rather than appended to a growing string
+        buffer: list[str] = []
+        buffer_tokens = 0
+        for sent, sent_tokens, joined_tokens in zip(sentences, alone, joined, strict=True):
+            if buffer and buffer_tokens + joined_tokens <= self._max_tokens:
+                buffer.append(sent)
+                buffer_tokens += joined_tokens
+            else:
+                if buffer:
+                    pieces.append((" ".join(buffer), buffer_tokens))
+                buffer, buffer_tokens = [sent], sent_tokens
+        if buffer:
+            pieces.append((" ".join(buffer), buffer_tokens))
+        return pieces
+
     @staticmethod
     def _split_by_headings(text: str) -> list[tuple[list[str], str]]:
         """Split text by markdown headings. Returns list of (heading_path, section_text)."""
-        heading_pattern = re.compile(r"^(#{1,6})\s+(.+)$", re.MULTILINE)
         sections: list[tuple[list[str], str]] = []
         heading_stack: list[str] = []
         last_end = 0
 
-        for match in heading_pattern.finditer(text):
+        for match in _iter_headings(text):
             if match.start() > last_end:
                 section_text = text[last_end : match.start()]
                 if section_text.strip():
@@ -132,11 +204,11 @@ class StructureChunker:
     @staticmethod
     def _split_by_paragraphs(text: str) -> list[str]:
         """Split text by double newlines (paragraphs)."""
-        paragraphs = re.split(r"\n\s*\n", text)
+        paragraphs = _PARAGRAPH_RE.split(text)
         return [p for p in paragraphs if p.strip()]
 
     @staticmethod
     def _split_by_sentences(text: str) -> list[str]:
         """Split text by sentence boundaries."""
-        sentences = re.split(r"(?<=[.!?])\s+", text)
-        return [s for s in sentences if s.strip()]
+        sentences = _SENTENCE_RE.split(text)
+        return [s.strip() for s in sentences if s.strip()]
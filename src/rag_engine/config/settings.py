@@ -14,6 +14,8 @@ class Settings(BaseSettings):
     embedding_model: str = "text-embedding-3-small"
     embedding_dimensions: int = 1536
     embedding_batch_size: int = 100
+    embedding_coalesce_wait_ms: float = 20.0  # max wait to merge concurrent embed calls
+    embedding_max_concurrency: int = 8  # embedding API requests in flight at once
 
     # LLM / Gemini
     gemini_model: str = "gemini-2.0-flash"
@@ -25,15 +27,20 @@ class Settings(BaseSettings):
     vector_top_k: int = 50
     rrf_k: int = 60
     rerank_top_n: int = 10
+    rerank_batch_size: int = 32
     retrieval_fallback_expand_k: int = 100
+    retrieval_concurrency_limit: int = 4  # sub-question retrievals in flight at once
 
     # Chunking
     chunk_max_tokens: int = 512
     chunk_overlap_pct: float = 0.15
+    ingest_quality_checks: bool = True  # log near-duplicate and coverage diagnostics
 
     # Retrieval quality scoring weights
     rq_proceed_threshold: float = 0.55
     rq_fallback_threshold: float = 0.25
+    # Skip the cross-encoder when first-stage (RRF) quality already clears this; None = never
+    rq_skip_rerank_threshold: float | None = None
     rq_w_relevance: float = 0.45
     rq_w_margin: float = 0.20
     rq_w_coverage: float = 0.15
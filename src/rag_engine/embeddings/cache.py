@@ -2,81 +2,136 @@
 
 from __future__ import annotations
 
+import asyncio
 import hashlib
-import json
+from contextlib import AbstractAsyncContextManager
 
 import aiosqlite
+import numpy as np
+import orjson
+
+from rag_engine.storage.connection import SQLiteConnection
 
 CREATE_CACHE_TABLE = """
 CREATE TABLE IF NOT EXISTS embedding_cache (
     text_hash TEXT PRIMARY KEY,
-    embedding TEXT NOT NULL
+    embedding BLOB NOT NULL
 )
 """
 
+# Bumped whenever the key or value format changes; older entries are dropped.
+# 1: text_hash is a 128-bit BLAKE2b digest (was SHA-256)
+# 2: embedding is packed float32 bytes (was a JSON array)
+CACHE_SCHEMA_VERSION = 2
+
+# Batches at least this large are hashed in a worker thread (hashlib releases
+# the GIL on longer inputs), keeping the event loop responsive
+HASH_IN_THREAD_MIN_TEXTS = 1024
+
+
+def _hash_texts(texts: list[str]) -> list[str]:
+    # Constructor bound once outside the loop
+    blake2b = hashlib.blake2b
+    return [blake2b(t.encode("utf-8"), digest_size=16).hexdigest() for t in texts]
+
 
 class EmbeddingCache:
     def __init__(self, db_path: str) -> None:
         self._db_path = db_path
+        self._conn = SQLiteConnection(db_path)
+        self._initialized = False
 
     async def initialize(self) -> None:
-        async with aiosqlite.connect(self._db_path) as db:
+        if self._initialized:
+            return
+        db = await self._conn.get()
+        async with db.execute("PRAGMA user_version") as cursor:
+            row = await cursor.fetchone()
+        if row[0] < CACHE_SCHEMA_VERSION:
+            # Fresh file, or entries under an older key/value format that can never
+            # be hit again. The version is written last so a crash mid-migration
+            # reruns it on the next start; a current version skips all DDL.
+            await db.execute("DROP TABLE IF EXISTS embedding_cache")
             await db.execute(CREATE_CACHE_TABLE)
+            await db.execute(f"PRAGMA user_version = {CACHE_SCHEMA_VERSION}")
             await db.commit()
+        self._initialized = True
+
+    async def close(self) -> None:
+        await self._conn.close()
+
+    def transaction(self) -> AbstractAsyncContextManager[aiosqlite.Connection]:
+        """Run the enclosed writes under the write lock as one BEGIN/COMMIT."""
+        return self._conn.transaction()
 
     async def get(self, text: str) -> list[float] | None:
         text_hash = self._hash(text)
-        async with aiosqlite.connect(self._db_path) as db:
-            async with db.execute(
-                "SELECT embedding FROM embedding_cache WHERE text_hash = ?",
-                (text_hash,),
-            ) as cursor:
-                row = await cursor.fetchone()
-                if row is None:
-                    return None
-                return json.loads(row[0])
-
-    async def get_batch(self, texts: list[str]) -> dict[int, list[float]]:
-        """Return {index: embedding} for texts that are cached."""
+        db = await self._conn.get()
+        async with db.execute(
+            "SELECT embedding FROM embedding_cache WHERE text_hash = ?",
+            (text_hash,),
+        ) as cursor:
+            row = await cursor.fetchone()
+            if row is None:
+                return None
+            return self._decode(row[0]).tolist()
+
+    async def get_batch(self, texts: list[str]) -> dict[int, np.ndarray]:
+        """Return {index: float32 embedding} for texts that are cached."""
         if not texts:
             return {}
-        hashes = [(i, self._hash(t)) for i, t in enumerate(texts)]
-        hash_to_idx = {h: i for i, h in hashes}
-        placeholders = ",".join("?" for _ in hashes)
-        hash_values = [h for _, h in hashes]
-
-        result: dict[int, list[float]] = {}
-        async with aiosqlite.connect(self._db_path) as db:
-            async with db.execute(
-                f"SELECT text_hash, embedding FROM embedding_cache WHERE text_hash IN ({placeholders})",
-                hash_values,
-            ) as cursor:
-                async for row in cursor:
-                    idx = hash_to_idx.get(row[0])
-                    if idx is not None:
-                        result[idx] = json.loads(row[1])
-        return result
+        hash_to_idx = {h: i for i, h in enumerate(await self._hash_batch(texts))}
+
+        db = await self._conn.get()
+        # One constant statement for any batch size: hashes travel as a single JSON
+        # array parameter and SQLite does an index seek per value.
+        async with db.execute(
+            "SELECT text_hash, embedding FROM embedding_cache "
+            "WHERE text_hash IN (SELECT value FROM json_each(?))",
+            # json_each rejects BLOB arguments, so the orjson bytes are passed as text
+            (orjson.dumps(list(hash_to_idx)).decode(),),
+        ) as cursor:
+            rows = await cursor.fetchall()
+        # Rows come back in one hop and the cursor is released before decoding
+        decode = self._decode
+        return {hash_to_idx[text_hash]: decode(blob) for text_hash, blob in rows}
 
     async def put(self, text: str, embedding: list[float]) -> None:
         text_hash = self._hash(text)
-        async with aiosqlite.connect(self._db_path) as db:
+        async with self.transaction() as db:
             await db.execute(
                 "INSERT OR REPLACE INTO embedding_cache (text_hash, embedding) VALUES (?, ?)",
-                (text_hash, json.dumps(embedding)),
+                (text_hash, self._encode(embedding)),
             )
-            await db.commit()
 
-    async def put_batch(self, texts: list[str], embeddings: list[list[float]]) -> None:
+    async def put_batch(self, texts: list[str], embeddings: np.ndarray | list[list[float]]) -> None:
         if not texts:
             return
-        rows = [(self._hash(t), json.dumps(e)) for t, e in zip(texts, embeddings)]
-        async with aiosqlite.connect(self._db_path) as db:
+        hashes = await self._hash_batch(texts)
+        matrix = np.asarray(embeddings, dtype=np.float32)
+        rows = [(h, row.tobytes()) for h, row in zip(hashes, matrix)]
+        async with self.transaction() as db:
             await db.executemany(
                 "INSERT OR REPLACE INTO embedding_cache (text_hash, embedding) VALUES (?, ?)",
                 rows,
             )
-            await db.commit()
+
+    @staticmethod
+    async def _hash_batch(texts: list[str]) -> list[str]:
+        if len(texts) >= HASH_IN_THREAD_MIN_TEXTS:
+            return await asyncio.to_thread(_hash_texts, texts)
+        return _hash_texts(texts)
+
+    @staticmethod
+    def _encode(embedding: list[float]) -> bytes:
+        return np.asarray(embedding, dtype=np.float32).tobytes()
+
+    @staticmethod
+    def _decode(blob: bytes) -> np.ndarray:
+        # Zero-copy read-only view; far cheaper than parsing a JSON array of floats
+        return np.frombuffer(blob, dtype=np.float32)
 
     @staticmethod
     def _hash(text: str) -> str:
-        return hashlib.sha256(text.encode("utf-8")).hexdigest()
+        # Non-cryptographic cache key: BLAKE2b is faster than SHA-256 and 128 bits suffice
+        return hashlib.blake2b(text.encode("utf-8"), digest_size=16).hexdigest()
@@ -2,11 +2,22 @@
 
 from __future__ import annotations
 
+import asyncio
+from collections import OrderedDict
+
+import numpy as np
+
 from rag_engine.embeddings.cache import EmbeddingCache
 from rag_engine.observability.logger import get_logger
 
 logger = get_logger("cached_embedder")
 
+# Cache writes allowed in flight before embed_texts waits for one to land
+MAX_PENDING_WRITES = 32
+
+# Recent query embeddings kept in memory; eval runs replay the same queries
+QUERY_LRU_SIZE = 1024
+
 
 class CachedEmbedder:
     """Wraps any Embedder, checks EmbeddingCache first, calls delegate for misses."""
@@ -14,39 +25,45 @@ class CachedEmbedder:
     def __init__(self, delegate, cache: EmbeddingCache) -> None:
         self._delegate = delegate
         self._cache = cache
+        self._pending_writes: set[asyncio.Task] = set()
+        self._query_lru: OrderedDict[str, list[float]] = OrderedDict()
 
     @property
     def dimensions(self) -> int:
         return self._delegate.dimensions
 
-    async def embed_texts(self, texts: list[str]) -> list[list[float]]:
+    async def embed_texts(self, texts: list[str], out: np.ndarray | None = None) -> np.ndarray:
+        result = out if out is not None else np.empty((len(texts), self.dimensions), np.float32)
         if not texts:
-            return []
+            return result
 
-        # Batch-check cache
+        # Batch-check cache; hits go straight into the result array
         cached = await self._cache.get_batch(texts)
+        for i, emb in cached.items():
+            result[i] = emb
 
         # Identify misses
-        miss_indices = [i for i in range(len(texts)) if i not in cached]
+        miss_indices = sorted(set(range(len(texts))) - cached.keys())
 
         if not miss_indices:
             logger.info("embed_texts_all_cached", count=len(texts))
-            return [cached[i] for i in range(len(texts))]
-
-        # Embed misses via delegate
-        miss_texts = [texts[i] for i in miss_indices]
-        miss_embeddings = await self._delegate.embed_texts(miss_texts)
-
-        # Store new embeddings in cache
-        await self._cache.put_batch(miss_texts, miss_embeddings)
-
-        # Merge results in original order
-        result: list[list[float]] = [[] for _ in range(len(texts))]
-        for i in range(len(texts)):
-            if i in cached:
-                result[i] = cached[i]
-        for idx, emb in zip(miss_indices, miss_embeddings):
-            result[idx] = emb
+            return result
+
+        # Embed misses via delegate; with no hits it can write into result directly
+        if not cached:
+            miss_texts = texts
+            await self._delegate.embed_texts(texts, out=result)
+            # The caller owns result and may modify it (FAISS normalizes in place)
+            # before the background write serializes it, so the write gets a copy
+            miss_embeddings = result.copy()
+        else:
+            miss_texts = [texts[i] for i in miss_indices]
+            miss_embeddings = await self._delegate.embed_texts(miss_texts)
+            # Scatter fresh embeddings into their original positions
+            result[miss_indices] = miss_embeddings
+
+        # Store new embeddings in the background; the caller already has its result
+        await self._schedule_write(miss_texts, miss_embeddings)
 
         logger.info(
             "embed_texts_with_cache",
@@ -56,13 +73,42 @@ class CachedEmbedder:
         )
         return result
 
+    async def flush(self) -> None:
+        """Wait for every scheduled cache write to finish."""
+        if self._pending_writes:
+            await asyncio.gather(*self._pending_writes, return_exceptions=True)
+
+    async def close(self) -> None:
+        await self.flush()
+
+    async def _schedule_write(self, texts: list[str], embeddings: np.ndarray) -> None:
+        if len(self._pending_writes) >= MAX_PENDING_WRITES:
+            await asyncio.wait(self._pending_writes, return_when=asyncio.FIRST_COMPLETED)
+        task = asyncio.create_task(self._cache.put_batch(texts, embeddings))
+        self._pending_writes.add(task)
+        task.add_done_callback(self._on_write_done)
+
+    def _on_write_done(self, task: asyncio.Task) -> None:
+        self._pending_writes.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            # A lost cache write only costs a future re-embed
+            logger.warning("embedding_cache_write_failed", error=str(task.exception()))
+
     async def embed_query(self, query: str) -> list[float]:
-        cached = await self._cache.get(query)
-        if cached is not None:
-            logger.debug("embed_query_cache_hit", query_len=len(query))
-            return cached
+        embedding = self._query_lru.get(query)
+        if embedding is not None:
+            self._query_lru.move_to_end(query)
+            return embedding
 
-        embedding = await self._delegate.embed_query(query)
-        await self._cache.put(query, embedding)
-        logger.debug("embed_query_cache_miss", query_len=len(query))
+        embedding = await self._cache.get(query)
+        if embedding is not None:
+            logger.debug("embed_query_cache_hit", query_len=len(query))
+        else:
+            embedding = await self._delegate.embed_query(query)
+            await self._cache.put(query, embedding)
+            logger.debug("embed_query_cache_miss", query_len=len(query))
+
+        self._query_lru[query] = embedding
+        if len(self._query_lru) > QUERY_LRU_SIZE:
+            self._query_lru.popitem(last=False)
         return embedding
@@ -0,0 +1,149 @@
+"""Request-coalescing wrapper that merges concurrent embed_texts calls into shared batches."""
+
+from __future__ import annotations
+
+import asyncio
+import itertools
+
+import numpy as np
+
+from rag_engine.exceptions import EmbeddingError
+from rag_engine.observability.logger import get_logger
+
+logger = get_logger("embedding_coalescer")
+
+# (text, future for its embedding, id of the embed_texts call that queued it)
+_Item = tuple[str, asyncio.Future, int]
+
+
+class EmbeddingCoalescer:
+    """Wraps any Embedder and batches texts from concurrent callers into one delegate call.
+
+    Texts are queued and flushed once max_batch_size texts are waiting or max_wait_ms
+    has passed since the first one arrived. Flushes run concurrently, so a large caller
+    never holds up the next batch. Queries bypass the queue to keep their latency.
+
+    If a batch shared by several callers fails, each caller's texts are retried on
+    their own, so one caller's bad input does not fail the others.
+    """
+
+    def __init__(self, delegate, max_batch_size: int = 100, max_wait_ms: float = 20.0) -> None:
+        self._delegate = delegate
+        self._max_batch_size = max_batch_size
+        self._max_wait = max_wait_ms / 1000
+        self._queue: asyncio.Queue[_Item] | None = None
+        self._worker: asyncio.Task | None = None
+        self._inflight: set[asyncio.Task] = set()
+        self._callers = itertools.count()
+
+    @property
+    def dimensions(self) -> int:
+        return self._delegate.dimensions
+
+    async def embed_texts(self, texts: list[str], out: np.ndarray | None = None) -> np.ndarray:
+        if out is None:
+            out = np.empty((len(texts), self.dimensions), dtype=np.float32)
+        if not texts:
+            return out
+        queue = self._ensure_worker()
+        loop = asyncio.get_running_loop()
+        caller = next(self._callers)
+        futures = []
+        for text in texts:
+            future = loop.create_future()
+            queue.put_nowait((text, future, caller))
+            futures.append(future)
+        for i, embedding in enumerate(await asyncio.gather(*futures)):
+            out[i] = embedding
+        return out
+
+    async def embed_query(self, query: str) -> list[float]:
+        return await self._delegate.embed_query(query)
+
+    async def close(self) -> None:
+        """Stop the batching worker and wait for in-flight batches to finish."""
+        if self._worker is not None:
+            self._worker.cancel()
+            await asyncio.gather(self._worker, return_exceptions=True)
+            self._worker = None
+        if self._inflight:
+            await asyncio.gather(*self._inflight, return_exceptions=True)
+
+    def _ensure_worker(self) -> asyncio.Queue[_Item]:
+        if self._queue is None:
+            self._queue = asyncio.Queue()
+        if self._worker is None or self._worker.done():
+            self._worker = asyncio.create_task(self._run(self._queue))
+        return self._queue
+
+    async def _run(self, queue: asyncio.Queue[_Item]) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await queue.get()]
+            deadline = loop.time() + self._max_wait
+            while len(batch) < self._max_batch_size:
+                if not queue.empty():
+                    batch.append(queue.get_nowait())
+                    continue
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(queue.get(), timeout))
+                except TimeoutError:
+                    break
+            task = asyncio.create_task(self._flush(batch))
+            self._inflight.add(task)
+            task.add_done_callback(self._on_flush_done)
+
+    async def _flush(self, batch: list[_Item]) -> None:
+        try:
+            self._resolve(batch, await self._embed([text for text, _, _ in batch]))
+        except EmbeddingError as e:
+            callers: dict[int, list[_Item]] = {}
+            for item in batch:
+                callers.setdefault(item[2], []).append(item)
+            if len(callers) == 1:
+                self._fail(batch, e)
+                return
+            # Isolate callers: each one's texts are retried as a batch of their own
+            logger.warning("coalesced_batch_failed", size=len(batch), callers=len(callers))
+            await asyncio.gather(*(self._flush_alone(items) for items in callers.values()))
+        except BaseException as e:
+            # Unexpected failure: no caller may be left waiting
+            self._fail(batch, e)
+            raise
+        else:
+            logger.debug("coalesced_batch", size=len(batch))
+
+    async def _flush_alone(self, items: list[_Item]) -> None:
+        try:
+            self._resolve(items, await self._embed([text for text, _, _ in items]))
+        except EmbeddingError as e:
+            self._fail(items, e)
+        except BaseException as e:
+            self._fail(items, e)
+            raise
+
+    async def _embed(self, texts: list[str]) -> np.ndarray:
+        embeddings = await self._delegate.embed_texts(texts)
+        if len(embeddings) != len(texts):
+            raise EmbeddingError(f"Expected {len(texts)} embeddings, got {len(embeddings)}")
+        return embeddings
+
+    @staticmethod
+    def _resolve(items: list[_Item], embeddings: np.ndarray) -> None:
+        for (_, future, _), embedding in zip(items, embeddings, strict=True):
+            if not future.done():
+                future.set_result(embedding)
+
+    @staticmethod
+    def _fail(items: list[_Item], error: BaseException) -> None:
+        for _, future, _ in items:
+            if not future.done():
+                future.set_exception(error)
+
+    def _on_flush_done(self, task: asyncio.Task) -> None:
+        self._inflight.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            logger.warning("coalesced_batch_error", error=str(task.exception()))
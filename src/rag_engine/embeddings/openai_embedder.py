@@ -2,6 +2,10 @@
 
 from __future__ import annotations
 
+import asyncio
+import base64
+
+import numpy as np
 from openai import AsyncOpenAI
 
 from rag_engine.exceptions import EmbeddingError
@@ -16,35 +20,50 @@ class OpenAIEmbedder:
         api_key: str,
         model: str = "text-embedding-3-small",
         batch_size: int = 100,
+        max_concurrency: int = 8,
         _dimensions: int = 1536,
     ) -> None:
         self._client = AsyncOpenAI(api_key=api_key)
         self._model = model
         self._batch_size = batch_size
+        self._semaphore = asyncio.Semaphore(max_concurrency)
         self._dimensions = _dimensions
 
     @property
     def dimensions(self) -> int:
         return self._dimensions
 
-    async def embed_texts(self, texts: list[str]) -> list[list[float]]:
+    async def embed_texts(self, texts: list[str], out: np.ndarray | None = None) -> np.ndarray:
+        if out is None:
+            out = np.empty((len(texts), self._dimensions), dtype=np.float32)
         if not texts:
-            return []
-        all_embeddings: list[list[float]] = []
+            return out
+
+        async def embed_into(start: int) -> None:
+            end = start + self._batch_size
+            out[start:end] = await self._embed_batch(texts[start:end])
+
         try:
-            for i in range(0, len(texts), self._batch_size):
-                batch = texts[i : i + self._batch_size]
-                response = await self._client.embeddings.create(input=batch, model=self._model)
-                batch_embeddings = [item.embedding for item in response.data]
-                all_embeddings.extend(batch_embeddings)
+            # Batches are sent concurrently, each landing in its own rows of out
+            await asyncio.gather(*(embed_into(i) for i in range(0, len(texts), self._batch_size)))
             logger.info("embedded_texts", count=len(texts), model=self._model)
         except Exception as e:
             raise EmbeddingError(f"Failed to embed {len(texts)} texts: {e}") from e
-        return all_embeddings
+        return out
+
+    async def _embed_batch(self, batch: list[str]) -> np.ndarray:
+        async with self._semaphore:
+            response = await self._client.embeddings.create(
+                input=batch, model=self._model, encoding_format="base64"
+            )
+        # Requested explicitly, base64 is passed through undecoded: the float32 payloads
+        # go straight into one array without building a Python float per component
+        raw = b"".join(base64.b64decode(item.embedding) for item in response.data)
+        return np.frombuffer(raw, dtype=np.float32).reshape(len(response.data), -1)
 
     async def embed_query(self, query: str) -> list[float]:
         try:
-            response = await self._client.embeddings.create(input=[query], model=self._model)
-            return response.data[0].embedding
+            # Shares the concurrency cap with batch requests
+            return (await self._embed_batch([query]))[0].tolist()
         except Exception as e:
             raise EmbeddingError(f"Failed to embed query: {e}") from e
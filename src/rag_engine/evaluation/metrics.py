@@ -3,7 +3,6 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from itertools import groupby
 
 
 @dataclass
@@ -39,71 +38,67 @@ def compute_metrics(results: list[EvalCaseResult]) -> dict:
     if total == 0:
         return _empty_metrics()
 
-    valid = [r for r in results if r.error is None]
-    errors = [r for r in results if r.error is not None]
-
-    # Decision accuracy (only count non-error cases)
-    decision_correct = sum(r.decision_correct for r in valid)
-    decision_accuracy = decision_correct / len(valid) if valid else 0.0
-
-    # Abstain rates
-    abstain_count = sum(1 for r in valid if r.actual_decision == "abstain")
-    abstain_rate = abstain_count / len(valid) if valid else 0.0
-
-    # Correct abstain rate: of expected-abstain cases, how many actually abstained
-    expected_abstain = [r for r in valid if r.expected_decision == "abstain"]
-    correct_abstain = sum(1 for r in expected_abstain if r.actual_decision == "abstain")
-    correct_abstain_rate = correct_abstain / len(expected_abstain) if expected_abstain else 0.0
-
-    # False abstain rate: of expected-answer cases, how many abstained
-    expected_answer = [r for r in valid if r.expected_decision == "answer"]
-    false_abstain = sum(1 for r in expected_answer if r.actual_decision == "abstain")
-    false_abstain_rate = false_abstain / len(expected_answer) if expected_answer else 0.0
-
-    # False answer rate: of expected-abstain cases, how many returned "answer"
-    # (clarify is NOT a false answer since it includes a caveat)
-    expected_not_answer = [r for r in valid if r.expected_decision == "abstain"]
-    false_answers = sum(1 for r in expected_not_answer if r.actual_decision == "answer")
-    false_answer_rate = false_answers / len(expected_not_answer) if expected_not_answer else 0.0
-
-    # Adversarial decision accuracy
-    adversarial = [r for r in valid if r.category == "adversarial"]
-    adversarial_accuracy = (
-        sum(r.decision_correct for r in adversarial) / len(adversarial) if adversarial else 0.0
-    )
-
-    # Answer quality: for non-abstain results with expected keywords,
-    # what fraction had ALL keywords found
-    answerable_with_keywords = [
-        r
-        for r in valid
-        if r.actual_decision != "abstain"
-        and r.expected_decision != "abstain"
-        and r.expected_answer_contains
-    ]
-    if answerable_with_keywords:
-        all_kw_found = sum(1 for r in answerable_with_keywords if not r.keywords_missing)
-        answer_quality = all_kw_found / len(answerable_with_keywords)
-    else:
-        answer_quality = 0.0
-
-    # Averages
-    avg_confidence = sum(r.confidence for r in valid) / len(valid) if valid else 0.0
-    avg_latency = sum(r.latency_ms for r in valid) / len(valid) if valid else 0.0
+    # Single pass over the results; ratios are taken at the end
+    valid = 0
+    decision_correct = 0
+    abstain_count = 0
+    expected_abstain = 0
+    correct_abstain = 0
+    false_answers = 0
+    expected_answer = 0
+    false_abstain = 0
+    adversarial = 0
+    adversarial_correct = 0
+    answerable_with_keywords = 0
+    all_kw_found = 0
+    sum_confidence = 0.0
+    sum_latency = 0.0
+
+    for r in results:
+        if r.error is not None:
+            continue
+        valid += 1
+        decision_correct += r.decision_correct
+        sum_confidence += r.confidence
+        sum_latency += r.latency_ms
+        abstained = r.actual_decision == "abstain"
+        abstain_count += abstained
+
+        # Correct abstain / false answer: of expected-abstain cases, how many abstained
+        # and how many returned "answer" (clarify is NOT a false answer since it
+        # includes a caveat)
+        if r.expected_decision == "abstain":
+            expected_abstain += 1
+            correct_abstain += abstained
+            false_answers += r.actual_decision == "answer"
+        # False abstain: of expected-answer cases, how many abstained
+        elif r.expected_decision == "answer":
+            expected_answer += 1
+            false_abstain += abstained
+
+        if r.category == "adversarial":
+            adversarial += 1
+            adversarial_correct += r.decision_correct
+
+        # Answer quality: for non-abstain results with expected keywords,
+        # what fraction had ALL keywords found
+        if not abstained and r.expected_decision != "abstain" and r.expected_answer_contains:
+            answerable_with_keywords += 1
+            all_kw_found += not r.keywords_missing
 
     return {
         "total_cases": total,
-        "valid_cases": len(valid),
-        "decision_accuracy": decision_accuracy,
-        "abstain_rate": abstain_rate,
-        "correct_abstain_rate": correct_abstain_rate,
-        "false_abstain_rate": false_abstain_rate,
-        "false_answer_rate": false_answer_rate,
-        "adversarial_accuracy": adversarial_accuracy,
-        "answer_quality": answer_quality,
-        "avg_confidence": avg_confidence,
-        "avg_latency_ms": avg_latency,
-        "error_count": len(errors),
+        "valid_cases": valid,
+        "decision_accuracy": _ratio(decision_correct, valid),
+        "abstain_rate": _ratio(abstain_count, valid),
+        "correct_abstain_rate": _ratio(correct_abstain, expected_abstain),
+        "false_abstain_rate": _ratio(false_abstain, expected_answer),
+        "false_answer_rate": _ratio(false_answers, expected_abstain),
+        "adversarial_accuracy": _ratio(adversarial_correct, adversarial),
+        "answer_quality": _ratio(all_kw_found, answerable_with_keywords),
+        "avg_confidence": _ratio(sum_confidence, valid),
+        "avg_latency_ms": _ratio(sum_latency, valid),
+        "error_count": total - valid,
     }
 
 
@@ -128,25 +123,34 @@ def build_confusion_matrix(results: list[EvalCaseResult]) -> dict[str, dict[str,
 
 def compute_category_metrics(results: list[EvalCaseResult]) -> dict[str, dict]:
     """Compute per-category breakdowns of key metrics."""
-    valid = [r for r in results if r.error is None]
-    if not valid:
-        return {}
-
-    categories: dict[str, dict] = {}
-    sorted_results = sorted(valid, key=lambda r: r.category)
+    # Per category: [count, decision_correct, sum_confidence, sum_latency, abstain_count]
+    totals: dict[str, list] = {}
+    for r in results:
+        if r.error is not None:
+            continue
+        acc = totals.get(r.category)
+        if acc is None:
+            acc = totals[r.category] = [0, 0, 0.0, 0.0, 0]
+        acc[0] += 1
+        acc[1] += r.decision_correct
+        acc[2] += r.confidence
+        acc[3] += r.latency_ms
+        acc[4] += r.actual_decision == "abstain"
 
-    for cat, group in groupby(sorted_results, key=lambda r: r.category):
-        cat_results = list(group)
-        n = len(cat_results)
-        categories[cat] = {
+    return {
+        cat: {
             "count": n,
-            "decision_accuracy": sum(r.decision_correct for r in cat_results) / n,
-            "avg_confidence": sum(r.confidence for r in cat_results) / n,
-            "avg_latency_ms": sum(r.latency_ms for r in cat_results) / n,
-            "abstain_rate": sum(1 for r in cat_results if r.actual_decision == "abstain") / n,
+            "decision_accuracy": correct / n,
+            "avg_confidence": confidence / n,
+            "avg_latency_ms": latency / n,
+            "abstain_rate": abstains / n,
         }
+        for cat, (n, correct, confidence, latency, abstains) in sorted(totals.items())
+    }
+
 
-    return categories
+def _ratio(numerator: float, denominator: int) -> float:
+    return numerator / denominator if denominator else 0.0
 
 
 def _empty_metrics() -> dict:
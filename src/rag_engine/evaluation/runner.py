@@ -7,6 +7,7 @@ import json
 from pathlib import Path
 
 import httpx
+import orjson
 
 from rag_engine.evaluation.metrics import EvalCaseResult
 
@@ -26,6 +27,24 @@ def load_dataset(path: Path | None = None) -> list[dict]:
         return json.load(f)
 
 
+def load_checkpoint(path: Path) -> dict[str, EvalCaseResult]:
+    """Load completed results from a JSONL checkpoint, keyed by case_id."""
+    if not path.exists():
+        return {}
+    completed: dict[str, EvalCaseResult] = {}
+    with open(path, "rb") as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                result = EvalCaseResult(**orjson.loads(line))
+            except (orjson.JSONDecodeError, TypeError):
+                continue  # Torn write from an interrupted run
+            completed[result.case_id] = result
+    return completed
+
+
 async def run_single_case(
     client: httpx.AsyncClient,
     case: dict,
@@ -55,8 +74,10 @@ async def run_single_case(
 
             # Check keywords (case-insensitive substring match)
             answer_lower = actual_answer.lower()
-            found = [kw for kw in expected_keywords if kw.lower() in answer_lower]
-            missing = [kw for kw in expected_keywords if kw.lower() not in answer_lower]
+            found: list[str] = []
+            missing: list[str] = []
+            for kw in expected_keywords:
+                (found if kw.lower() in answer_lower else missing).append(kw)
 
             return EvalCaseResult(
                 case_id=case["id"],
@@ -98,40 +119,102 @@ async def run_single_case(
             )
 
 
+def create_client(
+    base_url: str = DEFAULT_BASE_URL,
+    timeout: float = DEFAULT_TIMEOUT,
+    concurrency: int = DEFAULT_CONCURRENCY,
+) -> httpx.AsyncClient:
+    """Create a pooled HTTP client sized for ``concurrency`` in-flight cases."""
+    return httpx.AsyncClient(
+        base_url=base_url,
+        timeout=httpx.Timeout(timeout),
+        limits=httpx.Limits(
+            max_connections=concurrency,
+            max_keepalive_connections=concurrency,
+        ),
+    )
+
+
 async def run_evaluation(
     base_url: str = DEFAULT_BASE_URL,
     dataset_path: Path | None = None,
     timeout: float = DEFAULT_TIMEOUT,
     concurrency: int = DEFAULT_CONCURRENCY,
+    client: httpx.AsyncClient | None = None,
+    checkpoint_path: Path | None = None,
 ) -> list[EvalCaseResult]:
     """Run the full evaluation suite against a live server.
 
     Loads the eval dataset, sends each query to the API, and returns
-    a list of EvalCaseResult objects with all metrics captured.
-    """
-    dataset = load_dataset(dataset_path)
-    semaphore = asyncio.Semaphore(concurrency)
+    a list of EvalCaseResult objects with all metrics captured. All cases
+    share one connection pool: pass ``client`` to reuse an existing one,
+    otherwise a client is created for the run.
 
-    async with httpx.AsyncClient(
-        base_url=base_url,
-        timeout=httpx.Timeout(timeout),
-    ) as client:
-        # Verify server is up
-        try:
-            health = await client.get("/health")
-            health.raise_for_status()
-            health_data = health.json()
-            print(
-                f"Server healthy: {health_data.get('doc_count', '?')} docs, "
-                f"{health_data.get('chunk_count', '?')} chunks"
+    With ``checkpoint_path``, each successful result is appended to that
+    JSONL file as it completes, and cases already recorded there are
+    skipped, so an interrupted run resumes where it stopped.
+    """
+    if client is None:
+        async with create_client(base_url, timeout, concurrency) as owned_client:
+            return await run_evaluation(
+                dataset_path=dataset_path,
+                concurrency=concurrency,
+                client=owned_client,
+                checkpoint_path=checkpoint_path,
             )
-        except Exception as e:
-            raise ConnectionError(
-                f"Cannot reach server at {base_url}/health — is the server running? Error: {e}"
-            ) from e
 
-        # Run all cases with bounded concurrency
-        tasks = [run_single_case(client, case, semaphore) for case in dataset]
-        results = await asyncio.gather(*tasks)
+    dataset = load_dataset(dataset_path)
+    semaphore = asyncio.Semaphore(concurrency)
 
-    return list(results)
+    # Verify server is up
+    try:
+        health = await client.get("/health")
+        health.raise_for_status()
+        health_data = health.json()
+        print(
+            f"Server healthy: {health_data.get('doc_count', '?')} docs, "
+            f"{health_data.get('chunk_count', '?')} chunks"
+        )
+    except Exception as e:
+        raise ConnectionError(
+            f"Cannot reach server at {client.base_url}/health — is the server running? Error: {e}"
+        ) from e
+
+    completed = load_checkpoint(checkpoint_path) if checkpoint_path else {}
+    pending = [case for case in dataset if case["id"] not in completed]
+    if completed:
+        print(f"Resuming from checkpoint: {len(completed)} done, {len(pending)} remaining")
+
+    if checkpoint_path:
+        checkpoint_path.parent.mkdir(parents=True, exist_ok=True)
+
+    # Opened off the event loop; each record is a small append flushed in place
+    checkpoint = await asyncio.to_thread(open, checkpoint_path, "ab") if checkpoint_path else None
+    try:
+
+        async def run_and_record(case: dict) -> None:
+            result = await run_single_case(client, case, semaphore)
+            completed[result.case_id] = result
+            # Errored cases are not recorded so a resumed run retries them
+            if checkpoint is not None and result.error is None:
+                checkpoint.write(
+                    orjson.dumps(result, default=str, option=orjson.OPT_APPEND_NEWLINE)
+                )
+                checkpoint.flush()
+
+        # A fixed pool of workers drains the shared iterator, so only `concurrency`
+        # case coroutines exist at a time however large the dataset is
+        cases = iter(pending)
+
+        async def worker() -> None:
+            for case in cases:
+                await run_and_record(case)
+
+        async with asyncio.TaskGroup() as tg:
+            for _ in range(min(concurrency, len(pending))):
+                tg.create_task(worker())
+    finally:
+        if checkpoint is not None:
+            checkpoint.close()
+
+    return [completed[case["id"]] for case in dataset]
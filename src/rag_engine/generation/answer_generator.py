@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import re
+from collections.abc import Iterable
 
 from rag_engine.generation.prompt_templates import (
     ANSWER_GENERATION_PROMPT,
@@ -20,6 +21,34 @@ from rag_engine.observability.logger import get_logger
 
 logger = get_logger("generation")
 
+_CITE_RE = re.compile(r"\[(\d+)\]")
+# Trailing characters kept between stream chunks so a marker split across two
+# chunks is still matched; longer than any realistic "[NN]" marker
+_CITE_TAIL_CHARS = 8
+
+
+def _resolve_citations(
+    markers: Iterable[str], evidence: list[RetrievalCandidate]
+) -> tuple[list, list[dict]]:
+    """Map citation markers to evidence chunks, deduplicated in first-cited order."""
+    seen: set[int] = set()
+    cited_chunks = []
+    cited_spans = []
+    for marker in markers:
+        idx = int(marker)
+        if idx in seen or not 1 <= idx <= len(evidence):
+            continue
+        seen.add(idx)
+        chunk = evidence[idx - 1].chunk
+        cited_chunks.append(chunk)
+        cited_spans.append(
+            {
+                "chunk_id": chunk.chunk_id,
+                "text": chunk.text[:200],
+            }
+        )
+    return cited_chunks, cited_spans
+
 
 class AnswerGenerator:
     def __init__(self, llm) -> None:
@@ -50,19 +79,7 @@ class AnswerGenerator:
         answer = await self._llm.generate(prompt, system=system)
 
         # Parse cited chunk references from answer
-        cited_indices = set(int(m) for m in re.findall(r"\[(\d+)\]", answer))
-        cited_chunks = []
-        cited_spans = []
-        for idx in sorted(cited_indices):
-            if 1 <= idx <= len(evidence):
-                chunk = evidence[idx - 1].chunk
-                cited_chunks.append(chunk)
-                cited_spans.append(
-                    {
-                        "chunk_id": chunk.chunk_id,
-                        "text": chunk.text[:200],
-                    }
-                )
+        cited_chunks, cited_spans = _resolve_citations(_CITE_RE.findall(answer), evidence)
 
         logger.info(
             "generated_answer",
@@ -75,6 +92,7 @@ class AnswerGenerator:
             answer=answer,
             cited_chunks=cited_chunks,
             cited_spans=cited_spans,
+            evidence_block=evidence_block,
         )
 
     async def generate_stream(
@@ -100,25 +118,19 @@ class AnswerGenerator:
 
         system = ANSWER_GENERATION_STRICT_SYSTEM if mode == "strict" else ANSWER_GENERATION_SYSTEM
 
-        full_answer = ""
+        # Citations are collected as chunks arrive, so no rescan of the full answer
+        parts: list[str] = []
+        markers: list[str] = []
+        tail = ""
         async for chunk in self._llm.generate_stream(prompt, system=system):
-            full_answer += chunk
+            parts.append(chunk)
+            window = tail + chunk
+            markers.extend(_CITE_RE.findall(window))
+            tail = window[-_CITE_TAIL_CHARS:]
             yield chunk, None
 
-        # Parse citations from full answer
-        cited_indices = set(int(m) for m in re.findall(r"\[(\d+)\]", full_answer))
-        cited_chunks = []
-        cited_spans = []
-        for idx in sorted(cited_indices):
-            if 1 <= idx <= len(evidence):
-                chunk = evidence[idx - 1].chunk
-                cited_chunks.append(chunk)
-                cited_spans.append(
-                    {
-                        "chunk_id": chunk.chunk_id,
-                        "text": chunk.text[:200],
-                    }
-                )
+        full_answer = "".join(parts)
+        cited_chunks, cited_spans = _resolve_citations(markers, evidence)
 
         logger.info(
             "generated_answer_stream",
@@ -133,5 +145,6 @@ class AnswerGenerator:
                 answer=full_answer,
                 cited_chunks=cited_chunks,
                 cited_spans=cited_spans,
+                evidence_block=evidence_block,
             ),
         )
@@ -13,11 +13,28 @@ from rag_engine.observability.logger import get_logger
 
 logger = get_logger("gemini")
 
+# Distinct configs kept before the cache is reset; calls use a handful of fixed
+# system prompts and schemas, so this is only a guard against unbounded growth
+_MAX_CACHED_CONFIGS = 256
+
 
 class GeminiProvider:
     def __init__(self, api_key: str, model: str = "gemini-2.0-flash") -> None:
         self._client = genai.Client(api_key=api_key)
         self._model = model
+        self._configs: dict[tuple, types.GenerateContentConfig] = {}
+
+    def _config(self, system: str | None, **options) -> types.GenerateContentConfig:
+        """Return a shared, never-mutated config for these options."""
+        key = (system, *sorted(options.items()))
+        config = self._configs.get(key)
+        if config is None:
+            if len(self._configs) >= _MAX_CACHED_CONFIGS:
+                self._configs.clear()
+            if system:
+                options["system_instruction"] = system
+            config = self._configs[key] = types.GenerateContentConfig(**options)
+        return config
 
     async def generate(
         self,
@@ -27,12 +44,7 @@ class GeminiProvider:
         max_tokens: int = 4096,
     ) -> str:
         try:
-            config = types.GenerateContentConfig(
-                temperature=temperature,
-                max_output_tokens=max_tokens,
-            )
-            if system:
-                config.system_instruction = system
+            config = self._config(system, temperature=temperature, max_output_tokens=max_tokens)
 
             response = await self._client.aio.models.generate_content(
                 model=self._model,
@@ -52,12 +64,7 @@ class GeminiProvider:
     ):
         """Yield text chunks from Gemini streaming API."""
         try:
-            config = types.GenerateContentConfig(
-                temperature=temperature,
-                max_output_tokens=max_tokens,
-            )
-            if system:
-                config.system_instruction = system
+            config = self._config(system, temperature=temperature, max_output_tokens=max_tokens)
 
             response = await self._client.aio.models.generate_content_stream(
                 model=self._model,
@@ -77,13 +84,12 @@ class GeminiProvider:
         system: str | None = None,
     ) -> BaseModel:
         try:
-            config = types.GenerateContentConfig(
+            config = self._config(
+                system,
                 temperature=0.0,
                 response_mime_type="application/json",
                 response_schema=response_schema,
             )
-            if system:
-                config.system_instruction = system
 
             response = await self._client.aio.models.generate_content(
                 model=self._model,
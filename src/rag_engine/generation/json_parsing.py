@@ -0,0 +1,31 @@
+"""Lenient JSON parsing for plain-text LLM responses."""
+
+from __future__ import annotations
+
+import json
+import re
+from typing import Any
+
+_FENCED_BLOCK = re.compile(r"```(?:json)?\s*(.*?)\s*```", re.DOTALL)
+
+
+def parse_llm_json(text: str) -> Any:
+    """Parse JSON from an LLM response, tolerating markdown code fences.
+
+    The common case of a single fence wrapping the whole response is handled
+    with prefix/suffix stripping; a regex search for a fenced block inside
+    surrounding prose is only tried if that fails to parse.
+
+    Returns the decoded JSON value; callers that expect an object must check it.
+    Raises json.JSONDecodeError (a ValueError) if no parseable JSON is found.
+    """
+    stripped = text.strip()
+    if stripped.startswith("```"):
+        stripped = stripped.removeprefix("```json").removeprefix("```").removesuffix("```").strip()
+    try:
+        return json.loads(stripped)
+    except json.JSONDecodeError:
+        match = _FENCED_BLOCK.search(text)
+        if match is None:
+            raise
+        return json.loads(match.group(1))
@@ -93,11 +93,13 @@ Provide a concise answer (1-3 sentences)."""
 
 def format_evidence_block(chunks: list, max_chunks: int = 10) -> str:
     """Format chunks as a numbered evidence block for prompts."""
-    lines = []
-    for i, chunk in enumerate(chunks[:max_chunks], 1):
-        text = chunk.text if hasattr(chunk, "text") else chunk.chunk.text
-        lines.append(f"[{i}] {text}")
-    return "\n\n".join(lines)
+    selected = chunks[:max_chunks]
+    if not selected:
+        return ""
+    # Lists are homogeneous (Chunks or RetrievalCandidates), so dispatch once
+    if not hasattr(selected[0], "text"):
+        selected = [c.chunk for c in selected]
+    return "\n\n".join(f"[{i}] {c.text}" for i, c in enumerate(selected, 1))
 
 
 def format_decomposition_context(sub_questions: list[str] | None, synthesis: str | None) -> str:
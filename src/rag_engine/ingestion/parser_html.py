@@ -13,8 +13,13 @@ class HTMLParser:
         return [".html", ".htm"]
 
     def parse(self, file_path: str | Path, metadata: dict) -> tuple[str, dict]:
-        file_path = Path(file_path)
-        html = file_path.read_text(encoding="utf-8")
+        return self.parse_bytes(Path(file_path).read_bytes(), metadata)
+
+    def parse_bytes(self, content: bytes, metadata: dict) -> tuple[str, dict]:
+        html = content.decode("utf-8")
+        # Universal newlines, as read_text() applied before parsing moved to bytes
+        if "\r" in html:
+            html = html.replace("\r\n", "\n").replace("\r", "\n")
         soup = BeautifulSoup(html, "html.parser")
 
         # Remove script, style, and nav elements
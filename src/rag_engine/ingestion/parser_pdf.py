@@ -4,6 +4,7 @@ from __future__ import annotations
 
 from pathlib import Path
 
+import pymupdf
 import pymupdf4llm
 
 
@@ -13,23 +14,27 @@ class PDFParser:
         return [".pdf"]
 
     def parse(self, file_path: str | Path, metadata: dict) -> tuple[str, dict]:
-        file_path = Path(file_path)
-        text = pymupdf4llm.to_markdown(str(file_path))
+        # Open once and hand the document to pymupdf4llm, rather than letting it
+        # open the file itself and reopening for metadata
+        return self._parse_document(pymupdf.open(str(Path(file_path))), metadata)
 
-        enriched = {**metadata}
-        # Extract basic PDF metadata
+    def parse_bytes(self, content: bytes, metadata: dict) -> tuple[str, dict]:
+        return self._parse_document(pymupdf.open(stream=content, filetype="pdf"), metadata)
+
+    def _parse_document(self, doc: pymupdf.Document, metadata: dict) -> tuple[str, dict]:
         try:
-            import pymupdf
-
-            doc = pymupdf.open(str(file_path))
-            pdf_meta = doc.metadata
-            if pdf_meta.get("title"):
-                enriched["title"] = pdf_meta["title"]
-            if pdf_meta.get("author"):
-                enriched["author"] = pdf_meta["author"]
-            enriched["page_count"] = doc.page_count
+            text = pymupdf4llm.to_markdown(doc)
+            enriched = self._enrich_metadata(doc, {**metadata})
+        finally:
             doc.close()
-        except Exception:
-            pass
-
         return text, enriched
+
+    @staticmethod
+    def _enrich_metadata(doc, enriched: dict) -> dict:
+        pdf_meta = doc.metadata or {}
+        if pdf_meta.get("title"):
+            enriched["title"] = pdf_meta["title"]
+        if pdf_meta.get("author"):
+            enriched["author"] = pdf_meta["author"]
+        enriched["page_count"] = doc.page_count
+        return enriched
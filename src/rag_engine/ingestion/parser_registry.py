@@ -2,8 +2,6 @@
 
 from __future__ import annotations
 
-from pathlib import Path
-
 from rag_engine.exceptions import ParsingError
 from rag_engine.ingestion.parser_html import HTMLParser
 from rag_engine.ingestion.parser_markdown import MarkdownParser
@@ -12,6 +10,19 @@ from rag_engine.ingestion.parser_text import TextParser
 from rag_engine.protocols.ingestion import FileParser
 
 
+def file_extension(filename: str) -> str:
+    """Lowercased extension including the dot, as Path(filename).suffix.lower() would give.
+
+    A plain string scan; this runs once per file on the ingest path.
+    """
+    name = filename[max(filename.rfind("/"), filename.rfind("\\")) + 1 :]
+    dot = name.rfind(".")
+    # A leading dot (".bashrc") or a trailing one ("file.") is not an extension
+    if dot <= 0 or dot == len(name) - 1:
+        return ""
+    return name[dot:].lower()
+
+
 class ParserRegistry:
     def __init__(self) -> None:
         self._parsers: dict[str, FileParser] = {}
@@ -20,7 +31,7 @@ class ParserRegistry:
         self._parsers[extension.lower()] = parser
 
     def get_parser(self, filename: str) -> FileParser:
-        ext = Path(filename).suffix.lower()
+        ext = file_extension(filename)
         parser = self._parsers.get(ext)
         if parser is None:
             raise ParsingError(
@@ -4,7 +4,10 @@ from __future__ import annotations
 
 from pathlib import Path
 
-from charset_normalizer import from_path
+from charset_normalizer import from_bytes
+
+# Bytes sampled for encoding detection when the content is not UTF-8
+DETECTION_SAMPLE_BYTES = 64 * 1024
 
 
 class TextParser:
@@ -13,9 +16,21 @@ class TextParser:
         return [".txt"]
 
     def parse(self, file_path: str | Path, metadata: dict) -> tuple[str, dict]:
-        file_path = Path(file_path)
-        result = from_path(file_path)
-        best = result.best()
-        text = str(best) if best else file_path.read_text(encoding="utf-8")
-        enriched = {**metadata, "encoding": str(best.encoding) if best else "utf-8"}
-        return text, enriched
+        return self.parse_bytes(Path(file_path).read_bytes(), metadata)
+
+    def parse_bytes(self, content: bytes, metadata: dict) -> tuple[str, dict]:
+        text, encoding = self._decode(content)
+        return text, {**metadata, "encoding": encoding}
+
+    @staticmethod
+    def _decode(content: bytes) -> tuple[str, str]:
+        # Most files are UTF-8: one strict decode, no detection pass
+        try:
+            return content.decode("utf-8-sig"), "utf-8"
+        except UnicodeDecodeError as e:
+            utf8_error = e
+        # Otherwise detect from a sample and decode the whole file once
+        best = from_bytes(content[:DETECTION_SAMPLE_BYTES]).best()
+        if best is None:
+            raise utf8_error
+        return content.decode(best.encoding, errors="replace"), str(best.encoding)
@@ -15,9 +15,10 @@ from rag_engine.chunking.quality import (
 )
 from rag_engine.chunking.structure_chunker import StructureChunker
 from rag_engine.protocols.embedder import Embedder
-from rag_engine.ingestion.parser_registry import ParserRegistry
+from rag_engine.exceptions import EmbeddingError
+from rag_engine.ingestion.parser_registry import ParserRegistry, file_extension
 from rag_engine.keyword_search.bm25_index import BM25Index
-from rag_engine.models.domain import Document
+from rag_engine.models.domain import Chunk, Document
 from rag_engine.models.schemas import IngestResponse
 from rag_engine.observability.logger import get_logger
 from rag_engine.storage.sqlite_doc_store import SQLiteDocStore
@@ -35,6 +36,7 @@ class IngestionPipeline:
         vector_store: FAISSVectorStore,
         bm25_index: BM25Index,
         doc_store: SQLiteDocStore,
+        quality_checks: bool = True,
     ) -> None:
         self._parser_registry = parser_registry
         self._chunker = chunker
@@ -42,61 +44,143 @@ class IngestionPipeline:
         self._vector_store = vector_store
         self._bm25_index = bm25_index
         self._doc_store = doc_store
+        self._quality_checks = quality_checks
 
     async def ingest_file(
         self, file_path: str | Path, metadata: dict | None = None
     ) -> IngestResponse:
+        doc_id, chunks, raw_text = await self._parse_and_chunk(file_path, metadata)
+        if chunks:
+            await self._embed_and_index(chunks, [(chunks, raw_text)])
+        return self._response(doc_id, chunks)
+
+    async def ingest_files(
+        self, file_paths: list[str | Path], metadata: dict | None = None
+    ) -> list[IngestResponse]:
+        """Ingest several files, updating and persisting the indexes once for the batch.
+
+        Files are parsed and chunked concurrently; their chunks then go through a
+        single embedding call, FAISS add, chunk write, BM25 add and persist.
+        """
+        prepared = await asyncio.gather(
+            *(self._parse_and_chunk(path, metadata) for path in file_paths)
+        )
+        all_chunks = [chunk for _, chunks, _ in prepared for chunk in chunks]
+        if all_chunks:
+            await self._embed_and_index(
+                all_chunks, [(chunks, raw_text) for _, chunks, raw_text in prepared if chunks]
+            )
+        return [self._response(doc_id, chunks) for doc_id, chunks, _ in prepared]
+
+    async def ingest_bytes(
+        self, content: bytes, filename: str, metadata: dict | None = None
+    ) -> IngestResponse:
+        """Ingest in-memory file content, choosing the parser by filename extension."""
+        # 1. Parse content
+        parser = self._parser_registry.get_parser(filename)
+        raw_text, enriched_metadata = await asyncio.to_thread(
+            parser.parse_bytes, content, metadata or {}
+        )
+        doc_id, chunks, raw_text = await self._save_and_chunk(
+            raw_text, enriched_metadata, filename, file_extension(filename)
+        )
+        if chunks:
+            await self._embed_and_index(chunks, [(chunks, raw_text)])
+        return self._response(doc_id, chunks)
+
+    async def _parse_and_chunk(
+        self, file_path: str | Path, metadata: dict | None
+    ) -> tuple[str, list[Chunk], str]:
         file_path = Path(file_path)
-        metadata = metadata or {}
-        doc_id = str(uuid4())
 
         # 1. Parse file
         parser = self._parser_registry.get_parser(file_path.name)
-        raw_text, enriched_metadata = await asyncio.to_thread(parser.parse, file_path, metadata)
-        logger.info("parsed", doc_id=doc_id, source=str(file_path), chars=len(raw_text))
+        raw_text, enriched_metadata = await asyncio.to_thread(
+            parser.parse, file_path, metadata or {}
+        )
+        return await self._save_and_chunk(
+            raw_text, enriched_metadata, str(file_path), file_path.suffix.lower()
+        )
+
+    async def _save_and_chunk(
+        self, raw_text: str, enriched_metadata: dict, source: str, content_type: str
+    ) -> tuple[str, list[Chunk], str]:
+        """Save the document and chunk it. Returns (doc_id, chunks, raw_text)."""
+        doc_id = str(uuid4())
+        logger.info("parsed", doc_id=doc_id, source=source, chars=len(raw_text))
 
         # 2. Create and save document
         doc = Document(
             doc_id=doc_id,
-            source=str(file_path),
-            content_type=file_path.suffix.lower(),
+            source=source,
+            content_type=content_type,
             metadata=enriched_metadata,
             raw_text=raw_text,
         )
-        await self._doc_store.save_document(doc)
+        # 3-4. Chunk text and drop garbage chunks in a thread while the document is saved
+        _, chunks = await asyncio.gather(
+            self._doc_store.save_document(doc),
+            asyncio.to_thread(
+                self._chunk_and_filter, raw_text, {"doc_id": doc_id, **enriched_metadata}
+            ),
+        )
+        return doc_id, chunks, raw_text
 
-        # 3. Chunk text
-        chunks = await asyncio.to_thread(
-            self._chunker.chunk, raw_text, {"doc_id": doc_id, **enriched_metadata}
+    async def _embed_and_index(
+        self, chunks: list[Chunk], sources: list[tuple[list[Chunk], str]]
+    ) -> None:
+        """Embed and index chunks; sources pairs each document's chunks with its text."""
+        # 5. Embed chunks straight into one preallocated (N, D) matrix. Vectors live only
+        # in FAISS, so Chunk.embedding is left unset. The quality diagnostics only log,
+        # so they run in threads alongside the embedding call
+        emb_array = np.empty((len(chunks), self._embedder.dimensions), dtype=np.float32)
+        checks = (
+            [asyncio.to_thread(_log_quality, doc_chunks, text) for doc_chunks, text in sources]
+            if self._quality_checks
+            else []
+        )
+        embedded, *_ = await asyncio.gather(
+            self._embedder.embed_texts([c.text for c in chunks], out=emb_array), *checks
+        )
+        # FAISS needs a C-contiguous float32 matrix. This is a no-op for embedders that
+        # filled out; one that returned its own array still gets indexed correctly
+        emb_array = np.ascontiguousarray(embedded, dtype=np.float32)
+        if emb_array.shape != (len(chunks), self._embedder.dimensions):
+            raise EmbeddingError(
+                f"Expected embeddings of shape {(len(chunks), self._embedder.dimensions)}, "
+                f"got {emb_array.shape}"
+            )
+
+        # 6-7. Add to FAISS, the chunk table and BM25 (only new text is tokenized);
+        # the three stores are independent
+        chunk_ids = [c.chunk_id for c in chunks]
+        await asyncio.gather(
+            self._vector_store.add_safe(chunk_ids, emb_array),
+            self._doc_store.save_chunks(chunks),
+            self._bm25_index.add(chunks),
         )
 
-        # 4. Quality checks
-        chunks = filter_garbage_chunks(chunks)
-        detect_near_duplicates(chunks)
-        compute_coverage(chunks, raw_text)
+        # 8. Persist indexes; ingests within the save window share one write
+        self._vector_store.schedule_save()
+        self._bm25_index.schedule_save()
 
+    async def flush(self) -> None:
+        """Write any scheduled index saves now; call before the process exits."""
+        await asyncio.gather(self._vector_store.flush_save(), self._bm25_index.flush_save())
+
+    @staticmethod
+    def _response(doc_id: str, chunks: list[Chunk]) -> IngestResponse:
         if not chunks:
             return IngestResponse(doc_id=doc_id, chunks_created=0, status="no_chunks")
+        logger.info("ingested", doc_id=doc_id, chunks=len(chunks))
+        return IngestResponse(doc_id=doc_id, chunks_created=len(chunks), status="indexed")
 
-        # 5. Embed chunks
-        texts = [c.text for c in chunks]
-        embeddings = await self._embedder.embed_texts(texts)
-        for chunk, emb in zip(chunks, embeddings):
-            chunk.embedding = emb
-
-        # 6. Add to FAISS index
-        emb_array = np.array(embeddings, dtype=np.float32)
-        chunk_ids = [c.chunk_id for c in chunks]
-        await self._vector_store.add_safe(chunk_ids, emb_array)
-
-        # 7. Rebuild BM25 index (includes all existing chunks + new ones)
-        await self._doc_store.save_chunks(chunks)
-        all_chunks = await self._doc_store.get_all_chunks()
-        await self._bm25_index.rebuild(all_chunks)
+    def _chunk_and_filter(self, raw_text: str, metadata: dict) -> list[Chunk]:
+        """Chunk text and remove garbage chunks (CPU-bound; run in a thread)."""
+        return filter_garbage_chunks(self._chunker.chunk(raw_text, metadata))
 
-        # 8. Persist indexes
-        await asyncio.to_thread(self._vector_store.save)
-        await asyncio.to_thread(self._bm25_index.save)
 
-        logger.info("ingested", doc_id=doc_id, chunks=len(chunks))
-        return IngestResponse(doc_id=doc_id, chunks_created=len(chunks), status="indexed")
+def _log_quality(chunks: list[Chunk], raw_text: str) -> None:
+    """Near-duplicate and coverage diagnostics; results are only logged."""
+    detect_near_duplicates(chunks)
+    compute_coverage(chunks, raw_text)
@@ -1,84 +1,226 @@
-"""BM25 keyword search index using rank_bm25."""
+"""BM25 keyword search index with incremental updates."""
 
 from __future__ import annotations
 
 import asyncio
+import multiprocessing
 import os
-import pickle
+import threading
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
 import numpy as np
-from rank_bm25 import BM25Okapi
+import orjson
 
+from rag_engine.keyword_search.okapi import IncrementalBM25
 from rag_engine.keyword_search.tokenizer import tokenize
 from rag_engine.models.domain import Chunk
 from rag_engine.observability.logger import get_logger
+from rag_engine.storage.debounce import DebouncedSave
 
 logger = get_logger("bm25_index")
 
+# Batches at least this large are tokenized in worker processes (tokenizing is
+# GIL-bound); below it, pool startup costs more than it saves
+PARALLEL_TOKENIZE_MIN_CHUNKS = 2000
+
+# Top-k results kept for recent queries; cleared whenever the corpus changes
+QUERY_CACHE_SIZE = 256
+
+# On-disk layout under index_path
+META_FILE = "meta.json"
+VOCAB_FILE = "vocab.txt"
+TOKENS_FILE = "tokens.npy"
+OFFSETS_FILE = "offsets.npy"
+
+
+def _tokenize_all(texts: list[str]) -> list[list[str]]:
+    workers = os.cpu_count() or 1
+    if len(texts) < PARALLEL_TOKENIZE_MIN_CHUNKS or workers < 2:
+        return [tokenize(t) for t in texts]
+    chunksize = max(64, len(texts) // (workers * 4))
+    # spawn, not fork: callers run in a worker thread of a multi-threaded process
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=workers, mp_context=context) as pool:
+        return list(pool.map(tokenize, texts, chunksize=chunksize))
+
+
+def _encode(vocab: dict[str, int], tokenized: list[list[str]]) -> tuple[np.ndarray, np.ndarray]:
+    """Map tokens to IDs, adding unseen ones to vocab. Returns (flat IDs, doc offsets)."""
+    offsets = np.zeros(len(tokenized) + 1, dtype=np.int64)
+    np.cumsum([len(tokens) for tokens in tokenized], out=offsets[1:])
+    token_ids = np.fromiter(
+        (vocab.setdefault(t, len(vocab)) for tokens in tokenized for t in tokens),
+        dtype=np.uint32,
+        count=int(offsets[-1]),
+    )
+    return token_ids, offsets
+
+
+def _write_replace(path: str, data: np.ndarray | bytes) -> None:
+    # A fresh file swapped in by rename: a loaded index may still be mapping the old one
+    tmp = path + ".tmp"
+    with open(tmp, "wb") as f:
+        if isinstance(data, np.ndarray):
+            np.save(f, data)
+        else:
+            f.write(data)
+    os.replace(tmp, path)
+
 
 class BM25Index:
     def __init__(self, index_path: str | None = None) -> None:
-        self._bm25: BM25Okapi | None = None
+        self._bm25 = IncrementalBM25()
         self._chunk_ids: list[str] = []
-        self._tokenized_corpus: list[list[str]] = []
+        # Token -> dense integer ID in first-seen order; the scorer only sees IDs
+        self._vocab: dict[str, int] = {}
+        # Flat token-ID arrays, one per build/add/load, kept so save() can write the corpus
+        self._token_parts: list[np.ndarray] = []
         self._index_path = index_path
         self._write_lock = asyncio.Lock()
+        # Searches run in worker threads; this keeps them from seeing a half-applied add
+        self._state_lock = threading.Lock()
+        # (token tuple, top_k) -> search results; guarded by _state_lock
+        self._result_cache: OrderedDict[tuple[tuple[str, ...], int], list[tuple[str, float]]] = (
+            OrderedDict()
+        )
+        self._saver = DebouncedSave(lambda: asyncio.to_thread(self.save))
 
         if index_path:
             self._try_load(index_path)
 
     def _try_load(self, path: str) -> None:
-        index_file = os.path.join(path, "bm25.pkl")
-        if os.path.exists(index_file):
-            with open(index_file, "rb") as f:
-                data = pickle.load(f)
-            self._bm25 = data["bm25"]
-            self._chunk_ids = data["chunk_ids"]
-            self._tokenized_corpus = data["tokenized_corpus"]
-            logger.info("bm25_loaded", size=len(self._chunk_ids), path=path)
+        meta_file = os.path.join(path, META_FILE)
+        if not os.path.exists(meta_file):
+            if os.path.exists(os.path.join(path, "bm25.pkl")):
+                # Written by an older version as a pickle; starting empty makes the
+                # app rebuild the index from the document store
+                logger.warning("bm25_load_incompatible", path=path)
+            return
+        with open(meta_file, "rb") as f:
+            meta = orjson.loads(f.read())
+        # Memory-mapped: pages are read as the postings are built, never copied whole
+        token_ids = np.load(os.path.join(path, TOKENS_FILE), mmap_mode="r")
+        offsets = np.load(os.path.join(path, OFFSETS_FILE), mmap_mode="r")
+        if len(offsets) != len(meta["chunk_ids"]) + 1:
+            logger.warning("bm25_load_inconsistent", path=path)
+            return
+        words = Path(path, VOCAB_FILE).read_text(encoding="utf-8")
+
+        self._bm25 = IncrementalBM25(**meta["params"])
+        self._bm25.add_documents(token_ids, offsets)
+        self._chunk_ids = meta["chunk_ids"]
+        self._vocab = {word: i for i, word in enumerate(words.split("\n") if words else [])}
+        self._token_parts = [token_ids]
+        logger.info("bm25_loaded", size=len(self._chunk_ids), path=path)
 
     def build(self, chunks: list[Chunk]) -> None:
         """Build the BM25 index from a list of chunks. Replaces existing index."""
-        self._chunk_ids = [c.chunk_id for c in chunks]
-        self._tokenized_corpus = [tokenize(c.text) for c in chunks]
-        if self._tokenized_corpus:
-            self._bm25 = BM25Okapi(self._tokenized_corpus)
-        else:
-            self._bm25 = None
-        logger.info("bm25_built", size=len(self._chunk_ids))
+        chunk_ids = [c.chunk_id for c in chunks]
+        vocab: dict[str, int] = {}
+        token_ids, offsets = _encode(vocab, _tokenize_all([c.text for c in chunks]))
+        bm25 = IncrementalBM25()
+        bm25.add_documents(token_ids, offsets)
+        with self._state_lock:
+            self._bm25 = bm25
+            self._chunk_ids = chunk_ids
+            self._vocab = vocab
+            self._token_parts = [token_ids]
+            self._result_cache.clear()
+        logger.info("bm25_built", size=len(chunk_ids))
+
+    def add_documents(self, chunks: list[Chunk]) -> None:
+        """Index new chunks on top of the existing ones; only the new text is tokenized."""
+        tokenized = _tokenize_all([c.text for c in chunks])
+        with self._state_lock:
+            token_ids, offsets = _encode(self._vocab, tokenized)
+            self._bm25.add_documents(token_ids, offsets)
+            self._chunk_ids.extend(c.chunk_id for c in chunks)
+            self._token_parts.append(token_ids)
+            self._result_cache.clear()
+        logger.info("bm25_added", added=len(chunks), size=len(self._chunk_ids))
 
     async def rebuild(self, chunks: list[Chunk]) -> None:
         """Thread-safe rebuild of the BM25 index."""
         async with self._write_lock:
             await asyncio.to_thread(self.build, chunks)
 
+    async def add(self, chunks: list[Chunk]) -> None:
+        """Thread-safe incremental add of new chunks."""
+        async with self._write_lock:
+            await asyncio.to_thread(self.add_documents, chunks)
+
     def search(self, query: str, top_k: int = 50) -> list[tuple[str, float]]:
         """Search the BM25 index. Returns list of (chunk_id, score)."""
-        if self._bm25 is None or not self._chunk_ids:
+        if not self._chunk_ids:
             return []
         tokenized_query = tokenize(query)
         if not tokenized_query:
             return []
-        scores = self._bm25.get_scores(tokenized_query)
-        top_indices = np.argsort(scores)[::-1][:top_k]
-        return [(self._chunk_ids[i], float(scores[i])) for i in top_indices if scores[i] > 0]
+        key = (tuple(tokenized_query), top_k)
+        with self._state_lock:
+            results = self._result_cache.get(key)
+            if results is not None:
+                self._result_cache.move_to_end(key)
+                return list(results)
+            vocab = self._vocab
+            # Tokens never seen in the corpus score nothing
+            query_ids = [vocab[t] for t in tokenized_query if t in vocab]
+            scores = self._bm25.get_scores(query_ids).astype(np.float32)
+            results = self._top_k(scores, self._chunk_ids, top_k)
+            self._result_cache[key] = results
+            if len(self._result_cache) > QUERY_CACHE_SIZE:
+                self._result_cache.popitem(last=False)
+        # Callers get their own list; the cached one stays unchanged
+        return list(results)
+
+    @staticmethod
+    def _top_k(scores: np.ndarray, chunk_ids: list[str], top_k: int) -> list[tuple[str, float]]:
+        k = min(top_k, len(scores))
+        if k <= 0:
+            return []
+        # Partial selection is O(N); only the k winners are sorted
+        top_indices = np.argpartition(scores, -k)[-k:]
+        top_indices = top_indices[np.argsort(scores[top_indices])[::-1]]
+        return [(chunk_ids[i], float(scores[i])) for i in top_indices if scores[i] > 0]
 
     def save(self, path: str | None = None) -> None:
+        """Persist as token IDs (tokens.npy, split per chunk by offsets.npy), the
+        ID -> token vocabulary (vocab.txt) and chunk IDs plus parameters (meta.json)."""
         path = path or self._index_path
         if not path:
             return
+        with self._state_lock:
+            # Chunks, parts and vocab are only ever appended, so copies are a consistent snapshot
+            chunk_ids = list(self._chunk_ids)
+            parts = list(self._token_parts)
+            words = list(self._vocab)
+            doc_lengths = self._bm25.doc_lengths
+            params = self._bm25.params
+
+        offsets = np.zeros(len(doc_lengths) + 1, dtype=np.int64)
+        np.cumsum(doc_lengths, out=offsets[1:])
+        token_ids = np.concatenate(parts) if parts else np.empty(0, dtype=np.uint32)
+
         Path(path).mkdir(parents=True, exist_ok=True)
-        with open(os.path.join(path, "bm25.pkl"), "wb") as f:
-            pickle.dump(
-                {
-                    "bm25": self._bm25,
-                    "chunk_ids": self._chunk_ids,
-                    "tokenized_corpus": self._tokenized_corpus,
-                },
-                f,
-            )
-        logger.info("bm25_saved", path=path, size=len(self._chunk_ids))
+        _write_replace(os.path.join(path, TOKENS_FILE), token_ids)
+        _write_replace(os.path.join(path, OFFSETS_FILE), offsets)
+        # Tokens never contain whitespace, so one per line is unambiguous
+        _write_replace(os.path.join(path, VOCAB_FILE), "\n".join(words).encode("utf-8"))
+        # Written last: its presence marks a complete save
+        _write_replace(
+            os.path.join(path, META_FILE), orjson.dumps({"chunk_ids": chunk_ids, "params": params})
+        )
+        logger.info("bm25_saved", path=path, size=len(chunk_ids))
+
+    def schedule_save(self) -> None:
+        """Persist soon; saves requested in quick succession are written once."""
+        self._saver.schedule()
+
+    async def flush_save(self) -> None:
+        """Write any scheduled save now and wait for it."""
+        await self._saver.flush()
 
     @property
     def size(self) -> int:
@@ -0,0 +1,141 @@
+"""Incremental Okapi BM25 scorer over an inverted index of integer term IDs."""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+
+import numpy as np
+
+# Same defaults as rank_bm25.BM25Okapi, so scores match the previous index
+K1 = 1.5
+B = 0.75
+EPSILON = 0.25
+
+
+class IncrementalBM25:
+    """Okapi BM25 that accepts new documents without rebuilding.
+
+    Terms are integer IDs assigned by the caller. Postings are stored term-major in
+    CSR form: the documents containing term t are docs[indptr[t]:indptr[t + 1]], with
+    their term frequencies at the same positions in tf. Added documents are counted
+    with NumPy and queued as (term, doc, tf) triples; they are merged into the CSR
+    arrays on the next scoring call.
+
+    Between adds every posting's BM25 contribution is fixed, so it is computed once
+    per corpus change into a weights array parallel to docs; a query then only sums
+    the weights of its terms' postings per document.
+    """
+
+    def __init__(self, k1: float = K1, b: float = B, epsilon: float = EPSILON) -> None:
+        self._k1 = k1
+        self._b = b
+        self._epsilon = epsilon
+        self._indptr = np.zeros(1, dtype=np.int64)
+        self._docs = np.empty(0, dtype=np.int32)
+        self._tf = np.empty(0, dtype=np.int32)
+        self._doc_len = np.empty(0, dtype=np.int64)
+        self._pending: list[tuple[np.ndarray, np.ndarray, np.ndarray]] = []
+        # Per-posting BM25 contributions; None when stale
+        self._weights: np.ndarray | None = None
+
+    @property
+    def corpus_size(self) -> int:
+        return len(self._doc_len)
+
+    @property
+    def params(self) -> dict[str, float]:
+        return {"k1": self._k1, "b": self._b, "epsilon": self._epsilon}
+
+    @property
+    def doc_lengths(self) -> np.ndarray:
+        return self._doc_len
+
+    def add_documents(self, token_ids: np.ndarray, offsets: np.ndarray) -> None:
+        """Append documents given as one flat term-ID array split by offsets
+        (len(documents) + 1 boundaries); their indices continue from corpus_size."""
+        doc_len = np.diff(np.asarray(offsets, dtype=np.int64))
+        first_doc = self.corpus_size
+        n_docs = first_doc + len(doc_len)
+        if len(token_ids):
+            # One key per (term, doc) occurrence; unique() both counts them and sorts
+            # by term, then doc
+            docs = np.repeat(np.arange(first_doc, n_docs, dtype=np.int64), doc_len)
+            keys, tf = np.unique(
+                np.asarray(token_ids, dtype=np.int64) * n_docs + docs, return_counts=True
+            )
+            self._pending.append(
+                (keys // n_docs, (keys % n_docs).astype(np.int32), tf.astype(np.int32))
+            )
+        self._doc_len = np.concatenate([self._doc_len, doc_len])
+        self._weights = None
+
+    def get_scores(self, query_ids: Iterable[int]) -> np.ndarray:
+        """Return one BM25 score per document, in insertion order."""
+        if self._pending:
+            self._merge_pending()
+        weights = self._weights if self._weights is not None else self._compute_weights()
+        indptr = self._indptr
+        n_terms = len(indptr) - 1
+        # A repeated query term counts once per occurrence, as in BM25Okapi
+        slices = [slice(indptr[t], indptr[t + 1]) for t in query_ids if 0 <= t < n_terms]
+        if not slices:
+            return np.zeros(self.corpus_size)
+        docs = np.concatenate([self._docs[s] for s in slices])
+        return np.bincount(
+            docs,
+            weights=np.concatenate([weights[s] for s in slices]),
+            minlength=self.corpus_size,
+        )
+
+    def _merge_pending(self) -> None:
+        terms = np.concatenate([p[0] for p in self._pending])
+        docs = np.concatenate([p[1] for p in self._pending])
+        tf = np.concatenate([p[2] for p in self._pending])
+        self._pending = []
+        # Stable, so each term's documents stay in insertion order
+        order = np.argsort(terms, kind="stable")
+        terms, docs, tf = terms[order], docs[order], tf[order]
+
+        old_indptr = self._indptr
+        n_terms = max(len(old_indptr) - 1, int(terms[-1]) + 1)
+        # old_end[t + 1]: existing postings of terms <= t
+        old_end = np.full(n_terms + 1, old_indptr[-1], dtype=np.int64)
+        old_end[: len(old_indptr)] = old_indptr
+        old_counts = np.diff(old_end)
+        new_counts = np.bincount(terms, minlength=n_terms)
+        new_start = np.zeros(n_terms + 1, dtype=np.int64)
+        np.cumsum(new_counts, out=new_start[1:])
+        indptr = np.zeros(n_terms + 1, dtype=np.int64)
+        np.cumsum(old_counts + new_counts, out=indptr[1:])
+
+        # Within a term, existing postings come first (their documents are older).
+        # An existing posting shifts right by the new postings of smaller terms; a new
+        # one lands after every existing posting of its own and smaller terms.
+        old_terms = np.repeat(np.arange(n_terms), old_counts)
+        old_pos = np.arange(len(old_terms)) + new_start[old_terms]
+        new_pos = np.arange(len(terms)) + old_end[terms + 1]
+        merged_docs = np.empty(indptr[-1], dtype=np.int32)
+        merged_tf = np.empty(indptr[-1], dtype=np.int32)
+        merged_docs[old_pos] = self._docs
+        merged_tf[old_pos] = self._tf
+        merged_docs[new_pos] = docs
+        merged_tf[new_pos] = tf
+        self._indptr, self._docs, self._tf = indptr, merged_docs, merged_tf
+
+    def _compute_weights(self) -> np.ndarray:
+        # Negative IDFs (terms in more than half the corpus) are floored at
+        # epsilon * mean IDF, as in BM25Okapi
+        df = np.diff(self._indptr)
+        idf = np.log(self.corpus_size - df + 0.5) - np.log(df + 0.5)
+        present = df > 0
+        if present.any():
+            idf[present & (idf < 0)] = self._epsilon * idf[present].mean()
+
+        doc_len = self._doc_len.astype(np.float64)
+        avgdl = doc_len.mean() if doc_len.any() else 1.0
+        length_norm = self._k1 * (1 - self._b + self._b * doc_len / avgdl)
+        tf = self._tf.astype(np.float64)
+        term_idf = np.repeat(idf, df)
+        weights = term_idf * (tf * (self._k1 + 1) / (tf + length_norm[self._docs]))
+        self._weights = weights.astype(np.float32)
+        return self._weights
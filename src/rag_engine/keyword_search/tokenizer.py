@@ -6,10 +6,20 @@ import re
 
 from rag_engine.config.constants import STOPWORDS
 
+_PUNCT_RE = re.compile(r"[^\w\s]")
+
+# ASCII fast path: bytes.translate maps every non-word, non-space byte to a space,
+# matching _PUNCT_RE.sub(" ", ...) without the per-character regex engine
+_ASCII_PUNCT_TO_SPACE = bytes(
+    c if chr(c).isalnum() or chr(c).isspace() or c == ord("_") else ord(" ") for c in range(256)
+)
+
 
 def tokenize(text: str) -> list[str]:
     """Tokenize text for BM25: lowercase, strip punctuation, remove stopwords."""
     text = text.lower()
-    text = re.sub(r"[^\w\s]", " ", text)
-    tokens = text.split()
-    return [t for t in tokens if t not in STOPWORDS and len(t) > 1]
+    if text.isascii():
+        tokens = text.encode("ascii").translate(_ASCII_PUNCT_TO_SPACE).decode("ascii").split()
+    else:
+        tokens = _PUNCT_RE.sub(" ", text).split()
+    return [t for t in tokens if len(t) > 1 and t not in STOPWORDS]
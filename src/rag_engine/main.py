@@ -1,13 +1,85 @@
-"""Entrypoint: run the RAG Reliability Engine server."""
+"""Entrypoint: run the RAG Reliability Engine server, or bulk-ingest a directory."""
+
+import argparse
+import asyncio
+from pathlib import Path
 
 import uvicorn
 
 from rag_engine.api.app import create_app
+from rag_engine.chunking.structure_chunker import StructureChunker
 from rag_engine.config.settings import Settings
+from rag_engine.embeddings.openai_embedder import OpenAIEmbedder
+from rag_engine.ingestion.parser_registry import create_default_registry
+from rag_engine.ingestion.pipeline import IngestionPipeline
+from rag_engine.keyword_search.bm25_index import BM25Index
+from rag_engine.storage.sqlite_doc_store import SQLiteDocStore
+from rag_engine.vectorstore.faiss_store import FAISSVectorStore
+
+
+async def ingest_dir(directory: Path, settings: Settings) -> None:
+    """Ingest every supported file under directory as one batch, updating the indexes once."""
+    registry = create_default_registry()
+    extensions = set(registry.supported_types())
+    paths = sorted(
+        p for p in directory.rglob("*") if p.is_file() and p.suffix.lower() in extensions
+    )
+    if not paths:
+        print(f"No supported files found in {directory}")
+        return
+
+    Path(settings.sqlite_doc_db_path).parent.mkdir(parents=True, exist_ok=True)
+    doc_store = SQLiteDocStore(settings.sqlite_doc_db_path)
+    await doc_store.initialize()
+    try:
+        bm25_index = BM25Index(index_path=settings.bm25_index_path)
+        # New chunks are only added incrementally; an empty or unreadable index must
+        # first be rebuilt from the stored chunks, or their keyword entries are lost
+        if bm25_index.size == 0 and await doc_store.count_chunks() > 0:
+            await bm25_index.rebuild(await doc_store.get_all_chunks())
+        pipeline = IngestionPipeline(
+            parser_registry=registry,
+            chunker=StructureChunker(
+                max_tokens=settings.chunk_max_tokens,
+                overlap_pct=settings.chunk_overlap_pct,
+            ),
+            embedder=OpenAIEmbedder(
+                api_key=settings.openai_api_key,
+                model=settings.embedding_model,
+                max_concurrency=settings.embedding_max_concurrency,
+            ),
+            vector_store=FAISSVectorStore(
+                dimensions=settings.embedding_dimensions,
+                index_path=settings.faiss_index_path,
+            ),
+            bm25_index=bm25_index,
+            doc_store=doc_store,
+            quality_checks=settings.ingest_quality_checks,
+        )
+        try:
+            results = await pipeline.ingest_files(paths)
+        finally:
+            await pipeline.flush()
+    finally:
+        await doc_store.close()
+
+    for path, result in zip(paths, results):
+        print(f"Ingested {path}: {result.chunks_created} chunks")
 
 
 def main() -> None:
+    parser = argparse.ArgumentParser(description="RAG Reliability Engine")
+    parser.add_argument(
+        "--ingest-dir",
+        type=Path,
+        help="ingest all supported files in this directory, then exit instead of serving",
+    )
+    args = parser.parse_args()
+
     settings = Settings()
+    if args.ingest_dir is not None:
+        asyncio.run(ingest_dir(args.ingest_dir, settings))
+        return
     app = create_app()
     uvicorn.run(app, host=settings.host, port=settings.port)
 
@@ -5,6 +5,8 @@ from __future__ import annotations
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 
+import numpy as np
+
 
 @dataclass
 class Document:
@@ -24,7 +26,7 @@ class Chunk:
     index: int
     metadata: dict
     token_count: int
-    embedding: list[float] | None = None
+    embedding: np.ndarray | None = None
 
 
 @dataclass
@@ -62,6 +64,7 @@ class GenerationResult:
     answer: str
     cited_chunks: list[Chunk]
     cited_spans: list[dict]  # {chunk_id, text}
+    evidence_block: str | None = None  # formatted prompt evidence, reused by verification
 
 
 @dataclass
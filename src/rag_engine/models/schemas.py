@@ -52,3 +52,4 @@ class HealthResponse(BaseModel):
     doc_count: int
     chunk_count: int
     index_size: int
+    bm25_ready: bool = True
@@ -3,23 +3,30 @@
 from __future__ import annotations
 
 import asyncio
+import re
 import time
 from collections.abc import AsyncGenerator
 from typing import Literal
 
 from rag_engine.config.settings import Settings
 from rag_engine.generation.answer_generator import AnswerGenerator
-from rag_engine.models.domain import GenerationResult, RetrievalCandidate
+from rag_engine.models.domain import (
+    DecomposedQuery,
+    GenerationResult,
+    ProcessedQuery,
+    RetrievalCandidate,
+    Trace,
+)
 from rag_engine.models.schemas import Citation, DebugInfo, QueryRequest
 from rag_engine.models.schemas import QueryResponse as QueryResponseSchema
 from rag_engine.observability.logger import get_logger
 from rag_engine.observability.metrics import log_generation_metrics, log_retrieval_metrics
 from rag_engine.observability.tracing import TraceContext
+from rag_engine.protocols.reranker import Reranker
 from rag_engine.query.decomposition import QueryDecomposer
 from rag_engine.query.understanding import QueryUnderstanding
 from rag_engine.retrieval.fallback import FallbackManager
 from rag_engine.retrieval.hybrid_retriever import HybridRetrieverImpl
-from rag_engine.retrieval.reranker_cross_encoder import CrossEncoderReranker
 from rag_engine.scoring.confidence import ConfidenceScorer
 from rag_engine.scoring.reason_codes import ReasonCode
 from rag_engine.scoring.retrieval_quality import RetrievalQualityScorer
@@ -31,6 +38,38 @@ from rag_engine.verification.self_consistency import SelfConsistencyChecker
 
 logger = get_logger("query_pipeline")
 
+# Traces waiting for the background writer; beyond this, new traces are dropped
+TRACE_QUEUE_SIZE = 10_000
+# Traces written per SQLite transaction
+TRACE_BATCH_SIZE = 64
+
+# Full refusal patterns that unambiguously indicate the LLM can't answer
+_REFUSAL_PATTERNS = [
+    "do not contain information",
+    "does not contain information",
+    "do not contain the answer",
+    "does not contain the answer",
+    "do not contain the necessary",
+    "do not contain the coordinates",
+    "don't contain information",
+    "doesn't contain information",
+    "cannot answer the question",
+    "cannot answer this question",
+    "unable to answer",
+    "i cannot provide an answer",
+    "i am unable to",
+    "no relevant information",
+    "outside the scope of",
+    "is not discussed in",
+    "are not discussed in",
+    "not contain any information",
+    "do not address",
+    "does not address",
+    "not provided in the evidence",
+]
+# One alternation scans the answer once instead of once per phrase
+_REFUSAL_RE = re.compile("|".join(map(re.escape, _REFUSAL_PATTERNS)))
+
 
 class QueryPipeline:
     def __init__(
@@ -38,7 +77,7 @@ class QueryPipeline:
         query_understanding: QueryUnderstanding,
         decomposer: QueryDecomposer,
         hybrid_retriever: HybridRetrieverImpl,
-        reranker: CrossEncoderReranker,
+        reranker: Reranker,
         rq_scorer: RetrievalQualityScorer,
         fallback_manager: FallbackManager,
         answer_generator: AnswerGenerator,
@@ -64,40 +103,25 @@ class QueryPipeline:
         self._confidence = confidence_scorer
         self._trace_store = trace_store
         self._settings = settings
+        self._retrieval_semaphore = asyncio.Semaphore(settings.retrieval_concurrency_limit)
+        self._trace_queue: asyncio.Queue[Trace] | None = None
+        self._trace_writer: asyncio.Task | None = None
 
     async def execute(self, request: QueryRequest) -> QueryResponseSchema:
         trace = TraceContext()
         deadline = time.monotonic() + request.latency_budget_ms / 1000
 
-        # STEP 1: Query Understanding
-        with trace.span("query_understanding"):
-            processed = await self._qu.process(request.query)
-
-        # STEP 2: Query Decomposition
-        with trace.span("decomposition"):
-            decomposed = await self._decomposer.decompose(processed.normalized)
+        # STEPS 1-2: Query Understanding and Decomposition (concurrently)
+        processed, decomposed = await self._understand_and_decompose(request.query, trace)
 
         # STEP 3: Hybrid Retrieval (for each sub-question)
-        all_candidates: list[RetrievalCandidate] = []
         with trace.span("retrieval"):
-            for sq in decomposed.sub_questions:
-                candidates = await self._retriever.retrieve(
-                    sq,
-                    top_k_bm25=self._settings.bm25_top_k,
-                    top_k_vector=self._settings.vector_top_k,
-                )
-                all_candidates.extend(candidates)
-            all_candidates = self._deduplicate(all_candidates)
+            all_candidates = await self._retrieve_all(decomposed.sub_questions)
 
-        # STEP 4: Reranking
-        with trace.span("reranking"):
-            reranked = await self._reranker.rerank(
-                processed.normalized, all_candidates, top_n=self._settings.rerank_top_n
-            )
-
-        # STEP 5: Retrieval Quality Assessment
-        with trace.span("rq_scoring"):
-            rq_score, rq_reasons = self._rq_scorer.score(reranked)
+        # STEPS 4-5: Reranking and Retrieval Quality Assessment
+        reranked, rq_score, rq_reasons = await self._rerank_and_score(
+            processed.normalized, all_candidates, trace
+        )
 
         log_retrieval_metrics(
             trace.trace_id,
@@ -160,15 +184,22 @@ class QueryPipeline:
             remaining_ms = (deadline - time.monotonic()) * 1000
             evidence_chunks = [c.chunk for c in reranked]
 
+            # Same chunks the generator formatted, so its evidence block is reused
+            evidence_block = gen_result.evidence_block
+
             groundedness_score, contradiction_rate = await asyncio.gather(
-                self._groundedness.check(gen_result.answer, evidence_chunks, processed.normalized),
-                self._contradiction.detect_answer_conflicts(gen_result.answer, evidence_chunks),
+                self._groundedness.check(
+                    gen_result.answer, evidence_chunks, processed.normalized, evidence_block
+                ),
+                self._contradiction.detect_answer_conflicts(
+                    gen_result.answer, evidence_chunks, evidence_block
+                ),
             )
 
             sc_score = None
             if remaining_ms > 1500:
                 sc_score = await self._self_consistency.check(
-                    processed.normalized, evidence_chunks, gen_result.answer
+                    processed.normalized, evidence_chunks, gen_result.answer, evidence_block
                 )
 
             verification = self._verification.decide(
@@ -224,7 +255,7 @@ class QueryPipeline:
             ),
         )
 
-        # Save trace (fire and forget)
+        # Save trace (queued for the background writer)
         trace_obj = trace.to_trace(
             query=request.query,
             rq_score=rq_score,
@@ -232,7 +263,7 @@ class QueryPipeline:
             decision=decision,
             reason_codes=[str(r) for r in all_reasons],
         )
-        asyncio.create_task(self._trace_store.save_trace(trace_obj))
+        self._record_trace(trace_obj)
 
         return response
 
@@ -246,30 +277,14 @@ class QueryPipeline:
         deadline = time.monotonic() + request.latency_budget_ms / 1000
 
         # STEPS 1-6: Same as execute() — non-streaming
-        with trace.span("query_understanding"):
-            processed = await self._qu.process(request.query)
-
-        with trace.span("decomposition"):
-            decomposed = await self._decomposer.decompose(processed.normalized)
+        processed, decomposed = await self._understand_and_decompose(request.query, trace)
 
-        all_candidates: list[RetrievalCandidate] = []
         with trace.span("retrieval"):
-            for sq in decomposed.sub_questions:
-                candidates = await self._retriever.retrieve(
-                    sq,
-                    top_k_bm25=self._settings.bm25_top_k,
-                    top_k_vector=self._settings.vector_top_k,
-                )
-                all_candidates.extend(candidates)
-            all_candidates = self._deduplicate(all_candidates)
-
-        with trace.span("reranking"):
-            reranked = await self._reranker.rerank(
-                processed.normalized, all_candidates, top_n=self._settings.rerank_top_n
-            )
+            all_candidates = await self._retrieve_all(decomposed.sub_questions)
 
-        with trace.span("rq_scoring"):
-            rq_score, rq_reasons = self._rq_scorer.score(reranked)
+        reranked, rq_score, rq_reasons = await self._rerank_and_score(
+            processed.normalized, all_candidates, trace
+        )
 
         log_retrieval_metrics(
             trace.trace_id,
@@ -340,15 +355,22 @@ class QueryPipeline:
             remaining_ms = (deadline - time.monotonic()) * 1000
             evidence_chunks = [c.chunk for c in reranked]
 
+            # Same chunks the generator formatted, so its evidence block is reused
+            evidence_block = gen_result.evidence_block
+
             groundedness_score, contradiction_rate = await asyncio.gather(
-                self._groundedness.check(gen_result.answer, evidence_chunks, processed.normalized),
-                self._contradiction.detect_answer_conflicts(gen_result.answer, evidence_chunks),
+                self._groundedness.check(
+                    gen_result.answer, evidence_chunks, processed.normalized, evidence_block
+                ),
+                self._contradiction.detect_answer_conflicts(
+                    gen_result.answer, evidence_chunks, evidence_block
+                ),
             )
 
             sc_score = None
             if remaining_ms > 1500:
                 sc_score = await self._self_consistency.check(
-                    processed.normalized, evidence_chunks, gen_result.answer
+                    processed.normalized, evidence_chunks, gen_result.answer, evidence_block
                 )
 
             verification = self._verification.decide(
@@ -397,7 +419,7 @@ class QueryPipeline:
             decision=decision,
             reason_codes=[str(r) for r in all_reasons],
         )
-        asyncio.create_task(self._trace_store.save_trace(trace_obj))
+        self._record_trace(trace_obj)
 
         yield {"event": "metadata", "data": metadata.model_dump_json()}
         yield {"event": "done", "data": ""}
@@ -416,7 +438,7 @@ class QueryPipeline:
             decision="abstain",
             reason_codes=[str(r) for r in reasons],
         )
-        asyncio.create_task(self._trace_store.save_trace(trace_obj))
+        self._record_trace(trace_obj)
 
         return QueryResponseSchema(
             answer="I cannot provide a reliable answer. The retrieved evidence is insufficient for this question.",
@@ -454,7 +476,7 @@ class QueryPipeline:
             decision="clarify",
             reason_codes=[str(r) for r in reasons],
         )
-        asyncio.create_task(self._trace_store.save_trace(trace_obj))
+        self._record_trace(trace_obj)
 
         return QueryResponseSchema(
             answer=answer_text,
@@ -477,16 +499,115 @@ class QueryPipeline:
             ),
         )
 
+    async def close(self) -> None:
+        """Write any queued traces and stop the trace writer."""
+        if self._trace_queue is not None:
+            await self._trace_queue.join()
+        if self._trace_writer is not None:
+            self._trace_writer.cancel()
+            await asyncio.gather(self._trace_writer, return_exceptions=True)
+            self._trace_writer = None
+
+    def _record_trace(self, trace: Trace) -> None:
+        if self._trace_queue is None:
+            self._trace_queue = asyncio.Queue(maxsize=TRACE_QUEUE_SIZE)
+        if self._trace_writer is None or self._trace_writer.done():
+            self._trace_writer = asyncio.create_task(self._write_traces(self._trace_queue))
+        try:
+            self._trace_queue.put_nowait(trace)
+        except asyncio.QueueFull:
+            logger.warning("trace_dropped", trace_id=trace.trace_id)
+
+    async def _write_traces(self, queue: asyncio.Queue[Trace]) -> None:
+        """Drain queued traces into the trace store, one transaction per batch."""
+        while True:
+            batch = [await queue.get()]
+            while len(batch) < TRACE_BATCH_SIZE and not queue.empty():
+                batch.append(queue.get_nowait())
+            try:
+                await self._trace_store.save_traces(batch)
+            except Exception as e:
+                logger.warning("trace_save_failed", count=len(batch), error=str(e))
+            finally:
+                for _ in batch:
+                    queue.task_done()
+
+    async def _understand_and_decompose(
+        self, query: str, trace: TraceContext
+    ) -> tuple[ProcessedQuery, DecomposedQuery]:
+        """Run query understanding and decomposition side by side; both only need the
+        normalized query, which is computed once up front."""
+        normalized = QueryUnderstanding.normalize(query)
+
+        async def understand() -> ProcessedQuery:
+            with trace.span("query_understanding"):
+                return await self._qu.process_prenormalized(normalized)
+
+        async def decompose() -> DecomposedQuery:
+            with trace.span("decomposition"):
+                return await self._decomposer.decompose(normalized)
+
+        processed, decomposed = await asyncio.gather(understand(), decompose())
+        return processed, decomposed
+
+    async def _retrieve_all(self, sub_questions: list[str]) -> list[RetrievalCandidate]:
+        """Retrieve for all sub-questions concurrently (capped by the retrieval semaphore)."""
+
+        async def retrieve(sub_question: str) -> list[RetrievalCandidate]:
+            async with self._retrieval_semaphore:
+                return await self._retriever.retrieve(
+                    sub_question,
+                    top_k_bm25=self._settings.bm25_top_k,
+                    top_k_vector=self._settings.vector_top_k,
+                )
+
+        # gather keeps sub-question order, so deduplication sees the same sequence
+        results = await asyncio.gather(*(retrieve(sq) for sq in sub_questions))
+        return self._deduplicate([c for candidates in results for c in candidates])
+
+    async def _rerank_and_score(
+        self, query: str, candidates: list[RetrievalCandidate], trace: TraceContext
+    ) -> tuple[list[RetrievalCandidate], float, list[str]]:
+        """Rerank candidates and score retrieval quality.
+
+        With rq_skip_rerank_threshold set, the first-stage top_n is scored first. If
+        its quality is above that threshold or below the fallback threshold, reranking
+        is skipped and that slice is used as is, with its RRF scores rescaled to [0, 1].
+        Reranking could still have changed the order or the decision; the threshold
+        trades that for latency.
+        """
+        top_n = self._settings.rerank_top_n
+        skip_threshold = self._settings.rq_skip_rerank_threshold
+        if skip_threshold is not None and candidates:
+            with trace.span("rq_scoring_fast"):
+                first_stage = self._rq_scorer.rescale_rrf(candidates)[:top_n]
+                fast_rq, fast_reasons = self._rq_scorer.score(first_stage)
+            if fast_rq > skip_threshold or fast_rq < self._settings.rq_fallback_threshold:
+                logger.info("rerank_skipped", fast_rq=round(fast_rq, 4))
+                reasons = fast_reasons + [ReasonCode.RERANK_SKIPPED_FAST_PATH]
+                return first_stage, fast_rq, reasons
+
+        with trace.span("reranking"):
+            reranked = await self._reranker.rerank(query, candidates, top_n=top_n)
+
+        with trace.span("rq_scoring"):
+            rq_score, rq_reasons = self._rq_scorer.score(reranked)
+        return reranked, rq_score, rq_reasons
+
     @staticmethod
     def _deduplicate(
         candidates: list[RetrievalCandidate],
     ) -> list[RetrievalCandidate]:
-        """Deduplicate by chunk_id, keeping the highest score."""
+        """Deduplicate by chunk_id, keeping the highest score.
+
+        Each chunk stays at the position of its first occurrence.
+        """
         seen: dict[str, RetrievalCandidate] = {}
         for c in candidates:
-            existing = seen.get(c.chunk.chunk_id)
+            cid = c.chunk.chunk_id
+            existing = seen.get(cid)
             if existing is None or c.score > existing.score:
-                seen[c.chunk.chunk_id] = c
+                seen[cid] = c
         return list(seen.values())
 
     @staticmethod
@@ -496,32 +617,7 @@ class QueryPipeline:
         Only matches explicit refusal patterns — avoids false positives from
         legitimate phrases like 'not contained in the model weights'.
         """
-        lower = answer.lower()
-        # Full refusal patterns that unambiguously indicate the LLM can't answer
-        refusal_patterns = [
-            "do not contain information",
-            "does not contain information",
-            "do not contain the answer",
-            "does not contain the answer",
-            "do not contain the necessary",
-            "do not contain the coordinates",
-            "don't contain information",
-            "doesn't contain information",
-            "cannot answer the question",
-            "cannot answer this question",
-            "unable to answer",
-            "i cannot provide an answer",
-            "i am unable to",
-            "no relevant information",
-            "outside the scope of",
-            "is not discussed in",
-            "are not discussed in",
-            "not contain any information",
-            "do not address",
-            "does not address",
-            "not provided in the evidence",
-        ]
-        return any(phrase in lower for phrase in refusal_patterns)
+        return _REFUSAL_RE.search(answer.lower()) is not None
 
     @staticmethod
     def _map_decision(
@@ -4,9 +4,12 @@ from __future__ import annotations
 
 from typing import Protocol
 
+import numpy as np
+
 
 class Embedder(Protocol):
-    async def embed_texts(self, texts: list[str]) -> list[list[float]]: ...
+    # float32 array of shape (len(texts), dimensions); written into out when given
+    async def embed_texts(self, texts: list[str], out: np.ndarray | None = None) -> np.ndarray: ...
 
     async def embed_query(self, query: str) -> list[float]: ...
 
@@ -11,5 +11,9 @@ class FileParser(Protocol):
         """Returns (extracted_text, enriched_metadata)."""
         ...
 
+    def parse_bytes(self, content: bytes, metadata: dict) -> tuple[str, dict]:
+        """Parse in-memory file content. Returns (extracted_text, enriched_metadata)."""
+        ...
+
     @property
     def supported_extensions(self) -> list[str]: ...
@@ -2,17 +2,24 @@
 
 from __future__ import annotations
 
-import json
+import time
+from collections import OrderedDict
 
 from pydantic import BaseModel
 
 from rag_engine.config.constants import MAX_SUB_QUESTIONS
+from rag_engine.generation.json_parsing import parse_llm_json
 from rag_engine.generation.prompt_templates import QUERY_DECOMPOSITION_PROMPT
 from rag_engine.models.domain import DecomposedQuery
 from rag_engine.observability.logger import get_logger
 
 logger = get_logger("decomposition")
 
+# Recent decompositions, so retries and reconnects skip the LLM call.
+# Entries expire after DECOMPOSITION_CACHE_TTL_S seconds.
+DECOMPOSITION_CACHE_SIZE = 4096
+DECOMPOSITION_CACHE_TTL_S = 900
+
 
 class DecompositionResponse(BaseModel):
     sub_questions: list[str]
@@ -22,9 +29,28 @@ class DecompositionResponse(BaseModel):
 class QueryDecomposer:
     def __init__(self, llm) -> None:
         self._llm = llm
+        self._cache: OrderedDict[str, tuple[DecomposedQuery, float]] = OrderedDict()
 
     async def decompose(self, query: str) -> DecomposedQuery:
+        cached = self._cache.get(query)
+        if cached is not None:
+            decomposed, expires_at = cached
+            if time.monotonic() < expires_at:
+                self._cache.move_to_end(query)
+                return decomposed
+            del self._cache[query]
+
+        decomposed, failed = await self._decompose(query)
+        # A failed decomposition is not cached, so the next request retries the LLM
+        if not failed:
+            self._cache[query] = (decomposed, time.monotonic() + DECOMPOSITION_CACHE_TTL_S)
+            if len(self._cache) > DECOMPOSITION_CACHE_SIZE:
+                self._cache.popitem(last=False)
+        return decomposed
+
+    async def _decompose(self, query: str) -> tuple[DecomposedQuery, bool]:
         prompt = QUERY_DECOMPOSITION_PROMPT.format(query=query)
+        failed = False
 
         try:
             result = await self._llm.generate_structured(prompt, DecompositionResponse)
@@ -34,13 +60,14 @@ class QueryDecomposer:
             # Fallback: try plain generation and parse JSON
             try:
                 raw = await self._llm.generate(prompt)
-                data = json.loads(raw)
+                data = parse_llm_json(raw)
                 sub_questions = data.get("sub_questions", [query])[:MAX_SUB_QUESTIONS]
                 synthesis = data.get("synthesis_instruction", "Combine the answers.")
             except Exception:
                 logger.warning("decomposition_failed", query=query)
                 sub_questions = [query]
                 synthesis = ""
+                failed = True
 
         if not sub_questions:
             sub_questions = [query]
@@ -55,4 +82,4 @@ class QueryDecomposer:
             original=query,
             sub_questions=sub_questions,
             synthesis_instruction=synthesis,
-        )
+        ), failed
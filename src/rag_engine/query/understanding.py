@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import re
 import unicodedata
+from collections import OrderedDict
 
 from langdetect import detect
 
@@ -12,22 +13,34 @@ from rag_engine.observability.logger import get_logger
 
 logger = get_logger("query_understanding")
 
+# Recently processed queries; the result depends only on the normalized text
+PROCESSED_CACHE_SIZE = 4096
+
 
 class QueryUnderstanding:
+    def __init__(self) -> None:
+        self._cache: OrderedDict[str, ProcessedQuery] = OrderedDict()
+
     async def process(self, raw_query: str) -> ProcessedQuery:
-        # 1. Normalize
-        normalized = self._normalize(raw_query)
+        return await self.process_prenormalized(self.normalize(raw_query))
+
+    async def process_prenormalized(self, normalized: str) -> ProcessedQuery:
+        """Process a query already passed through normalize()."""
+        cached = self._cache.get(normalized)
+        if cached is not None:
+            self._cache.move_to_end(normalized)
+            return cached
 
-        # 2. Language detection
+        # 1. Language detection
         try:
             language = detect(normalized)
         except Exception:
             language = "en"
 
-        # 3. Intent classification (simple heuristic)
+        # 2. Intent classification (simple heuristic)
         intent = self._classify_intent(normalized)
 
-        # 4. Constraint extraction
+        # 3. Constraint extraction
         constraints = self._extract_constraints(normalized)
 
         logger.info(
@@ -37,15 +50,19 @@ class QueryUnderstanding:
             constraints=constraints,
         )
 
-        return ProcessedQuery(
+        processed = ProcessedQuery(
             normalized=normalized,
             language=language,
             intent=intent,
             constraints=constraints,
         )
+        self._cache[normalized] = processed
+        if len(self._cache) > PROCESSED_CACHE_SIZE:
+            self._cache.popitem(last=False)
+        return processed
 
     @staticmethod
-    def _normalize(text: str) -> str:
+    def normalize(text: str) -> str:
         text = unicodedata.normalize("NFKC", text)
         text = re.sub(r"\s+", " ", text).strip()
         return text
@@ -2,10 +2,9 @@
 
 from __future__ import annotations
 
-import json
-
 from pydantic import BaseModel
 
+from rag_engine.generation.json_parsing import parse_llm_json
 from rag_engine.models.domain import RetrievalCandidate, RetrievalResult
 from rag_engine.observability.logger import get_logger
 
@@ -47,7 +46,7 @@ class FallbackManager:
             # Fallback: try plain generation and parse JSON manually
             try:
                 raw = await llm.generate(prompt)
-                data = json.loads(raw)
+                data = parse_llm_json(raw)
                 return data.get("rewrites", [])[:3]
             except Exception:
                 logger.warning("query_rewrite_failed")
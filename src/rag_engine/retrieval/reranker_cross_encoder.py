@@ -3,6 +3,8 @@
 from __future__ import annotations
 
 import asyncio
+import hashlib
+import time
 
 from sentence_transformers import CrossEncoder
 
@@ -11,10 +13,19 @@ from rag_engine.observability.logger import get_logger
 
 logger = get_logger("reranker")
 
+# Scores of recent (query, chunk text) pairs; retries and refinements repeat them.
+# Entries expire after SCORE_CACHE_TTL_S seconds.
+SCORE_CACHE_MAXSIZE = 100_000
+SCORE_CACHE_TTL_S = 900
+
 
 class CrossEncoderReranker:
-    def __init__(self, model_name: str = "cross-encoder/ms-marco-MiniLM-L-6-v2") -> None:
+    def __init__(
+        self, model_name: str = "cross-encoder/ms-marco-MiniLM-L-6-v2", batch_size: int = 32
+    ) -> None:
         self._model = CrossEncoder(model_name)
+        self._batch_size = batch_size
+        self._score_cache: dict[bytes, tuple[float, float]] = {}
 
     async def rerank(
         self,
@@ -25,10 +36,15 @@ class CrossEncoderReranker:
         if not candidates:
             return []
 
-        pairs = [(query, c.chunk.text) for c in candidates]
-
-        # CrossEncoder.predict is synchronous — run in thread pool
-        scores = await asyncio.to_thread(self._model.predict, pairs)
+        keys = [self._pair_key(query, c.chunk.text) for c in candidates]
+        scores = self._cached_scores(keys)
+        misses = [i for i, score in enumerate(scores) if score is None]
+        if misses:
+            fresh = await self._predict(query, [candidates[i].chunk.text for i in misses])
+            expires_at = time.monotonic() + SCORE_CACHE_TTL_S
+            for i, score in zip(misses, fresh):
+                scores[i] = score
+                self._cache_score(keys[i], score, expires_at)
 
         # Assign new scores and sort
         scored = list(zip(candidates, scores))
@@ -48,7 +64,46 @@ class CrossEncoderReranker:
             "reranked",
             input_count=len(candidates),
             output_count=len(result),
+            cached=len(candidates) - len(misses),
             top_score=round(result[0].score, 4) if result else 0.0,
         )
 
         return result
+
+    async def _predict(self, query: str, texts: list[str]) -> list[float]:
+        # Score texts in length order so each batch pads to similar lengths
+        order = sorted(range(len(texts)), key=lambda i: len(texts[i]))
+        pairs = [(query, texts[i]) for i in order]
+
+        # CrossEncoder.predict is synchronous — run in thread pool
+        sorted_scores = await asyncio.to_thread(
+            self._model.predict,
+            pairs,
+            batch_size=self._batch_size,
+            show_progress_bar=False,
+        )
+        scores = [0.0] * len(texts)
+        for i, score in zip(order, sorted_scores):
+            scores[i] = float(score)
+        return scores
+
+    def _cached_scores(self, keys: list[bytes]) -> list[float | None]:
+        now = time.monotonic()
+        scores: list[float | None] = []
+        for key in keys:
+            cached = self._score_cache.get(key)
+            if cached is not None and now >= cached[1]:
+                del self._score_cache[key]
+                cached = None
+            scores.append(cached[0] if cached is not None else None)
+        return scores
+
+    def _cache_score(self, key: bytes, score: float, expires_at: float) -> None:
+        if key not in self._score_cache and len(self._score_cache) >= SCORE_CACHE_MAXSIZE:
+            # Evict the oldest entry (dicts preserve insertion order)
+            del self._score_cache[next(iter(self._score_cache))]
+        self._score_cache[key] = (score, expires_at)
+
+    @staticmethod
+    def _pair_key(query: str, text: str) -> bytes:
+        return hashlib.blake2b(f"{query}\0{text}".encode(), digest_size=16).digest()
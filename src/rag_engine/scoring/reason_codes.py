@@ -17,3 +17,4 @@ class ReasonCode(str, Enum):
     FALLBACK_USED = "FALLBACK_USED"
     FALLBACK_FAILED = "FALLBACK_FAILED"
     LATENCY_BUDGET_EXCEEDED = "LATENCY_BUDGET_EXCEEDED"
+    RERANK_SKIPPED_FAST_PATH = "RERANK_SKIPPED_FAST_PATH"
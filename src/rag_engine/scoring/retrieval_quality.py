@@ -17,6 +17,8 @@ class RetrievalQualityScorer:
         self.w2 = settings.rq_w_margin
         self.w3 = settings.rq_w_coverage
         self.w4 = settings.rq_w_consistency
+        # Best possible RRF score: rank 1 in both the BM25 and the vector list
+        self._rrf_max = 2.0 / (settings.rrf_k + 1)
 
     def score(self, candidates: list[RetrievalCandidate]) -> tuple[float, list[str]]:
         if not candidates:
@@ -63,6 +65,14 @@ class RetrievalQualityScorer:
 
         return rq, reason_codes
 
+    def rescale_rrf(self, candidates: list[RetrievalCandidate]) -> list[RetrievalCandidate]:
+        """Sort RRF-fused candidates and rescale their scores to [0, 1] by the best
+        possible value, so a chunk ranked first by both retrievers scores 1.0."""
+        ranked = sorted(candidates, key=lambda c: c.score, reverse=True)
+        return [
+            RetrievalCandidate(c.chunk, c.score / self._rrf_max, c.source_method) for c in ranked
+        ]
+
     @staticmethod
     def _sigmoid_normalize(x: float, midpoint: float = 0.5, steepness: float = 10.0) -> float:
         """Sigmoid normalization to map arbitrary scores to [0, 1]."""
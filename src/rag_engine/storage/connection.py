@@ -0,0 +1,70 @@
+"""Long-lived aiosqlite connections with write-friendly pragmas."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+
+import aiosqlite
+
+# Applied to every connection; journal_mode is persistent and handled separately
+CONNECTION_PRAGMAS = (
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-64000",
+    "PRAGMA mmap_size=268435456",
+    # Wait for locks held by other processes (e.g. scripts) instead of failing
+    "PRAGMA busy_timeout=5000",
+)
+
+
+async def connect(db_path: str) -> aiosqlite.Connection:
+    """Open a connection in WAL mode with rows returned as aiosqlite.Row."""
+    db = await aiosqlite.connect(db_path)
+    db.row_factory = aiosqlite.Row
+    # WAL is stored in the database file, so only switch when it is not already set
+    async with db.execute("PRAGMA journal_mode") as cursor:
+        row = await cursor.fetchone()
+    if row is None or str(row[0]).lower() != "wal":
+        await db.execute("PRAGMA journal_mode=WAL")
+    for pragma in CONNECTION_PRAGMAS:
+        await db.execute(pragma)
+    return db
+
+
+class SQLiteConnection:
+    """Lazily opened, shared connection to one SQLite database."""
+
+    def __init__(self, db_path: str) -> None:
+        self._db_path = db_path
+        self._db: aiosqlite.Connection | None = None
+        self._lock = asyncio.Lock()
+        # Writes are serialized so one caller's commit never splits another's batch;
+        # reads need no lock under WAL
+        self._write_lock = asyncio.Lock()
+
+    async def get(self) -> aiosqlite.Connection:
+        if self._db is None:
+            async with self._lock:
+                if self._db is None:
+                    self._db = await connect(self._db_path)
+        return self._db
+
+    @asynccontextmanager
+    async def transaction(self) -> AsyncIterator[aiosqlite.Connection]:
+        """Run the enclosed writes under the write lock as one BEGIN/COMMIT."""
+        db = await self.get()
+        async with self._write_lock:
+            await db.execute("BEGIN")
+            try:
+                yield db
+            except BaseException:
+                await db.rollback()
+                raise
+            await db.commit()
+
+    async def close(self) -> None:
+        if self._db is not None:
+            await self._db.close()
+            self._db = None
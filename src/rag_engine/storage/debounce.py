@@ -0,0 +1,55 @@
+"""Coalesce frequent index saves into one write per time window."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Callable
+
+from rag_engine.observability.logger import get_logger
+
+logger = get_logger("debounced_save")
+
+# Saves requested within this many seconds of the first one are written together
+SAVE_DELAY_S = 1.0
+
+
+class DebouncedSave:
+    """Runs an async save at most once per window, however often it is requested.
+
+    The first schedule() arms a timer; further requests before it fires are absorbed.
+    Saves never overlap: a save requested while one is running is written after it.
+    """
+
+    def __init__(self, save: Callable[[], Awaitable[None]], delay: float = SAVE_DELAY_S) -> None:
+        self._save = save
+        self._delay = delay
+        self._timer: asyncio.TimerHandle | None = None
+        self._task: asyncio.Task | None = None
+        self._lock = asyncio.Lock()
+
+    def schedule(self) -> None:
+        if self._timer is None:
+            loop = asyncio.get_running_loop()
+            self._timer = loop.call_later(self._delay, self._start)
+
+    async def flush(self) -> None:
+        """Write a pending save now and wait for any save in progress."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._start()
+        if self._task is not None:
+            await asyncio.gather(self._task, return_exceptions=True)
+
+    def _start(self) -> None:
+        self._timer = None
+        self._task = asyncio.get_running_loop().create_task(self._run())
+        self._task.add_done_callback(self._on_done)
+
+    async def _run(self) -> None:
+        async with self._lock:
+            await self._save()
+
+    @staticmethod
+    def _on_done(task: asyncio.Task) -> None:
+        if not task.cancelled() and task.exception() is not None:
+            logger.warning("index_save_failed", error=str(task.exception()))
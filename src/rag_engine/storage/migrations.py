@@ -50,16 +50,14 @@ CREATE INDEX IF NOT EXISTS idx_traces_timestamp ON traces(timestamp)
 """
 
 
-async def initialize_doc_db(db_path: str) -> None:
-    async with aiosqlite.connect(db_path) as db:
-        await db.execute(DOCUMENTS_TABLE)
-        await db.execute(CHUNKS_TABLE)
-        await db.execute(CHUNKS_DOC_INDEX)
-        await db.commit()
+async def initialize_doc_db(db: aiosqlite.Connection) -> None:
+    await db.execute(DOCUMENTS_TABLE)
+    await db.execute(CHUNKS_TABLE)
+    await db.execute(CHUNKS_DOC_INDEX)
+    await db.commit()
 
 
-async def initialize_trace_db(db_path: str) -> None:
-    async with aiosqlite.connect(db_path) as db:
-        await db.execute(TRACES_TABLE)
-        await db.execute(TRACES_TIMESTAMP_INDEX)
-        await db.commit()
+async def initialize_trace_db(db: aiosqlite.Connection) -> None:
+    await db.execute(TRACES_TABLE)
+    await db.execute(TRACES_TIMESTAMP_INDEX)
+    await db.commit()
@@ -8,53 +8,62 @@ from datetime import datetime, timezone
 import aiosqlite
 
 from rag_engine.models.domain import Trace
+from rag_engine.storage.connection import SQLiteConnection
 from rag_engine.storage.migrations import initialize_trace_db
 
 
 class SQLiteTraceStore:
     def __init__(self, db_path: str) -> None:
         self._db_path = db_path
+        self._conn = SQLiteConnection(db_path)
 
     async def initialize(self) -> None:
-        await initialize_trace_db(self._db_path)
+        await initialize_trace_db(await self._conn.get())
+
+    async def close(self) -> None:
+        await self._conn.close()
 
     async def save_trace(self, trace: Trace) -> None:
-        async with aiosqlite.connect(self._db_path) as db:
-            await db.execute(
+        await self.save_traces([trace])
+
+    async def save_traces(self, traces: list[Trace]) -> None:
+        """Insert a batch of traces in one transaction."""
+        async with self._conn.transaction() as db:
+            await db.executemany(
                 "INSERT OR REPLACE INTO traces "
                 "(trace_id, query, timestamp, latency_ms, rq_score, confidence, decision, reason_codes, spans) "
                 "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
-                (
-                    trace.trace_id,
-                    trace.query,
-                    trace.timestamp.isoformat(),
-                    trace.latency_ms,
-                    trace.rq_score,
-                    trace.confidence,
-                    trace.decision,
-                    json.dumps(trace.reason_codes),
-                    json.dumps(trace.spans),
-                ),
+                [
+                    (
+                        trace.trace_id,
+                        trace.query,
+                        trace.timestamp.isoformat(),
+                        trace.latency_ms,
+                        trace.rq_score,
+                        trace.confidence,
+                        trace.decision,
+                        json.dumps(trace.reason_codes),
+                        json.dumps(trace.spans),
+                    )
+                    for trace in traces
+                ],
             )
-            await db.commit()
 
     async def get_trace(self, trace_id: str) -> Trace | None:
-        async with aiosqlite.connect(self._db_path) as db:
-            db.row_factory = aiosqlite.Row
-            async with db.execute("SELECT * FROM traces WHERE trace_id = ?", (trace_id,)) as cursor:
-                row = await cursor.fetchone()
-                if row is None:
-                    return None
-                return self._row_to_trace(row)
+        db = await self._conn.get()
+        async with db.execute("SELECT * FROM traces WHERE trace_id = ?", (trace_id,)) as cursor:
+            row = await cursor.fetchone()
+            if row is None:
+                return None
+            return self._row_to_trace(row)
 
     async def get_recent_traces(self, limit: int = 100) -> list[Trace]:
-        async with aiosqlite.connect(self._db_path) as db:
-            db.row_factory = aiosqlite.Row
-            async with db.execute(
-                "SELECT * FROM traces ORDER BY timestamp DESC LIMIT ?", (limit,)
-            ) as cursor:
-                rows = await cursor.fetchall()
-                return [self._row_to_trace(row) for row in rows]
+        db = await self._conn.get()
+        async with db.execute(
+            "SELECT * FROM traces ORDER BY timestamp DESC LIMIT ?", (limit,)
+        ) as cursor:
+            rows = await cursor.fetchall()
+            return [self._row_to_trace(row) for row in rows]
 
     @staticmethod
     def _row_to_trace(row: aiosqlite.Row) -> Trace:
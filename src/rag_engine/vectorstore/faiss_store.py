@@ -11,6 +11,7 @@ import faiss
 import numpy as np
 
 from rag_engine.observability.logger import get_logger
+from rag_engine.storage.debounce import DebouncedSave
 
 logger = get_logger("faiss_store")
 
@@ -24,6 +25,7 @@ class FAISSVectorStore:
         self._chunk_id_to_int: dict[str, int] = {}
         self._next_id: int = 0
         self._write_lock = asyncio.Lock()
+        self._saver = DebouncedSave(self._save_locked)
 
         if index_path:
             self._try_load(index_path)
@@ -41,9 +43,10 @@ class FAISSVectorStore:
             logger.info("faiss_loaded", size=self._index.ntotal, path=path)
 
     def add(self, chunk_ids: list[str], embeddings: np.ndarray) -> None:
+        """Add embeddings for chunk_ids. float32 input is L2-normalized in place."""
         if len(chunk_ids) == 0:
             return
-        embeddings = embeddings.astype(np.float32)
+        embeddings = np.ascontiguousarray(embeddings, dtype=np.float32)
         faiss.normalize_L2(embeddings)
         int_ids = self._assign_int_ids(chunk_ids)
         self._index.add_with_ids(embeddings, np.array(int_ids, dtype=np.int64))
@@ -74,8 +77,11 @@ class FAISSVectorStore:
         if not path:
             return
         Path(path).mkdir(parents=True, exist_ok=True)
-        faiss.write_index(self._index, os.path.join(path, "index.faiss"))
-        with open(os.path.join(path, "id_mapping.json"), "w") as f:
+        # Written under temp names and renamed, so a crash mid-save leaves the old files
+        index_file = os.path.join(path, "index.faiss")
+        faiss.write_index(self._index, index_file + ".tmp")
+        mapping_file = os.path.join(path, "id_mapping.json")
+        with open(mapping_file + ".tmp", "w") as f:
             json.dump(
                 {
                     "id_to_chunk_id": self._id_to_chunk_id,
@@ -84,8 +90,23 @@ class FAISSVectorStore:
                 },
                 f,
             )
+        os.replace(index_file + ".tmp", index_file)
+        os.replace(mapping_file + ".tmp", mapping_file)
         logger.info("faiss_saved", path=path, size=self._index.ntotal)
 
+    def schedule_save(self) -> None:
+        """Persist soon; saves requested in quick succession are written once."""
+        self._saver.schedule()
+
+    async def flush_save(self) -> None:
+        """Write any scheduled save now and wait for it."""
+        await self._saver.flush()
+
+    async def _save_locked(self) -> None:
+        # Holds the write lock so an add cannot run while the index is being written
+        async with self._write_lock:
+            await asyncio.to_thread(self.save)
+
     @property
     def size(self) -> int:
         return self._index.ntotal
@@ -2,10 +2,9 @@
 
 from __future__ import annotations
 
-import json
-
 from pydantic import BaseModel
 
+from rag_engine.generation.json_parsing import parse_llm_json
 from rag_engine.generation.prompt_templates import (
     ANSWER_CONTRADICTION_PROMPT,
     CONTRADICTION_DETECTION_PROMPT,
@@ -40,15 +39,18 @@ class ContradictionDetector:
         except Exception:
             try:
                 raw = await self._llm.generate(prompt)
-                data = json.loads(raw)
+                data = parse_llm_json(raw)
                 return data.get("contradictions", [])
             except Exception:
                 logger.warning("doc_conflict_detection_failed")
                 return []
 
-    async def detect_answer_conflicts(self, answer: str, chunks: list[Chunk]) -> float:
+    async def detect_answer_conflicts(
+        self, answer: str, chunks: list[Chunk], evidence_block: str | None = None
+    ) -> float:
         """Check if the answer contradicts the evidence. Returns contradiction rate 0-1."""
-        evidence_block = format_evidence_block(chunks)
+        if evidence_block is None:
+            evidence_block = format_evidence_block(chunks)
         prompt = ANSWER_CONTRADICTION_PROMPT.format(answer=answer, evidence_block=evidence_block)
 
         try:
@@ -57,7 +59,7 @@ class ContradictionDetector:
         except Exception:
             try:
                 raw = await self._llm.generate(prompt)
-                data = json.loads(raw)
+                data = parse_llm_json(raw)
                 rate = max(0.0, min(1.0, float(data.get("contradiction_rate", 0.0))))
             except Exception:
                 logger.warning("answer_conflict_detection_failed")
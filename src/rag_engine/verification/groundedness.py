@@ -2,10 +2,9 @@
 
 from __future__ import annotations
 
-import json
-
 from pydantic import BaseModel
 
+from rag_engine.generation.json_parsing import parse_llm_json
 from rag_engine.generation.prompt_templates import (
     GROUNDEDNESS_CHECK_PROMPT,
     format_evidence_block,
@@ -25,8 +24,15 @@ class GroundednessChecker:
     def __init__(self, llm) -> None:
         self._llm = llm
 
-    async def check(self, answer: str, evidence: list[Chunk], query: str = "") -> float:
-        evidence_block = format_evidence_block(evidence)
+    async def check(
+        self,
+        answer: str,
+        evidence: list[Chunk],
+        query: str = "",
+        evidence_block: str | None = None,
+    ) -> float:
+        if evidence_block is None:
+            evidence_block = format_evidence_block(evidence)
         prompt = GROUNDEDNESS_CHECK_PROMPT.format(
             query=query, answer=answer, evidence_block=evidence_block
         )
@@ -37,7 +43,7 @@ class GroundednessChecker:
         except Exception:
             try:
                 raw = await self._llm.generate(prompt)
-                data = json.loads(raw)
+                data = parse_llm_json(raw)
                 score = max(0.0, min(1.0, float(data.get("score", 0.5))))
             except Exception:
                 logger.warning("groundedness_check_failed")
@@ -1,5 +1,6 @@
 """Integration tests for SQLite document and trace stores."""
 
+import asyncio
 import tempfile
 from datetime import datetime, timezone
 from pathlib import Path
@@ -17,7 +18,8 @@ async def doc_store():
     tmp = tempfile.mkdtemp()
     store = SQLiteDocStore(str(Path(tmp) / "test.db"))
     await store.initialize()
-    return store
+    yield store
+    await store.close()
 
 
 @pytest.fixture
@@ -25,7 +27,8 @@ async def trace_store():
     tmp = tempfile.mkdtemp()
     store = SQLiteTraceStore(str(Path(tmp) / "test_traces.db"))
     await store.initialize()
-    return store
+    yield store
+    await store.close()
 
 
 @pytest.mark.asyncio
@@ -139,3 +142,72 @@ async def test_recent_traces(trace_store):
 
     recent = await trace_store.get_recent_traces(limit=3)
     assert len(recent) == 3
+
+
+@pytest.mark.asyncio
+async def test_save_traces_batch(trace_store):
+    traces = [
+        Trace(
+            trace_id=str(uuid4()),
+            query=f"Query {i}",
+            timestamp=datetime.now(timezone.utc),
+            latency_ms=100.0,
+            rq_score=0.5,
+            confidence=0.6,
+            decision="answer",
+            reason_codes=["LOW_MARGIN"],
+            spans=[],
+        )
+        for i in range(3)
+    ]
+    await trace_store.save_traces(traces)
+    for trace in traces:
+        retrieved = await trace_store.get_trace(trace.trace_id)
+        assert retrieved is not None
+        assert retrieved.reason_codes == ["LOW_MARGIN"]
+
+
+@pytest.mark.asyncio
+async def test_store_uses_wal_and_reuses_connection(doc_store):
+    await doc_store.count_chunks()
+    db = await doc_store._conn.get()
+    async with db.execute("PRAGMA journal_mode") as cursor:
+        row = await cursor.fetchone()
+    assert row[0] == "wal"
+    await doc_store.count_documents()
+    assert await doc_store._conn.get() is db
+
+
+@pytest.mark.asyncio
+async def test_failed_write_rolls_back_without_affecting_others(doc_store):
+    doc = Document(
+        doc_id=str(uuid4()),
+        source="a.txt",
+        content_type=".txt",
+        metadata={},
+        raw_text="kept",
+    )
+    chunk = Chunk(
+        chunk_id=str(uuid4()),
+        doc_id=doc.doc_id,
+        text="kept",
+        index=0,
+        metadata={},
+        token_count=1,
+    )
+
+    async def failing_write():
+        async with doc_store._conn.transaction() as db:
+            await db.execute("DELETE FROM chunks")
+            await asyncio.sleep(0)
+            raise RuntimeError("write failed")
+
+    results = await asyncio.gather(
+        doc_store.save_document(doc),
+        failing_write(),
+        doc_store.save_chunks([chunk]),
+        return_exceptions=True,
+    )
+    assert isinstance(results[1], RuntimeError)
+    assert await doc_store.count_documents() == 1
+    assert await doc_store.count_chunks() == 1
@@ -0,0 +1,42 @@
+"""Tests for citation parsing in AnswerGenerator."""
+
+from __future__ import annotations
+
+from rag_engine.generation.answer_generator import AnswerGenerator
+
+
+class FakeLLM:
+    """Returns a fixed answer, streamed in the given pieces."""
+
+    def __init__(self, pieces: list[str]) -> None:
+        self._pieces = pieces
+
+    async def generate(self, prompt: str, system: str | None = None) -> str:
+        return "".join(self._pieces)
+
+    async def generate_stream(self, prompt: str, system: str | None = None):
+        for piece in self._pieces:
+            yield piece
+
+
+async def test_generate_resolves_citations_in_first_cited_order(sample_candidates):
+    generator = AnswerGenerator(FakeLLM(["See [2] and [1], again [2], not [99]."]))
+    result = await generator.generate("q", sample_candidates)
+    assert [c.chunk_id for c in result.cited_chunks] == [
+        sample_candidates[1].chunk.chunk_id,
+        sample_candidates[0].chunk.chunk_id,
+    ]
+
+
+async def test_generate_stream_matches_markers_split_across_chunks(sample_candidates):
+    pieces = ["Retrieval [", "1", "0] works ", "[3", "] well."]
+    generator = AnswerGenerator(FakeLLM(pieces))
+    events = [event async for event in generator.generate_stream("q", sample_candidates)]
+
+    assert [text for text, _ in events[:-1]] == pieces
+    result = events[-1][1]
+    assert result.answer == "".join(pieces)
+    assert [c.chunk_id for c in result.cited_chunks] == [
+        sample_candidates[9].chunk.chunk_id,
+        sample_candidates[2].chunk.chunk_id,
+    ]
@@ -3,11 +3,17 @@
 from __future__ import annotations
 
 import time
+from concurrent.futures import ThreadPoolExecutor
 
 import jwt
 import pytest
+from fastapi import Depends, FastAPI, Request
+from fastapi.testclient import TestClient
 
+from rag_engine.api import auth
+from rag_engine.api.auth import decode_token, verify_token
 from rag_engine.api.rate_limiter import SlidingWindowRateLimiter
+from rag_engine.config.settings import Settings
 
 
 def test_jwt_encode_decode():
@@ -34,6 +40,57 @@ def test_jwt_invalid_secret():
         jwt.decode(token, "wrong-secret", algorithms=["HS256"])
 
 
+def test_decode_token_caches_valid_tokens(monkeypatch):
+    secret = "test-secret"
+    payload = {"sub": "test-key", "iat": int(time.time()), "exp": int(time.time()) + 3600}
+    token = jwt.encode(payload, secret, algorithm="HS256")
+    assert decode_token(token, secret, "HS256")["sub"] == "test-key"
+
+    def fail(*args, **kwargs):
+        raise AssertionError("cached token should not be re-decoded")
+
+    monkeypatch.setattr(auth.jwt, "decode", fail)
+    assert decode_token(token, secret, "HS256")["sub"] == "test-key"
+
+
+def test_decode_token_cache_is_keyed_by_secret():
+    payload = {"sub": "test-key", "iat": int(time.time()), "exp": int(time.time()) + 3600}
+    token = jwt.encode(payload, "test-secret", algorithm="HS256")
+    decode_token(token, "test-secret", "HS256")
+    with pytest.raises(jwt.InvalidSignatureError):
+        decode_token(token, "wrong-secret", "HS256")
+
+
+def test_decode_token_does_not_cache_failures():
+    payload = {"sub": "test-key", "iat": int(time.time()) - 7200, "exp": int(time.time()) - 3600}
+    token = jwt.encode(payload, "test-secret", algorithm="HS256")
+    for _ in range(2):
+        with pytest.raises(jwt.ExpiredSignatureError):
+            decode_token(token, "test-secret", "HS256")
+
+
+def test_verify_token_stores_payload_on_request_state(monkeypatch):
+    app = FastAPI()
+    app.state.settings = Settings(jwt_secret="test-secret")
+
+    @app.get("/me")
+    async def me(
+        request: Request,
+        first: dict = Depends(verify_token),
+        second: dict = Depends(verify_token, use_cache=False),
+    ) -> dict:
+        return {"sub": request.state.user["sub"], "same": first is second}
+
+    decodes = []
+    original = auth.decode_token
+    monkeypatch.setattr(auth, "decode_token", lambda *a: decodes.append(1) or original(*a))
+
+    token = jwt.encode({"sub": "test-key", "exp": int(time.time()) + 3600}, "test-secret")
+    response = TestClient(app).get("/me", headers={"Authorization": f"Bearer {token}"})
+    assert response.json() == {"sub": "test-key", "same": True}
+    assert len(decodes) == 1
+
+
 def test_rate_limiter_allows():
     limiter = SlidingWindowRateLimiter()
     for _ in range(5):
@@ -55,3 +112,33 @@ def test_rate_limiter_empty_key():
     limiter = SlidingWindowRateLimiter()
     assert limiter.check("", max_requests=1) is True
     assert limiter.check("", max_requests=1) is False
+
+
+def test_rate_limiter_window_expiry(monkeypatch):
+    limiter = SlidingWindowRateLimiter()
+    clock = [1000.0]
+    monkeypatch.setattr(time, "monotonic", lambda: clock[0])
+    assert limiter.check("user1", max_requests=1, window_seconds=60) is True
+    assert limiter.check("user1", max_requests=1, window_seconds=60) is False
+    clock[0] += 61
+    assert limiter.check("user1", max_requests=1, window_seconds=60) is True
+
+
+def test_rate_limiter_collects_idle_keys(monkeypatch):
+    limiter = SlidingWindowRateLimiter()
+    clock = [1000.0]
+    monkeypatch.setattr(time, "monotonic", lambda: clock[0])
+    limiter.check("idle", max_requests=5)
+    clock[0] += 61
+    # Every shard gets swept once after NUM_SHARDS collection rounds
+    for _ in range(limiter.GC_INTERVAL * limiter.NUM_SHARDS):
+        limiter.check("active", max_requests=limiter.GC_INTERVAL * limiter.NUM_SHARDS)
+    keys = {k for shard in limiter._shards for k in shard}
+    assert keys == {"active"}
+
+
+def test_rate_limiter_thread_safe():
+    limiter = SlidingWindowRateLimiter()
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        allowed = list(pool.map(lambda _: limiter.check("user1", max_requests=50), range(400)))
+    assert sum(allowed) == 50
@@ -0,0 +1,98 @@
+"""Tests for the BM25 index."""
+
+from __future__ import annotations
+
+import os
+import tempfile
+
+import numpy as np
+
+from rag_engine.keyword_search import bm25_index
+from rag_engine.keyword_search.bm25_index import BM25Index
+from rag_engine.keyword_search.okapi import IncrementalBM25
+from rag_engine.models.domain import Chunk
+
+TOPICS = ["retrieval", "fusion", "reranking", "embeddings", "chunking", "citations", "café"]
+
+
+def _chunks(topics: list[str]) -> list[Chunk]:
+    return [
+        Chunk(
+            chunk_id=f"c-{topic}",
+            doc_id="d",
+            text=f"A note about {topic} in the engine.",
+            index=i,
+            metadata={},
+            token_count=8,
+        )
+        for i, topic in enumerate(topics)
+    ]
+
+
+def _flat(docs: list[list[int]]) -> tuple[np.ndarray, np.ndarray]:
+    offsets = np.cumsum([0] + [len(d) for d in docs])
+    return np.array([t for d in docs for t in d], dtype=np.uint32), offsets
+
+
+def test_incremental_adds_match_a_single_build():
+    docs = [[0, 1], [2, 3, 3], [], [1, 4]]
+    built = IncrementalBM25()
+    built.add_documents(*_flat(docs))
+    incremental = IncrementalBM25()
+    incremental.add_documents(*_flat(docs[:2]))
+    incremental.get_scores([1])  # computes stats that the next add must invalidate
+    incremental.add_documents(*_flat(docs[2:]))
+    query = [1, 3, 99]
+    assert np.allclose(built.get_scores(query), incremental.get_scores(query))
+
+
+def test_search_finds_added_chunks():
+    index = BM25Index()
+    index.build(_chunks(TOPICS[:3]))
+    index.add_documents(_chunks(TOPICS[3:]))
+    assert index.size == len(TOPICS)
+    assert index.search("chunking")[0][0] == "c-chunking"
+
+
+def test_repeated_search_is_invalidated_by_add():
+    index = BM25Index()
+    index.build(_chunks(TOPICS))
+    assert index.search("fusion") == index.search("fusion")
+    index.add_documents(_chunks(["fusion"]))
+    assert len(index.search("fusion")) == 2
+
+
+def test_save_and_load_round_trip():
+    path = tempfile.mkdtemp()
+    index = BM25Index(index_path=path)
+    index.build(_chunks(TOPICS))
+    index.save()
+
+    loaded = BM25Index(index_path=path)
+    assert loaded.size == len(TOPICS)
+    for topic in TOPICS:
+        assert loaded.search(topic) == index.search(topic)
+
+    loaded.add_documents(_chunks(["fusion"]))
+    assert [cid for cid, _ in loaded.search("fusion")] == ["c-fusion", "c-fusion"]
+    loaded.save()  # rewrites the files the loaded index has mapped
+    assert BM25Index(index_path=path).search("fusion") == loaded.search("fusion")
+
+
+def test_load_ignores_legacy_pickle():
+    path = tempfile.mkdtemp()
+    with open(os.path.join(path, "bm25.pkl"), "wb") as f:
+        f.write(b"not a supported format")
+    assert BM25Index(index_path=path).size == 0
+
+
+def test_parallel_tokenization_matches_serial(monkeypatch):
+    chunks = _chunks(TOPICS)
+    serial = BM25Index()
+    serial.build(chunks)
+    monkeypatch.setattr(bm25_index, "PARALLEL_TOKENIZE_MIN_CHUNKS", 1)
+    monkeypatch.setattr(bm25_index.os, "cpu_count", lambda: 2)
+    parallel = BM25Index()
+    parallel.build(chunks)
+    assert parallel._vocab == serial._vocab
+    assert np.array_equal(parallel._token_parts[0], serial._token_parts[0])
@@ -5,6 +5,7 @@ from __future__ import annotations
 import tempfile
 from pathlib import Path
 
+import numpy as np
 import pytest
 
 from rag_engine.embeddings.cache import EmbeddingCache
@@ -23,9 +24,13 @@ class FakeEmbedder:
     def dimensions(self) -> int:
         return self._dimensions
 
-    async def embed_texts(self, texts: list[str]) -> list[list[float]]:
+    async def embed_texts(self, texts: list[str], out: np.ndarray | None = None) -> np.ndarray:
         self.embed_texts_calls += 1
-        return [[float(i + 1)] * 3 for i in range(len(texts))]
+        result = np.array([[float(i + 1)] * 3 for i in range(len(texts))], dtype=np.float32)
+        if out is None:
+            return result
+        out[:] = result
+        return out
 
     async def embed_query(self, query: str) -> list[float]:
         self.embed_query_calls += 1
@@ -39,7 +44,9 @@ async def embedder_pair():
     await cache.initialize()
     delegate = FakeEmbedder()
     embedder = CachedEmbedder(delegate=delegate, cache=cache)
-    return embedder, delegate
+    yield embedder, delegate
+    await embedder.close()
+    await cache.close()
 
 
 async def test_embed_query_caches(embedder_pair):
@@ -57,18 +64,62 @@ async def test_embed_query_different_queries(embedder_pair):
     assert delegate.embed_query_calls == 2
 
 
+async def test_embed_query_lru_skips_sqlite(embedder_pair, monkeypatch):
+    embedder, delegate = embedder_pair
+    first = await embedder.embed_query("hello")
+
+    async def fail(text):
+        raise AssertionError("SQLite cache should not be consulted")
+
+    monkeypatch.setattr(embedder._cache, "get", fail)
+    assert await embedder.embed_query("hello") == first
+    assert delegate.embed_query_calls == 1
+
+
+async def test_embed_texts_merges_hits_and_misses_in_order(embedder_pair):
+    embedder, _ = embedder_pair
+    await embedder.embed_texts(["b"])
+    await embedder.flush()
+    result = await embedder.embed_texts(["a", "b", "c"])
+    # "b" comes from the cache; "a" and "c" are the delegate's 1st and 2nd outputs
+    assert result.tolist() == [[1.0] * 3, [1.0] * 3, [2.0] * 3]
+
+
 async def test_embed_texts_caches(embedder_pair):
     embedder, delegate = embedder_pair
     texts = ["a", "b", "c"]
     result1 = await embedder.embed_texts(texts)
+    await embedder.flush()
     result2 = await embedder.embed_texts(texts)
-    assert result1 == result2
+    assert np.array_equal(result1, result2)
+    assert result1.dtype == np.float32
     assert delegate.embed_texts_calls == 1
 
 
+async def test_embed_texts_fills_caller_buffer(embedder_pair):
+    embedder, _ = embedder_pair
+    await embedder.embed_texts(["b"])
+    await embedder.flush()
+    for texts in (["x", "y"], ["a", "b"]):  # all misses, then a mix of hits and misses
+        out = np.zeros((2, 3), dtype=np.float32)
+        result = await embedder.embed_texts(texts, out=out)
+        assert result is out
+        assert out.all()
+
+
+async def test_cache_keeps_embeddings_when_caller_modifies_buffer(embedder_pair):
+    embedder, _ = embedder_pair
+    out = np.empty((2, 3), dtype=np.float32)
+    await embedder.embed_texts(["a", "b"], out=out)
+    out[:] = 0.0  # e.g. normalized in place before the cache write lands
+    await embedder.flush()
+    assert (await embedder.embed_texts(["a", "b"])).all()
+
+
 async def test_embed_texts_partial_cache(embedder_pair):
     embedder, delegate = embedder_pair
     await embedder.embed_texts(["a", "b"])
+    await embedder.flush()
     assert delegate.embed_texts_calls == 1
     await embedder.embed_texts(["a", "b", "c"])
     assert delegate.embed_texts_calls == 2
@@ -77,10 +128,68 @@ async def test_embed_texts_partial_cache(embedder_pair):
 async def test_embed_texts_empty(embedder_pair):
     embedder, delegate = embedder_pair
     result = await embedder.embed_texts([])
-    assert result == []
+    assert result.shape == (0, 3)
     assert delegate.embed_texts_calls == 0
 
 
 async def test_dimensions_passthrough(embedder_pair):
     embedder, delegate = embedder_pair
     assert embedder.dimensions == 3
+
+
+async def test_cache_persists_across_reopen_and_drops_old_format():
+    path = str(Path(tempfile.mkdtemp()) / "cache.db")
+    cache = EmbeddingCache(path)
+    await cache.initialize()
+    await cache.put("hello", [1.0, 2.0])
+    await cache.close()
+
+    cache = EmbeddingCache(path)
+    await cache.initialize()
+    assert await cache.get("hello") == [1.0, 2.0]
+    # Simulate a cache written by an older format version
+    db = await cache._conn.get()
+    await db.execute("PRAGMA user_version = 0")
+    await db.commit()
+    await cache.close()
+
+    cache = EmbeddingCache(path)
+    await cache.initialize()
+    assert await cache.get("hello") is None
+    await cache.close()
+
+
+async def test_get_batch_handles_large_batches():
+    cache = EmbeddingCache(str(Path(tempfile.mkdtemp()) / "cache.db"))
+    await cache.initialize()
+    texts = [f"text {i}" for i in range(5000)]
+    await cache.put_batch(texts[::2], [[float(i)] for i in range(0, 5000, 2)])
+    result = await cache.get_batch(texts)
+    await cache.close()
+    assert len(result) == 2500
+    assert result[4].tolist() == [4.0]
+    assert 5 not in result
+
+
+async def test_embed_texts_writes_cache_in_background(embedder_pair):
+    embedder, _ = embedder_pair
+    await embedder.embed_texts(["a", "b"])
+    await embedder.close()
+    cached = await embedder._cache.get_batch(["a", "b"])
+    assert {i: e.tolist() for i, e in cached.items()} == {0: [1.0] * 3, 1: [2.0] * 3}
+
+
+async def test_cache_transaction_rolls_back_on_error():
+    cache = EmbeddingCache(str(Path(tempfile.mkdtemp()) / "cache.db"))
+    await cache.initialize()
+    with pytest.raises(RuntimeError):
+        async with cache.transaction() as db:
+            await db.execute(
+                "INSERT INTO embedding_cache (text_hash, embedding) VALUES ('x', x'00')"
+            )
+            raise RuntimeError("boom")
+    await cache.put("hello", [1.0])
+    assert await cache.get("hello") == [1.0]
+    async with (await cache._conn.get()).execute("SELECT COUNT(*) FROM embedding_cache") as cur:
+        assert (await cur.fetchone())[0] == 1
+    await cache.close()
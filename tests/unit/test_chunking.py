@@ -1,6 +1,6 @@
 """Tests for structure-aware chunking."""
 
-from rag_engine.chunking.structure_chunker import StructureChunker
+from rag_engine.chunking.structure_chunker import _HEADING_RE, StructureChunker, _iter_headings
 
 
 def test_chunk_simple_text():
@@ -65,3 +65,10 @@ def test_chunk_token_limit():
     # Each chunk should respect the token limit (approximately)
     for chunk in chunks:
         assert chunk.token_count <= 15  # Allow some slack for sentence boundaries
+
+
+def test_iter_headings_matches_regex_scan():
+    text = "# Title\nIntro #notaheading\n\n## Sub\nBody\n####### too deep\n#\nWrapped\n### Last"
+    expected = [m.span() for m in _HEADING_RE.finditer(text)]
+    assert [m.span() for m in _iter_headings(text)] == expected
+    assert len(expected) == 4
@@ -0,0 +1,35 @@
+"""Tests for DebouncedSave."""
+
+from __future__ import annotations
+
+import asyncio
+
+from rag_engine.storage.debounce import DebouncedSave
+
+
+class Recorder:
+    def __init__(self) -> None:
+        self.saves = 0
+
+    async def save(self) -> None:
+        self.saves += 1
+
+
+async def test_requests_within_the_window_share_one_save():
+    recorder = Recorder()
+    saver = DebouncedSave(recorder.save, delay=0.01)
+    for _ in range(5):
+        saver.schedule()
+    await asyncio.sleep(0.05)
+    await saver.flush()
+    assert recorder.saves == 1
+
+
+async def test_flush_writes_a_pending_save_immediately():
+    recorder = Recorder()
+    saver = DebouncedSave(recorder.save, delay=60)
+    saver.schedule()
+    await saver.flush()
+    assert recorder.saves == 1
+    await saver.flush()
+    assert recorder.saves == 1
@@ -0,0 +1,41 @@
+"""Tests for QueryDecomposer result caching."""
+
+from __future__ import annotations
+
+from rag_engine.query.decomposition import DecompositionResponse, QueryDecomposer
+
+
+class FakeLLM:
+    """Counts calls; structured generation fails while `fail` is set."""
+
+    def __init__(self) -> None:
+        self.calls = 0
+        self.fail = False
+
+    async def generate_structured(self, prompt: str, schema):
+        self.calls += 1
+        if self.fail:
+            raise RuntimeError("unavailable")
+        return DecompositionResponse(sub_questions=["a?", "b?"], synthesis_instruction="Merge.")
+
+    async def generate(self, prompt: str) -> str:
+        raise RuntimeError("unavailable")
+
+
+async def test_repeated_query_reuses_decomposition():
+    llm = FakeLLM()
+    decomposer = QueryDecomposer(llm)
+    first = await decomposer.decompose("compare a and b")
+    assert await decomposer.decompose("compare a and b") is first
+    assert first.sub_questions == ["a?", "b?"]
+    assert llm.calls == 1
+
+
+async def test_failed_decomposition_is_not_cached():
+    llm = FakeLLM()
+    llm.fail = True
+    decomposer = QueryDecomposer(llm)
+    assert (await decomposer.decompose("q")).sub_questions == ["q"]
+    llm.fail = False
+    assert (await decomposer.decompose("q")).sub_questions == ["a?", "b?"]
+    assert llm.calls == 2
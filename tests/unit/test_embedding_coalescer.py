@@ -0,0 +1,84 @@
+"""Tests for the EmbeddingCoalescer wrapper."""
+
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from rag_engine.embeddings.coalescer import EmbeddingCoalescer
+from rag_engine.exceptions import EmbeddingError
+
+
+class FakeEmbedder:
+    """Fake embedder that records each batch it receives."""
+
+    def __init__(self, fail: bool = False, reject: str | None = None) -> None:
+        self.batches: list[list[str]] = []
+        self._fail = fail
+        self._reject = reject
+
+    @property
+    def dimensions(self) -> int:
+        return 1
+
+    async def embed_texts(self, texts: list[str]) -> list[list[float]]:
+        self.batches.append(list(texts))
+        if self._fail:
+            raise RuntimeError("boom")
+        if self._reject in texts:
+            raise EmbeddingError(f"rejected {self._reject!r}")
+        return [[float(len(t))] for t in texts]
+
+    async def embed_query(self, query: str) -> list[float]:
+        return [0.0]
+
+
+async def test_concurrent_calls_share_one_batch():
+    delegate = FakeEmbedder()
+    coalescer = EmbeddingCoalescer(delegate, max_batch_size=10, max_wait_ms=50)
+    results = await asyncio.gather(
+        coalescer.embed_texts(["a", "bb"]),
+        coalescer.embed_texts(["ccc"]),
+        coalescer.embed_texts(["dddd", "e"]),
+    )
+    await coalescer.close()
+    assert [r.tolist() for r in results] == [[[1.0], [2.0]], [[3.0]], [[4.0], [1.0]]]
+    assert len(delegate.batches) == 1
+
+
+async def test_batches_are_capped_at_max_batch_size():
+    delegate = FakeEmbedder()
+    coalescer = EmbeddingCoalescer(delegate, max_batch_size=2, max_wait_ms=50)
+    result = await coalescer.embed_texts(["a", "bb", "ccc", "dddd", "eeeee"])
+    await coalescer.close()
+    assert result.tolist() == [[1.0], [2.0], [3.0], [4.0], [5.0]]
+    assert [len(b) for b in delegate.batches] == [2, 2, 1]
+
+
+async def test_errors_reach_every_caller():
+    coalescer = EmbeddingCoalescer(FakeEmbedder(fail=True), max_wait_ms=1)
+    with pytest.raises(RuntimeError):
+        await coalescer.embed_texts(["a"])
+    await coalescer.close()
+
+
+async def test_one_callers_bad_input_does_not_fail_the_others():
+    delegate = FakeEmbedder(reject="bad")
+    coalescer = EmbeddingCoalescer(delegate, max_batch_size=10, max_wait_ms=50)
+    good, bad = await asyncio.gather(
+        coalescer.embed_texts(["a", "bb"]),
+        coalescer.embed_texts(["bad"]),
+        return_exceptions=True,
+    )
+    await coalescer.close()
+    assert good.tolist() == [[1.0], [2.0]]
+    assert isinstance(bad, EmbeddingError)
+    assert delegate.batches == [["a", "bb", "bad"], ["a", "bb"], ["bad"]]
+
+
+async def test_queries_bypass_the_queue():
+    delegate = FakeEmbedder()
+    coalescer = EmbeddingCoalescer(delegate)
+    assert await coalescer.embed_query("q") == [0.0]
+    assert delegate.batches == []
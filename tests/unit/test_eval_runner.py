@@ -0,0 +1,103 @@
+"""Tests for the evaluation runner against a mocked API."""
+
+from __future__ import annotations
+
+import json
+import tempfile
+from pathlib import Path
+
+import httpx
+import pytest
+
+from rag_engine.evaluation.runner import load_checkpoint, run_evaluation
+
+
+def _case(case_id: str) -> dict:
+    return {
+        "id": case_id,
+        "query": f"question {case_id}",
+        "mode": "normal",
+        "expected_decision": "answer",
+        "acceptable_decisions": ["answer"],
+        "expected_answer_contains": ["retriev"],
+        "category": "factual",
+    }
+
+
+class FakeServer:
+    """Mock transport handler that answers /health and /query."""
+
+    def __init__(self, fail_queries: set[str] | None = None) -> None:
+        self.queries: list[str] = []
+        self._fail_queries = fail_queries or set()
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        if request.url.path == "/health":
+            return httpx.Response(200, json={"doc_count": 1, "chunk_count": 2})
+        query = json.loads(request.content)["query"]
+        self.queries.append(query)
+        if query in self._fail_queries:
+            return httpx.Response(500)
+        return httpx.Response(
+            200,
+            json={
+                "answer": "Retrieval finds documents.",
+                "decision": "answer",
+                "confidence": 0.9,
+                "reasons": [],
+                "debug": {"retrieval_quality": 0.8, "latency_ms": 12.0},
+            },
+        )
+
+
+@pytest.fixture
+def dataset_path():
+    path = Path(tempfile.mkdtemp()) / "dataset.json"
+    path.write_text(json.dumps([_case("a"), _case("b"), _case("c")]))
+    return path
+
+
+def _client(server: FakeServer) -> httpx.AsyncClient:
+    return httpx.AsyncClient(base_url="http://test", transport=httpx.MockTransport(server))
+
+
+async def test_run_evaluation_with_injected_client(dataset_path):
+    server = FakeServer()
+    async with _client(server) as client:
+        results = await run_evaluation(dataset_path=dataset_path, client=client)
+    assert [r.case_id for r in results] == ["a", "b", "c"]
+    assert all(r.decision_correct for r in results)
+    assert results[0].keywords_found == ["retriev"]
+
+
+async def test_checkpoint_records_successes_only(dataset_path):
+    checkpoint = Path(tempfile.mkdtemp()) / "results.jsonl"
+    server = FakeServer(fail_queries={"question b"})
+    async with _client(server) as client:
+        results = await run_evaluation(
+            dataset_path=dataset_path, client=client, checkpoint_path=checkpoint
+        )
+    assert results[1].error is not None
+    assert set(load_checkpoint(checkpoint)) == {"a", "c"}
+
+
+async def test_checkpoint_resume_skips_completed(dataset_path):
+    checkpoint = Path(tempfile.mkdtemp()) / "results.jsonl"
+    async with _client(FakeServer(fail_queries={"question b"})) as client:
+        await run_evaluation(dataset_path=dataset_path, client=client, checkpoint_path=checkpoint)
+
+    server = FakeServer()
+    async with _client(server) as client:
+        results = await run_evaluation(
+            dataset_path=dataset_path, client=client, checkpoint_path=checkpoint
+        )
+    assert server.queries == ["question b"]
+    assert [r.case_id for r in results] == ["a", "b", "c"]
+    assert all(r.error is None for r in results)
+
+
+def test_load_checkpoint_skips_torn_lines():
+    checkpoint = Path(tempfile.mkdtemp()) / "results.jsonl"
+    checkpoint.write_text('{"case_id": "a"\n')
+    assert load_checkpoint(checkpoint) == {}
+    assert load_checkpoint(checkpoint.with_name("missing.jsonl")) == {}
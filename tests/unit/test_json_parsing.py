@@ -0,0 +1,33 @@
+"""Tests for lenient LLM JSON parsing."""
+
+import json
+
+import pytest
+
+from rag_engine.generation.json_parsing import parse_llm_json
+
+
+def test_plain_json():
+    assert parse_llm_json('{"score": 0.9}') == {"score": 0.9}
+
+
+def test_json_fence():
+    assert parse_llm_json('```json\n{"rewrites": ["a", "b"]}\n```') == {"rewrites": ["a", "b"]}
+
+
+def test_bare_fence():
+    assert parse_llm_json("```\n[1, 2]\n```\n") == [1, 2]
+
+
+def test_fence_inside_prose():
+    text = 'Here is the result:\n```json\n{"score": 0.5}\n```\nHope this helps.'
+    assert parse_llm_json(text) == {"score": 0.5}
+
+
+def test_backticks_inside_payload_preserved():
+    assert parse_llm_json('{"code": "```"}') == {"code": "```"}
+
+
+def test_invalid_raises():
+    with pytest.raises(json.JSONDecodeError):
+        parse_llm_json("not json at all")
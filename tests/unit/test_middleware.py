@@ -0,0 +1,51 @@
+"""Tests for the request timing middleware."""
+
+from __future__ import annotations
+
+import pytest
+from fastapi import FastAPI
+from fastapi.responses import StreamingResponse
+from fastapi.testclient import TestClient
+
+from rag_engine.api.middleware import RequestTimingMiddleware
+
+
+@pytest.fixture
+def client() -> TestClient:
+    app = FastAPI()
+    app.add_middleware(RequestTimingMiddleware)
+
+    @app.get("/ping")
+    async def ping() -> dict:
+        return {"ok": True}
+
+    @app.get("/stream")
+    async def stream() -> StreamingResponse:
+        async def body():
+            yield b"a"
+            yield b"b"
+
+        return StreamingResponse(body())
+
+    @app.get("/boom")
+    async def boom() -> dict:
+        raise RuntimeError("boom")
+
+    return TestClient(app, raise_server_exceptions=False)
+
+
+def test_adds_request_headers(client):
+    response = client.get("/ping")
+    assert response.json() == {"ok": True}
+    assert len(response.headers["X-Request-ID"]) == 16
+    assert float(response.headers["X-Duration-MS"]) >= 0
+
+
+def test_streaming_response_passes_through(client):
+    response = client.get("/stream")
+    assert response.content == b"ab"
+    assert "X-Request-ID" in response.headers
+
+
+def test_unhandled_error_returns_500(client):
+    assert client.get("/boom").status_code == 500
@@ -0,0 +1,75 @@
+"""Tests for file parsers."""
+
+from pathlib import Path
+
+import pytest
+
+from rag_engine.ingestion import parser_markdown
+from rag_engine.ingestion.parser_html import HTMLParser
+from rag_engine.ingestion.parser_markdown import MarkdownParser
+from rag_engine.ingestion.parser_text import TextParser
+
+FIXTURES = Path(__file__).parent.parent / "fixtures"
+
+
+@pytest.mark.parametrize(
+    "parser, filename",
+    [
+        (MarkdownParser(), "sample.md"),
+        (HTMLParser(), "sample.html"),
+        (TextParser(), "sample.txt"),
+    ],
+)
+def test_parse_bytes_matches_parse(parser, filename):
+    path = FIXTURES / filename
+    from_file = parser.parse(path, {"source": filename})
+    from_bytes = parser.parse_bytes(path.read_bytes(), {"source": filename})
+    assert from_bytes == from_file
+
+
+def test_markdown_extracts_title():
+    text, metadata = MarkdownParser().parse_bytes(b"# My Title\nBody text.", {})
+    assert metadata["title"] == "My Title"
+    assert "Body text." in text
+
+
+def test_markdown_strips_front_matter():
+    content = b"---\ntitle: ignored\n---\n# Heading\nBody."
+    text, _ = MarkdownParser().parse_bytes(content, {})
+    assert text.startswith("# Heading")
+
+
+def test_markdown_mapped_file_matches_bytes(monkeypatch, tmp_path):
+    monkeypatch.setattr(parser_markdown, "MMAP_MIN_BYTES", 0)
+    content = "---\ntitle: ignored\n---\n# Café\nBody.".encode()
+    path = tmp_path / "doc.md"
+    path.write_bytes(content)
+    parser = MarkdownParser()
+    assert parser.parse(path, {}) == parser.parse_bytes(content, {})
+
+
+@pytest.mark.parametrize("parser", [MarkdownParser(), HTMLParser()])
+def test_crlf_files_parse_like_read_text(parser, tmp_path):
+    filename = "sample.md" if isinstance(parser, MarkdownParser) else "sample.html"
+    lf = (FIXTURES / filename).read_text(encoding="utf-8").replace("\r\n", "\n")
+    path = tmp_path / filename
+    path.write_bytes(lf.replace("\n", "\r\n").encode())
+    text, metadata = parser.parse(path, {})
+    assert "\r" not in text
+    assert (text, metadata) == parser.parse_bytes(lf.encode(), {})
+
+
+def test_html_extracts_title_and_headings():
+    text, metadata = HTMLParser().parse_bytes((FIXTURES / "sample.html").read_bytes(), {})
+    assert metadata["title"] == "Sample HTML Document"
+    assert "## Section One" in text
+
+
+def test_text_decodes_utf8_directly_and_detects_other_encodings():
+    text, metadata = TextParser().parse_bytes("naïve café".encode(), {})
+    assert (text, metadata["encoding"]) == ("naïve café", "utf-8")
+
+    legacy = "Das Wetter ist schön, die Straße ist ruhig. " * 20
+    text, metadata = TextParser().parse_bytes(legacy.encode("latin-1"), {})
+    assert metadata["encoding"] != "utf-8"
+    assert "Das Wetter ist" in text
@@ -3,6 +3,7 @@
 from uuid import uuid4
 
 from rag_engine.chunking.quality import (
+    _alpha_count,
     compute_coverage,
     detect_near_duplicates,
     filter_garbage_chunks,
@@ -34,6 +35,11 @@ def test_filter_garbage_non_alpha():
     assert len(filtered) == 1
 
 
+def test_alpha_count_matches_isalpha():
+    for text in ["abc 123 !?", "", "Ünïcödé text ß 42", "日本語のテキスト 1"]:
+        assert _alpha_count(text) == sum(c.isalpha() for c in text)
+
+
 def test_filter_garbage_repetitive():
     chunks = [
         _make_chunk("word word word word word word word word word word"),
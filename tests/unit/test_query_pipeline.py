@@ -0,0 +1,95 @@
+"""Tests for the reranking fast path in QueryPipeline."""
+
+from __future__ import annotations
+
+import pytest
+
+from rag_engine.models.domain import RetrievalCandidate
+from rag_engine.observability.tracing import TraceContext
+from rag_engine.pipeline.query_pipeline import QueryPipeline
+from rag_engine.scoring.reason_codes import ReasonCode
+from rag_engine.scoring.retrieval_quality import RetrievalQualityScorer
+
+
+class FakeReranker:
+    """Counts calls and returns the first top_n candidates with a fixed score."""
+
+    def __init__(self) -> None:
+        self.calls = 0
+
+    async def rerank(self, query, candidates, top_n=10):
+        self.calls += 1
+        return [RetrievalCandidate(c.chunk, 0.9, "reranked") for c in candidates[:top_n]]
+
+
+def _pipeline(settings, reranker: FakeReranker) -> QueryPipeline:
+    return QueryPipeline(
+        query_understanding=None,
+        decomposer=None,
+        hybrid_retriever=None,
+        reranker=reranker,
+        rq_scorer=RetrievalQualityScorer(settings),
+        fallback_manager=None,
+        answer_generator=None,
+        groundedness_checker=None,
+        contradiction_detector=None,
+        self_consistency_checker=None,
+        verification_decider=None,
+        confidence_scorer=None,
+        trace_store=None,
+        settings=settings,
+    )
+
+
+@pytest.fixture
+def fused(settings, sample_chunks):
+    """RRF-fused candidates in retrieval order, not sorted by score."""
+    rrf_max = 2.0 / (settings.rrf_k + 1)
+    scores = [0.2, 1.0, 0.5, 0.9, 0.1, 0.7, 0.3, 0.8, 0.6, 0.4]
+    return [
+        RetrievalCandidate(chunk, score * rrf_max, "hybrid")
+        for chunk, score in zip(sample_chunks, scores)
+    ]
+
+
+def _fast_rq(settings, candidates) -> float:
+    scorer = RetrievalQualityScorer(settings)
+    return scorer.score(scorer.rescale_rrf(candidates)[: settings.rerank_top_n])[0]
+
+
+@pytest.mark.parametrize("band", ["above_skip", "below_fallback"])
+async def test_clear_cut_retrieval_skips_reranking(settings, fused, band):
+    settings.rerank_top_n = 3
+    fast_rq = _fast_rq(settings, fused)
+    if band == "above_skip":
+        settings.rq_skip_rerank_threshold = fast_rq - 0.01
+    else:
+        settings.rq_skip_rerank_threshold = 1.0
+        settings.rq_fallback_threshold = fast_rq + 0.01
+    reranker = FakeReranker()
+
+    ranked, rq, reasons = await _pipeline(settings, reranker)._rerank_and_score(
+        "q", fused, TraceContext()
+    )
+
+    assert reranker.calls == 0
+    assert rq == pytest.approx(fast_rq)
+    assert ReasonCode.RERANK_SKIPPED_FAST_PATH in reasons
+    # The first-stage top_n, best first, with RRF scores rescaled to [0, 1]
+    assert [c.chunk.chunk_id for c in ranked] == [fused[i].chunk.chunk_id for i in (1, 3, 7)]
+    assert [c.score for c in ranked] == pytest.approx([1.0, 0.9, 0.8])
+
+
+async def test_middle_band_is_reranked(settings, fused):
+    settings.rerank_top_n = 3
+    settings.rq_skip_rerank_threshold = 1.0
+    settings.rq_fallback_threshold = 0.0
+    reranker = FakeReranker()
+
+    ranked, _, reasons = await _pipeline(settings, reranker)._rerank_and_score(
+        "q", fused, TraceContext()
+    )
+
+    assert reranker.calls == 1
+    assert [c.source_method for c in ranked] == ["reranked"] * 3
+    assert ReasonCode.RERANK_SKIPPED_FAST_PATH not in reasons
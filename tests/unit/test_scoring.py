@@ -1,6 +1,9 @@
 """Tests for retrieval quality and confidence scoring."""
 
+import pytest
+
 from rag_engine.config.settings import Settings
+from rag_engine.models.domain import RetrievalCandidate
 from rag_engine.scoring.confidence import ConfidenceScorer
 from rag_engine.scoring.retrieval_quality import RetrievalQualityScorer
 
@@ -27,6 +30,20 @@ def test_rq_scorer_single_candidate(sample_candidates):
     assert 0.0 <= score <= 1.0
 
 
+def test_rq_scorer_rescales_rrf_scores(sample_candidates):
+    settings = Settings(openai_api_key="x", google_api_key="x")
+    scorer = RetrievalQualityScorer(settings)
+    rrf_max = 2.0 / (settings.rrf_k + 1)
+    # Out of order, as after merging sub-question results
+    fused = [
+        RetrievalCandidate(chunk=c.chunk, score=c.score * rrf_max, source_method="hybrid")
+        for c in reversed(sample_candidates)
+    ]
+    rescaled = scorer.rescale_rrf(fused)
+    assert [c.chunk.chunk_id for c in rescaled] == [c.chunk.chunk_id for c in sample_candidates]
+    assert [c.score for c in rescaled] == pytest.approx([c.score for c in sample_candidates])
+
+
 def test_confidence_scorer():
     settings = Settings(openai_api_key="x", google_api_key="x")
     scorer = ConfidenceScorer(settings)
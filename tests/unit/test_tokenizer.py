@@ -35,3 +35,8 @@ def test_tokenize_empty():
 def test_tokenize_all_stopwords():
     tokens = tokenize("the a an is are")
     assert tokens == []
+
+
+def test_tokenize_ascii_and_unicode_paths_agree():
+    assert tokenize("Multi-hop RAG_eval, v2!") == ["multi", "hop", "rag_eval", "v2"]
+    assert tokenize("Café résumé, naïve—façade!") == ["café", "résumé", "naïve", "façade"]